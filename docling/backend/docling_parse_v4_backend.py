@@ -15,6 +15,7 @@ from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
 from docling.datamodel.backend_options import PdfBackendOptions
 from docling.datamodel.base_models import Size
 from docling.utils.locks import pypdfium2_lock
+from docling.utils.pdfium_render_pool import PdfiumPageRenderer
 
 if TYPE_CHECKING:
     from docling.datamodel.document import InputDocument
@@ -34,8 +35,10 @@ class DoclingParseV4PageBackend(PdfPageBackend):
         keep_chars: bool = False,
         keep_lines: bool = False,
         keep_images: bool = True,
+        renderer: Optional[PdfiumPageRenderer] = None,
     ):
         self._ppage = page_obj
+        self._renderer = renderer
         self._dp_doc = dp_doc
         self._page_no = page_no
 
@@ -154,6 +157,15 @@ class DoclingParseV4PageBackend(PdfPageBackend):
             padbox.r = page_size.width - padbox.r
             padbox.t = page_size.height - padbox.t
 
+        if self._renderer is not None:
+            # Rasterize in a worker process which owns its own pdfium instance.
+            return self._renderer.render(
+                self._page_no,
+                scale=scale * 1.5,
+                crop=padbox.as_tuple(),
+                size=(round(cropbox.width * scale), round(cropbox.height * scale)),
+            )
+
         with pypdfium2_lock:
             image = (
                 self._ppage.render(
@@ -187,6 +199,7 @@ class DoclingParseV4PageBackend(PdfPageBackend):
         self._ppage = None
         self._dpage = None
         self._dp_doc = None
+        self._renderer = None
 
 
 class DoclingParseV4DocumentBackend(PdfDocumentBackend):
@@ -213,6 +226,7 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
             raise RuntimeError(
                 f"docling-parse v4 could not load document {self.document_hash}."
             )
+        self._init_page_renderer(password)
 
     def page_count(self) -> int:
         # return len(self._pdoc)  # To be replaced with docling-parse API
@@ -237,6 +251,7 @@ class DoclingParseV4DocumentBackend(PdfDocumentBackend):
             page_no=page_no,
             create_words=create_words,
             create_textlines=create_textlines,
+            renderer=self._page_renderer,
         )
 
     def is_valid(self) -> bool:
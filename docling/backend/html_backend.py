@@ -2,7 +2,9 @@ import base64
 import logging
 import os
 import re
+import threading
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from copy import deepcopy
 from io import BytesIO
@@ -39,7 +41,10 @@ from docling.backend.abstract_backend import (
 from docling.datamodel.backend_options import HTMLBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import settings
 from docling.exceptions import OperationNotAllowed
+from docling.utils.api_client import ApiClient
+from docling.utils.cache import MemoryContentStore
 
 _log = logging.getLogger(__name__)
 
@@ -106,6 +111,38 @@ _PARA_BREAKERS = {
 
 _CODE_TAG_SET: Final = {"code", "kbd", "samp"}
 
+# Typical Unicode characters in HTML and their replacement for text processing
+_UNICODE_REPLACEMENTS: Final = str.maketrans(
+    {
+        "\u00a0": " ",  # non-breaking space
+        "\u200b": "",  # zero-width space
+        "\u200c": "",  # zero-width non-joiner
+        "\u200d": "",  # zero-width joiner
+        "\u2010": "-",  # hyphen
+        "\u2011": "-",  # non-breaking hyphen
+        "\u2012": "-",  # dash
+        "\u2013": "-",  # dash
+        "\u2014": "-",  # dash
+        "\u2015": "-",  # horizontal bar
+        "\u2018": "'",  # left single quotation mark
+        "\u2019": "'",  # right single quotation mark
+        "\u201c": '"',  # left double quotation mark
+        "\u201d": '"',  # right double quotation mark
+        "\u2026": "...",  # ellipsis
+        "\u00ad": "",  # soft hyphen
+        "\ufeff": "",  # zero width non-break space
+        "\u202f": " ",  # narrow non-break space
+        "\u2060": "",  # word joiner
+    }
+)
+
+_HEADING_TAGS: Final = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+# Tags removed before the conversion, with their content
+_REMOVED_TAGS: Final = {"script", "noscript", "style"}
+
+_NUMBER_PATTERN: Final = re.compile(r"\d+")
+
 _FORMAT_TAG_MAP: Final = {
     "b": {"bold": True},
     "strong": {"bold": True},
@@ -124,6 +161,40 @@ _FORMAT_TAG_MAP: Final = {
 }
 
 
+_DATA_URI_PREFIX: Final = re.compile(r"^data:image/.+;base64,")
+
+# Images fetched from remote URLs, shared across documents
+_image_store: Optional[MemoryContentStore] = None
+_image_store_lock = threading.Lock()
+
+
+def _get_image_store() -> Optional[MemoryContentStore]:
+    global _image_store
+    if settings.perf.image_cache_max_bytes <= 0:
+        return None
+    with _image_store_lock:
+        if _image_store is None:
+            _image_store = MemoryContentStore(settings.perf.image_cache_max_bytes)
+        return _image_store
+
+
+# Clients fetching remote images, one per number of image fetch workers. They
+# serve all image hosts, keeping connection pools for the most recent ones.
+_IMAGE_FETCH_MAX_HOSTS: Final = 16
+_image_clients: dict[int, ApiClient] = {}
+
+
+def _get_image_client(max_connections: int) -> ApiClient:
+    with _image_store_lock:
+        client = _image_clients.get(max_connections)
+        if client is None:
+            client = ApiClient(
+                max_connections=max_connections, max_hosts=_IMAGE_FETCH_MAX_HOSTS
+            )
+            _image_clients[max_connections] = client
+        return client
+
+
 class _Context(BaseModel):
     list_ordered_flag_by_ref: dict[str, bool] = {}
     list_start_by_ref: dict[str, int] = {}
@@ -250,6 +321,10 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             self.parents[i] = None
         self.hyperlink: Union[AnyUrl, Path, None] = None
         self.format_tags: list[str] = []
+        # Ids of the tags with block tags among their descendants
+        self._block_containers: Optional[set[int]] = None
+        # Images being loaded, by source location
+        self._image_refs: dict[str, Future[Optional[ImageRef]]] = {}
 
         try:
             raw = (
@@ -257,7 +332,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                 if isinstance(path_or_stream, BytesIO)
                 else Path(path_or_stream).read_bytes()
             )
-            self.soup = BeautifulSoup(raw, "html.parser")
+            self.soup = BeautifulSoup(raw, self.options.parser)
         except Exception as e:
             raise RuntimeError(
                 "Could not initialize HTML backend for file with "
@@ -308,30 +383,36 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                 orig=title_text,
                 content_layer=ContentLayer.FURNITURE,
             )
-        # remove script and style tags
-        for tag in self.soup(["script", "noscript", "style"]):
-            tag.decompose()
-        # remove any hidden tag
-        for tag in self.soup(hidden=True):
-            tag.decompose()
+        # remove script and style tags, and any hidden tag
+        removed_tags = [
+            tag
+            for tag in self.soup.descendants
+            if isinstance(tag, Tag)
+            and (tag.name in _REMOVED_TAGS or "hidden" in tag.attrs)
+        ]
+        for tag in removed_tags:
+            if not tag.decomposed:
+                tag.decompose()
         # fix flow content that is not permitted inside <p>
         HTMLDocumentBackend._fix_invalid_paragraph_structure(self.soup)
 
         content = self.soup.body or self.soup
-        # normalize <br> tags
-        for br in content("br"):
+        # normalize <br> tags, and find the headers
+        brs: list[Tag] = []
+        all_headers: list[Tag] = []
+        for node in content.descendants:
+            if isinstance(node, Tag):
+                if node.name == "br":
+                    brs.append(node)
+                elif node.name in _HEADING_TAGS:
+                    all_headers.append(node)
+        for br in brs:
             br.replace_with(NavigableString("\n"))
         # set default content layer
 
         # Furniture before the first heading rule, except for headers in tables
-        header = None
-        # Find all headers first
-        all_headers = content.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-        # Keep only those that do NOT have a <table> in a parent chain
-        clean_headers = [h for h in all_headers if not h.find_parent("table")]
-        # Pick the first header from the remaining
-        if len(clean_headers):
-            header = clean_headers[0]
+        # Pick the first header that does NOT have a <table> in a parent chain
+        header = next((h for h in all_headers if not h.find_parent("table")), None)
         # Set starting content layer
         self.content_layer = (
             ContentLayer.BODY
@@ -340,9 +421,75 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         )
         # reset context
         self.ctx = _Context()
-        self._walk(content, doc)
+        self._block_containers = HTMLDocumentBackend._find_block_containers(content)
+        try:
+            with self._prefetch_images(content):
+                self._walk(content, doc)
+        finally:
+            self._block_containers = None
         return doc
 
+    @contextmanager
+    def _prefetch_images(self, content: Tag):
+        """Load the images of the document concurrently while walking it.
+
+        The image sources are collected before the walk, and each distinct
+        source is fetched and decoded once in a thread pool. While the context
+        manager is active, the walk attaches the loaded images.
+
+        Args:
+            content: The HTML content to be walked.
+        """
+        if not self.options.fetch_images:
+            yield
+            return
+        sources = dict.fromkeys(
+            self._resolve_relative_path(src)
+            for img_tag in HTMLDocumentBackend._descendant_tags(content, {"img"})
+            if (src := self._get_attr_as_string(img_tag, "src"))
+        )
+        if not sources:
+            yield
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(sources), self.options.image_fetch_workers)),
+            thread_name_prefix="html_images",
+        ) as pool:
+            self._image_refs = {
+                src: pool.submit(self._load_image_ref, src) for src in sources
+            }
+            try:
+                yield
+            finally:
+                for future in self._image_refs.values():
+                    future.cancel()
+                self._image_refs = {}
+
+    @staticmethod
+    def _find_block_containers(root: Tag) -> set[int]:
+        """Find the tags containing block tags in a single pass over the tree.
+
+        Args:
+            root: The root of the tree.
+
+        Returns:
+            The ids of the tags with a block tag among their descendants.
+        """
+        containers: set[int] = set()
+        for tag in root.descendants:
+            if isinstance(tag, Tag) and tag.name in _BLOCK_TAGS:
+                parent = tag.parent
+                while parent is not None and id(parent) not in containers:
+                    containers.add(id(parent))
+                    parent = parent.parent
+        return containers
+
+    def _has_block_descendant(self, tag: Tag) -> bool:
+        if self._block_containers is not None:
+            return id(tag) in self._block_containers
+        return tag.find(_BLOCK_TAGS) is not None
+
     @staticmethod
     def _fix_invalid_paragraph_structure(soup: BeautifulSoup) -> None:
         """Rewrite <p> elements that contain block-level breakers.
@@ -371,7 +518,14 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                     new_nodes.remove(current_p)
             current_p = None
 
-        paragraphs = soup.select(f"p:has({','.join(tag for tag in _PARA_BREAKERS)})")
+        paragraphs = [
+            p
+            for p in HTMLDocumentBackend._descendant_tags(soup, {"p"})
+            if any(
+                isinstance(node, Tag) and node.name in _PARA_BREAKERS
+                for node in p.descendants
+            )
+        ]
 
         for p in paragraphs:
             parent = p.parent
@@ -496,7 +650,8 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         """
         is_rich: bool = True
 
-        children = table_cell.find_all(recursive=True)  # all descendants of type Tag
+        # all descendants of type Tag
+        children = [item for item in table_cell.descendants if isinstance(item, Tag)]
         if not children:
             content = [
                 item
@@ -524,7 +679,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         num_rows: int,
         num_cols: int,
     ) -> Optional[TableData]:
-        for t in cast(list[Tag], element.find_all(["thead", "tbody"], recursive=False)):
+        for t in HTMLDocumentBackend._child_tags(element, {"thead", "tbody"}):
             t.unwrap()
 
         _log.debug(f"The table has {num_rows} rows and {num_cols} cols.")
@@ -535,24 +690,30 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         start_row_span = 0
         row_idx = -1
 
+        # extract inline formulas
+        for formula in HTMLDocumentBackend._descendant_tags(
+            element, {"inline-formula"}
+        ):
+            math_parts = formula.text.split("$$")
+            if len(math_parts) == 3:
+                math_formula = f"$${math_parts[1]}$$"
+                formula.replace_with(NavigableString(math_formula))
+
         # We don't want this recursive to support nested tables
-        for row in element("tr", recursive=False):
-            if not isinstance(row, Tag):
-                continue
+        for row in HTMLDocumentBackend._child_tags(element, {"tr"}):
             # For each row, find all the column cells (both <td> and <th>)
             # We don't want this recursive to support nested tables
-            cells = row(["td", "th"], recursive=False)
+            cells = HTMLDocumentBackend._child_tags(row, {"td", "th"})
             # Check if cell is in a column header or row header
             col_header = True
             row_header = True
             for html_cell in cells:
-                if isinstance(html_cell, Tag):
-                    _, row_span = HTMLDocumentBackend._get_cell_spans(html_cell)
-                    if html_cell.name == "td":
-                        col_header = False
-                        row_header = False
-                    elif row_span == 1:
-                        row_header = False
+                _, row_span = HTMLDocumentBackend._get_cell_spans(html_cell)
+                if html_cell.name == "td":
+                    col_header = False
+                    row_header = False
+                elif row_span == 1:
+                    row_header = False
             if not row_header:
                 row_idx += 1
                 start_row_span = 0
@@ -562,16 +723,6 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             # Extract the text content of each cell
             col_idx = 0
             for html_cell in cells:
-                if not isinstance(html_cell, Tag):
-                    continue
-
-                # extract inline formulas
-                for formula in html_cell("inline-formula"):
-                    math_parts = formula.text.split("$$")
-                    if len(math_parts) == 3:
-                        math_formula = f"$${math_parts[1]}$$"
-                        formula.replace_with(NavigableString(math_formula))
-
                 provs_in_cell: list[RefItem] = []
                 rich_table_cell = self._is_rich_table_cell(html_cell)
                 if rich_table_cell:
@@ -703,7 +854,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                     _flush_buffer()
                     blk = self._handle_block(node, doc)
                     added_refs.extend(blk)
-                elif node.find(_BLOCK_TAGS):
+                elif self._has_block_descendant(node):
                     _flush_buffer()
                     wk3 = self._walk(node, doc)
                     added_refs.extend(wk3)
@@ -730,15 +881,12 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
     @staticmethod
     def _collect_parent_format_tags(item: PageElement) -> list[str]:
-        tags = []
-        for format_tag in _FORMAT_TAG_MAP:
-            this_parent = item.parent
-            while this_parent is not None:
-                if this_parent.name == format_tag:
-                    tags.append(format_tag)
-                    break
-                this_parent = this_parent.parent
-        return tags
+        parent_names = set()
+        this_parent = item.parent
+        while this_parent is not None:
+            parent_names.add(this_parent.name)
+            this_parent = this_parent.parent
+        return [tag for tag in _FORMAT_TAG_MAP if tag in parent_names]
 
     @property
     def _formatting(self):
@@ -1018,7 +1166,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             if p2 is not None:
                 added_ref = [p2.get_ref()]
         self.level += 1
-        for img_tag in tag("img"):
+        for img_tag in HTMLDocumentBackend._descendant_tags(tag, {"img"}):
             if isinstance(img_tag, Tag):
                 im_ref = self._emit_image(img_tag, doc)
                 if im_ref:
@@ -1050,10 +1198,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         self.level += 1
 
         # For each top-level <li> in this list
-        for li in tag.find_all({"li", "ul", "ol"}, recursive=False):
-            if not isinstance(li, Tag):
-                continue
-
+        for li in HTMLDocumentBackend._child_tags(tag, {"li", "ul", "ol"}):
             # sub-list items should be indented under main list items, but temporarily
             # addressing invalid HTML (docling-core/issues/357)
             if li.name in {"ul", "ol"}:
@@ -1112,9 +1257,10 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                                     )
 
                         # 4) recurse into any nested lists, attaching them to this <li> item
-                        for sublist in li({"ul", "ol"}, recursive=False):
-                            if isinstance(sublist, Tag):
-                                self._handle_block(sublist, doc)
+                        for sublist in HTMLDocumentBackend._child_tags(
+                            li, {"ul", "ol"}
+                        ):
+                            self._handle_block(sublist, doc)
 
                         # now the list element with inline group is not a parent anymore
                         self.parents[self.level] = None
@@ -1135,19 +1281,19 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                         )
 
                         # 4) recurse into any nested lists, attaching them to this <li> item
-                        for sublist in li({"ul", "ol"}, recursive=False):
-                            if isinstance(sublist, Tag):
-                                self.level += 1
-                                self._handle_block(sublist, doc)
-                                self.parents[self.level + 1] = None
-                                self.level -= 1
-                else:
-                    for sublist in li({"ul", "ol"}, recursive=False):
-                        if isinstance(sublist, Tag):
+                        for sublist in HTMLDocumentBackend._child_tags(
+                            li, {"ul", "ol"}
+                        ):
+                            self.level += 1
                             self._handle_block(sublist, doc)
+                            self.parents[self.level + 1] = None
+                            self.level -= 1
+                else:
+                    for sublist in HTMLDocumentBackend._child_tags(li, {"ul", "ol"}):
+                        self._handle_block(sublist, doc)
 
                 # 5) extract any images under this <li>
-                for img_tag in li("img"):
+                for img_tag in HTMLDocumentBackend._descendant_tags(li, {"img"}):
                     if isinstance(img_tag, Tag):
                         self._emit_image(img_tag, doc)
 
@@ -1157,20 +1303,15 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
     @staticmethod
     def get_html_table_row_col(tag: Tag) -> tuple[int, int]:
-        for t in cast(list[Tag], tag.find_all(["thead", "tbody"], recursive=False)):
+        for t in HTMLDocumentBackend._child_tags(tag, {"thead", "tbody"}):
             t.unwrap()
         # Find the number of rows and columns (taking into account spans)
         num_rows: int = 0
         num_cols: int = 0
-        for row in tag("tr", recursive=False):
+        for row in HTMLDocumentBackend._child_tags(tag, {"tr"}):
             col_count = 0
             is_row_header = True
-            if not isinstance(row, Tag):
-                continue
-            for cell in row(["td", "th"], recursive=False):
-                if not isinstance(row, Tag):
-                    continue
-                cell_tag = cast(Tag, cell)
+            for cell_tag in HTMLDocumentBackend._child_tags(row, {"td", "th"}):
                 col_span, row_span = HTMLDocumentBackend._get_cell_spans(cell_tag)
                 col_count += col_span
                 if cell_tag.name == "td" or row_span == 1:
@@ -1229,7 +1370,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                                 )
                                 added_refs.append(docling_text.get_ref())
 
-            for img_tag in tag("img"):
+            for img_tag in HTMLDocumentBackend._descendant_tags(tag, {"img"}):
                 if isinstance(img_tag, Tag):
                     self._emit_image(img_tag, doc)
 
@@ -1244,7 +1385,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             added_refs.append(docling_table.get_ref())
             self.parse_table_data(tag, doc, docling_table, num_rows, num_cols)
 
-            for img_tag in tag("img"):
+            for img_tag in HTMLDocumentBackend._descendant_tags(tag, {"img"}):
                 if isinstance(img_tag, Tag):
                     im_ref2 = self._emit_image(tag, doc)
                     if im_ref2 is not None:
@@ -1346,12 +1487,14 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
     def _create_image_ref(self, src_url: str) -> Optional[ImageRef]:
         try:
-            img_data = self._load_image_data(src_url)
-            if img_data:
-                img = Image.open(BytesIO(img_data))
-                return ImageRef.from_pil(img, dpi=int(img.info.get("dpi", (72,))[0]))
+            future = self._image_refs.get(src_url)
+            if future is None:
+                return self._load_image_ref(src_url)
+            img_ref = future.result()
+            # Images with the same source get their own reference
+            return img_ref.model_copy() if img_ref is not None else None
         except (
-            requests.HTTPError,
+            requests.RequestException,
             ValidationError,
             UnidentifiedImageError,
             OperationNotAllowed,
@@ -1362,6 +1505,13 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
         return None
 
+    def _load_image_ref(self, src_url: str) -> Optional[ImageRef]:
+        img_data = self._load_image_data(src_url)
+        if img_data:
+            img = Image.open(BytesIO(img_data))
+            return ImageRef.from_pil(img, dpi=int(img.info.get("dpi", (72,))[0]))
+        return None
+
     def _load_image_data(self, src_loc: str) -> Optional[bytes]:
         if src_loc.lower().endswith(".svg"):
             _log.debug(f"Skipping SVG file: {src_loc}")
@@ -1373,11 +1523,20 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                     "Fetching remote resources is only allowed when set explicitly. "
                     "Set options.enable_remote_fetch=True."
                 )
-            response = requests.get(src_loc, stream=True)
-            response.raise_for_status()
-            return response.content
+            store = _get_image_store()
+            content = store.lookup(src_loc) if store is not None else None
+            if content is None:
+                client = _get_image_client(self.options.image_fetch_workers)
+                response = client.get(
+                    src_loc, stream=True, timeout=self.options.image_fetch_timeout
+                )
+                response.raise_for_status()
+                content = response.content
+                if store is not None and isinstance(content, bytes):
+                    store.store(src_loc, content)
+            return content
         elif src_loc.startswith("data:"):
-            data = re.sub(r"^data:image/.+;base64,", "", src_loc)
+            data = _DATA_URI_PREFIX.sub("", src_loc)
             return base64.b64decode(data)
 
         if src_loc.startswith("file://"):
@@ -1439,31 +1598,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         Returns:
             The sanitized text without typical Unicode characters.
         """
-        replacements = {
-            "\u00a0": " ",  # non-breaking space
-            "\u200b": "",  # zero-width space
-            "\u200c": "",  # zero-width non-joiner
-            "\u200d": "",  # zero-width joiner
-            "\u2010": "-",  # hyphen
-            "\u2011": "-",  # non-breaking hyphen
-            "\u2012": "-",  # dash
-            "\u2013": "-",  # dash
-            "\u2014": "-",  # dash
-            "\u2015": "-",  # horizontal bar
-            "\u2018": "'",  # left single quotation mark
-            "\u2019": "'",  # right single quotation mark
-            "\u201c": '"',  # left double quotation mark
-            "\u201d": '"',  # right double quotation mark
-            "\u2026": "...",  # ellipsis
-            "\u00ad": "",  # soft hyphen
-            "\ufeff": "",  # zero width non-break space
-            "\u202f": " ",  # narrow non-break space
-            "\u2060": "",  # word joiner
-        }
-        for raw, clean in replacements.items():
-            text = text.replace(raw, clean)
-
-        return text
+        return text.translate(_UNICODE_REPLACEMENTS)
 
     @staticmethod
     def _get_cell_spans(cell: Tag) -> tuple[int, int]:
@@ -1473,14 +1608,17 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         table cell tag.
         If the attribute does not exist or it is not numeric, it defaults to 1.
         """
+        attrs = cell.attrs
+        if "colspan" not in attrs and "rowspan" not in attrs:
+            return 1, 1
         raw_spans: tuple[str, str] = (
-            str(cell.get("colspan", "1")),
-            str(cell.get("rowspan", "1")),
+            str(attrs.get("colspan", "1")),
+            str(attrs.get("rowspan", "1")),
         )
 
         def _extract_num(s: str) -> int:
             if s and s[0].isnumeric():
-                match = re.search(r"\d+", s)
+                match = _NUMBER_PATTERN.search(s)
                 if match:
                     return int(match.group())
             return 1
@@ -1492,6 +1630,32 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
         return int_spans
 
+    @staticmethod
+    def _child_tags(tag: Tag, names: set[str]) -> list[Tag]:
+        """Get the children of a tag with one of the given names.
+
+        This is equivalent to `tag(names, recursive=False)`, without building
+        a bs4 filter for every call.
+        """
+        return [
+            child
+            for child in tag.contents
+            if isinstance(child, Tag) and child.name in names
+        ]
+
+    @staticmethod
+    def _descendant_tags(tag: Tag, names: set[str]) -> list[Tag]:
+        """Get the descendants of a tag with one of the given names.
+
+        This is equivalent to `tag(names)`, without building a bs4 filter for
+        every call.
+        """
+        return [
+            node
+            for node in tag.descendants
+            if isinstance(node, Tag) and node.name in names
+        ]
+
     @staticmethod
     def _get_attr_as_string(tag: Tag, attr: str, default: str = "") -> str:
         """Get attribute value as string, handling list values."""
@@ -1,4 +1,5 @@
 import logging
+import threading
 from io import BytesIO
 from pathlib import Path
 from typing import Iterable, List, Optional, Union
@@ -23,7 +24,7 @@ _log = logging.getLogger(__name__)
 
 
 class _ImagePageBackend(PdfPageBackend):
-    def __init__(self, image: Image.Image):
+    def __init__(self, image: Optional[Image.Image]):
         self._image: Optional[Image.Image] = image
         self.valid: bool = self._image is not None
 
@@ -125,8 +126,10 @@ class ImageDocumentBackend(PdfDocumentBackend):
         - Subclasses PdfDocumentBackend to satisfy pipeline type checks.
         - Intentionally avoids calling PdfDocumentBackend.__init__ to skip
           the image→PDF conversion and any pypdfium2 usage.
-        - Handles multi-page TIFF by extracting frames eagerly to separate
-          Image objects to keep thread-safety when pages process in parallel.
+        - Decodes the frames of multi-page images (e.g. TIFF) lazily, when their
+          page is loaded, and each frame is released with its page. Every thread
+          reads the frames through its own image handle, so pages can load in
+          parallel.
     """
 
     def __init__(
@@ -138,41 +141,68 @@ class ImageDocumentBackend(PdfDocumentBackend):
         # Bypass PdfDocumentBackend.__init__ to avoid image→PDF conversion
         AbstractDocumentBackend.__init__(self, in_doc, path_or_stream, options)
         self.options: PdfBackendOptions = options
+        self._page_renderer = None
 
         if self.input_format not in {InputFormat.IMAGE}:
             raise RuntimeError(
                 f"Incompatible file format {self.input_format} was passed to ImageDocumentBackend."
             )
 
-        # Load frames eagerly for thread-safety across pages
-        self._frames: List[Image.Image] = []
+        # The image handles of the threads, all sharing the bytes of a stream
+        self._data: Optional[bytes] = None
+        self._local = threading.local()
+        self._handles: List[Image.Image] = []
+        self._handles_lock = threading.Lock()
+        self._frame_count = 0
         try:
-            img = Image.open(self.path_or_stream)  # type: ignore[arg-type]
+            if isinstance(self.path_or_stream, BytesIO):
+                self._data = self.path_or_stream.getvalue()
 
             # Handle multi-frame and single-frame images
             # - multiframe formats: TIFF, GIF, ICO
             # - singleframe formats: JPEG (.jpg, .jpeg), PNG (.png), BMP, WEBP (unless animated), HEIC
-            frame_count = getattr(img, "n_frames", 1)
-
-            if frame_count > 1:
-                for i in range(frame_count):
-                    img.seek(i)
-                    self._frames.append(img.copy().convert("RGB"))
-            else:
-                self._frames.append(img.convert("RGB"))
+            self._frame_count = getattr(self._get_handle(), "n_frames", 1)
         except Exception as e:
             raise RuntimeError(f"Could not load image for document {self.file}") from e
 
+    def _get_handle(self) -> Image.Image:
+        """Get the image handle of the current thread, opening it if needed."""
+        handle: Optional[Image.Image] = getattr(self._local, "handle", None)
+        if handle is None:
+            source: Union[BytesIO, Path]
+            if self._data is not None:
+                source = BytesIO(self._data)
+            elif isinstance(self.path_or_stream, Path):
+                source = self.path_or_stream
+            else:
+                raise RuntimeError(f"Image of document {self.file} is unloaded")
+            handle = Image.open(source)
+            self._local.handle = handle
+            with self._handles_lock:
+                self._handles.append(handle)
+        return handle
+
+    def _load_frame(self, page_no: int) -> Image.Image:
+        handle = self._get_handle()
+        if self._frame_count > 1:
+            handle.seek(page_no)
+        return handle.convert("RGB")
+
     def is_valid(self) -> bool:
-        return len(self._frames) > 0
+        return self._frame_count > 0
 
     def page_count(self) -> int:
-        return len(self._frames)
+        return self._frame_count
 
     def load_page(self, page_no: int) -> _ImagePageBackend:
-        if not (0 <= page_no < len(self._frames)):
+        if not (0 <= page_no < self._frame_count):
             raise IndexError(f"Page index out of range: {page_no}")
-        return _ImagePageBackend(self._frames[page_no])
+        try:
+            frame: Optional[Image.Image] = self._load_frame(page_no)
+        except Exception as e:
+            _log.error(f"Could not decode page {page_no} of document {self.file}: {e}")
+            frame = None
+        return _ImagePageBackend(frame)
 
     @classmethod
     def supported_formats(cls) -> set[InputFormat]:
@@ -185,4 +215,10 @@ class ImageDocumentBackend(PdfDocumentBackend):
 
     def unload(self):
         super().unload()
-        self._frames = []
+        with self._handles_lock:
+            for handle in self._handles:
+                handle.close()
+            self._handles = []
+        self._local = threading.local()
+        self._data = None
+        self._frame_count = 0
@@ -1,7 +1,11 @@
 """Backend for GBS Google Books schema."""
 
+import gzip
 import logging
+import shutil
 import tarfile
+import tempfile
+import threading
 from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
@@ -30,6 +34,9 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Archives decompressed beyond this size are spooled to a temporary file
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
 
 def _get_pdf_page_geometry(
     size: Size,
@@ -198,15 +205,26 @@ class MetsGbsDocumentBackend(PdfDocumentBackend):
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
-        self._tar: tarfile.TarFile = (
-            tarfile.open(name=self.path_or_stream, mode="r:gz")
+        # Decompress the archive once, so that the members of the pages are
+        # read with a seek instead of decompressing the gzip stream up to them
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+        with (
+            gzip.GzipFile(filename=self.path_or_stream, mode="rb")
             if isinstance(self.path_or_stream, Path)
-            else tarfile.open(fileobj=self.path_or_stream, mode="r:gz")
-        )
+            else gzip.GzipFile(fileobj=self.path_or_stream, mode="rb")
+        ) as gz:
+            shutil.copyfileobj(gz, self._buffer)
+        self._buffer.seek(0)
+        self._tar: tarfile.TarFile = tarfile.open(fileobj=self._buffer, mode="r:")
+        self._members: Dict[str, tarfile.TarInfo] = {
+            member.name: member for member in self._tar.getmembers()
+        }
+        # The members are read from the shared buffer, one at a time
+        self._lock = threading.Lock()
         self.root_mets: Optional[etree._Element] = None
         self.page_map: Dict[int, _PageFiles] = {}
 
-        for member in self._tar.getmembers():
+        for member in self._members.values():
             if member.name.endswith(".xml"):
                 file = self._tar.extractfile(member)
                 if file is not None:
@@ -293,6 +311,15 @@ class MetsGbsDocumentBackend(PdfDocumentBackend):
         _log.warning(f"The root element is not <mets:mets> with PROFILE='gbs': {root}")
         return None
 
+    def _read_member(self, name: str) -> bytes:
+        member = self._members.get(name)
+        if member is None:
+            raise KeyError(f"filename {name!r} not found in METS GBS archive")
+        with self._lock:
+            file = self._tar.extractfile(member)
+            assert file is not None
+            return file.read()
+
     def _parse_page(self, page_no: int) -> Tuple[SegmentedPdfPage, PILImage]:
         # TODO: use better fallbacks...
         image_info = self.page_map[page_no].image
@@ -300,13 +327,9 @@ class MetsGbsDocumentBackend(PdfDocumentBackend):
         ocr_info = self.page_map[page_no].coordOCR
         assert ocr_info is not None
 
-        image_file = self._tar.extractfile(image_info.path)
-        assert image_file is not None
-        buf = BytesIO(image_file.read())
+        buf = BytesIO(self._read_member(image_info.path))
         im: PILImage = Image.open(buf)
-        ocr_file = self._tar.extractfile(ocr_info.path)
-        assert ocr_file is not None
-        ocr_content = ocr_file.read()
+        ocr_content = self._read_member(ocr_info.path)
         parser = etree.HTMLParser()
         ocr_root: etree._Element = etree.fromstring(ocr_content, parser=parser)
 
@@ -379,7 +402,6 @@ class MetsGbsDocumentBackend(PdfDocumentBackend):
         return len(self.page_map)
 
     def load_page(self, page_no: int) -> MetsGbsPageBackend:
-        # TODO: is this thread-safe?
         page, im = self._parse_page(page_no)
         return MetsGbsPageBackend(parsed_page=page, page_im=im)
 
@@ -397,3 +419,4 @@ class MetsGbsDocumentBackend(PdfDocumentBackend):
     def unload(self) -> None:
         super().unload()
         self._tar.close()
+        self._buffer.close()
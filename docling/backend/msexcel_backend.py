@@ -1,8 +1,12 @@
 import logging
+from collections import defaultdict
+from collections.abc import Iterator
 from io import BytesIO
 from pathlib import Path
-from typing import Annotated, Any, Optional, Union, cast
+from typing import Annotated, Any, Callable, Optional, Union, cast
 
+import numpy as np
+import openpyxl
 from docling_core.types.doc import (
     BoundingBox,
     ContentLayer,
@@ -21,7 +25,10 @@ from docling_core.types.doc import (
 from openpyxl import load_workbook
 from openpyxl.chartsheet.chartsheet import Chartsheet
 from openpyxl.drawing.image import Image
-from openpyxl.drawing.spreadsheet_drawing import TwoCellAnchor
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing, TwoCellAnchor
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.reader.drawings import find_images
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 from PIL import Image as PILImage
 from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
@@ -38,6 +45,103 @@ from docling.datamodel.document import InputDocument
 
 _log = logging.getLogger(__name__)
 
+try:
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+except ImportError:  # pragma: no cover - read-only workbooks fall back to full mode
+
+    class ReadOnlyWorksheet:  # type: ignore[no-redef]
+        """Stand-in for the read-only worksheet of other openpyxl versions."""
+
+
+class _ReadOnlySheetUnsupported(RuntimeError):
+    """The installed openpyxl lacks the internals to stream read-only sheets."""
+
+
+class _ReadOnlySheetReader:
+    """Reads the cells, merged ranges and images of a read-only worksheet.
+
+    openpyxl has no public API for the merged ranges and images of read-only
+    sheets, so they are read from the sheet XML with its internals. This class
+    is the only place relying on them: when they are missing, the backend
+    falls back to the full mode.
+    """
+
+    def __init__(self, sheet: ReadOnlyWorksheet) -> None:
+        try:
+            from openpyxl.worksheet._reader import WorkSheetParser
+
+            workbook = sheet.parent
+            self._parser_type = WorkSheetParser
+            self._get_source = sheet._get_source
+            self._shared_strings = sheet._shared_strings
+            self._parser_options = {
+                "data_only": workbook.data_only,
+                "epoch": workbook.epoch,
+                "date_formats": workbook._date_formats,
+                "timedelta_formats": workbook._timedelta_formats,
+            }
+            self._archive = workbook._archive
+            self._worksheet_path: str = sheet._worksheet_path
+        except (ImportError, AttributeError) as exc:
+            raise _ReadOnlySheetUnsupported(
+                f"openpyxl {openpyxl.__version__} cannot stream read-only sheets"
+            ) from exc
+
+    @classmethod
+    def supports(cls, workbook: Any) -> bool:
+        """Whether the worksheets of a read-only *workbook* can be read."""
+        try:
+            for sheet in workbook.worksheets:
+                if not isinstance(sheet, Worksheet):
+                    cls(sheet)
+        except _ReadOnlySheetUnsupported as exc:
+            _log.warning(f"{exc}, loading the workbook in full mode.")
+            return False
+        return True
+
+    def iter_rows(
+        self,
+    ) -> tuple[
+        Iterator[tuple[int, list[tuple[int, Any]]]], Callable[[], list[CellRange]]
+    ]:
+        """Iterate the non-empty cells row by row, then get the merged ranges."""
+        parser = self._parser_type(
+            self._get_source(), self._shared_strings, **self._parser_options
+        )
+
+        def stream_rows() -> Iterator[tuple[int, list[tuple[int, Any]]]]:
+            try:
+                for r, row in parser.parse():
+                    yield (
+                        r,
+                        [
+                            (cell["column"], cell["value"])
+                            for cell in row
+                            if cell["value"] is not None
+                        ],
+                    )
+            finally:
+                parser.source.close()
+
+        def get_ranges() -> list[CellRange]:
+            if parser.merged_cells is None:
+                return []
+            return [CellRange(mc.ref) for mc in parser.merged_cells.mergeCell]
+
+        return stream_rows(), get_ranges
+
+    def images(self) -> list[Image]:
+        """Get the images of the sheet drawings."""
+        rels_path = get_rels_path(self._worksheet_path)
+        if rels_path not in self._archive.namelist():
+            return []
+        images: list[Image] = []
+        rels = get_dependents(self._archive, rels_path)
+        for rel in rels.find(SpreadsheetDrawing._rel_type):
+            _, drawing_images = find_images(self._archive, rel.target)
+            images.extend(drawing_images)
+        return images
+
 
 @dataclass
 class DataRegion:
@@ -100,6 +204,76 @@ class ExcelTable(BaseModel):
     data: list[ExcelCell]
 
 
+class _CellGrid:
+    """Index of the cells of a worksheet data region, for table detection.
+
+    The arrays cover the data region, with 0-based sheet coordinates shifted by
+    the region origin. `filled` marks the cells with a value, `merged` holds the
+    1-based index of the merged range covering each cell (0 if none) and
+    `visited` marks the cells already assigned to a table. `values` maps the
+    1-based (row, column) of the cells with a value to it.
+    """
+
+    def __init__(
+        self,
+        values: dict[tuple[int, int], Any],
+        ranges: list[CellRange],
+        bounds: DataRegion,
+    ):
+        self.row0 = bounds.min_row - 1
+        self.col0 = bounds.min_col - 1
+        shape = (bounds.height(), bounds.width())
+
+        self.ranges = ranges
+        self.merged = np.zeros(shape, dtype=np.int32)
+        # Fill in reverse order, so the first of overlapping ranges wins
+        for idx in range(len(self.ranges) - 1, -1, -1):
+            mr = self.ranges[idx]
+            self.merged[
+                mr.min_row - 1 - self.row0 : mr.max_row - self.row0,
+                mr.min_col - 1 - self.col0 : mr.max_col - self.col0,
+            ] = idx + 1
+
+        self.values = values
+        self.filled = np.zeros(shape, dtype=bool)
+        for r, c in values:
+            self.filled[r - 1 - self.row0, c - 1 - self.col0] = True
+        # Only the first cell of a merged range holds a value, as in openpyxl
+        hidden = self.filled & (self.merged > 0)
+        for mr in self.ranges:
+            hidden[mr.min_row - 1 - self.row0, mr.min_col - 1 - self.col0] = False
+        for i, j in np.argwhere(hidden).tolist():
+            del values[(i + self.row0 + 1, j + self.col0 + 1)]
+        self.filled &= ~hidden
+
+        self.max_rows = np.array([0] + [mr.max_row for mr in self.ranges])
+        self.max_cols = np.array([0] + [mr.max_col for mr in self.ranges])
+
+        self.visited = np.zeros(shape, dtype=bool)
+
+    def span(self, merge_id: int) -> tuple[int, int]:
+        """Number of rows and columns of a merged range."""
+        mr = self.ranges[merge_id - 1]
+        return mr.max_row - mr.min_row + 1, mr.max_col - mr.min_col + 1
+
+    @staticmethod
+    def extent(filled: np.ndarray, merged: np.ndarray, ends: np.ndarray) -> int:
+        """Number of cells a table extends by along a line of cells.
+
+        The table stops at the first cell that is empty and not merged. A merged
+        range extends the table to its end, until a plain cell sets it back.
+        """
+        blocked = ~(filled | (merged > 0))
+        stop = int(blocked.argmax()) if blocked.any() else len(blocked)
+        merged = merged[:stop]
+        plain = np.flatnonzero(merged == 0)
+        extent = int(plain[-1]) + 1 if len(plain) else 0
+        tail = merged[extent:]
+        if len(tail):
+            return max(extent, int(ends[tail].max()))
+        return extent
+
+
 class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBackend):
     """Backend for parsing Excel workbooks.
 
@@ -142,17 +316,13 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         for i in range(-1, self.max_levels):
             self.parents[i] = None
 
+        read_only = isinstance(options, MsExcelBackendOptions) and options.read_only
         self.workbook = None
         try:
-            if isinstance(self.path_or_stream, BytesIO):
-                self.workbook = load_workbook(
-                    filename=self.path_or_stream, data_only=True
-                )
-
-            elif isinstance(self.path_or_stream, Path):
-                self.workbook = load_workbook(
-                    filename=str(self.path_or_stream), data_only=True
-                )
+            self.workbook = self._load_workbook(read_only)
+            if read_only and not _ReadOnlySheetReader.supports(self.workbook):
+                self.workbook.close()
+                self.workbook = self._load_workbook(read_only=False)
 
             self.valid = self.workbook is not None
         except Exception as e:
@@ -162,6 +332,27 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
                 f"MsExcelDocumentBackend could not load document with hash {self.document_hash}"
             ) from e
 
+    def _load_workbook(self, read_only: bool) -> Any:
+        if isinstance(self.path_or_stream, BytesIO):
+            self.path_or_stream.seek(0)
+            return load_workbook(
+                filename=self.path_or_stream, data_only=True, read_only=read_only
+            )
+        elif isinstance(self.path_or_stream, Path):
+            return load_workbook(
+                filename=str(self.path_or_stream),
+                data_only=True,
+                read_only=read_only,
+            )
+        return None
+
+    @override
+    def unload(self):
+        # Read-only workbooks keep their archive open
+        if self.workbook is not None:
+            self.workbook.close()
+        super().unload()
+
     @override
     def is_valid(self) -> bool:
         _log.debug(f"valid: {self.valid}")
@@ -175,7 +366,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
     @override
     def page_count(self) -> int:
         if self.is_valid() and self.workbook:
-            return len(self.workbook.sheetnames)
+            return len(self._selected_sheet_names())
         else:
             return 0
 
@@ -223,8 +414,8 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         """
 
         if self.workbook is not None:
-            # Iterate over all sheets
-            for idx, name in enumerate(self.workbook.sheetnames):
+            # Iterate over the selected sheets, one page each
+            for idx, name in enumerate(self._selected_sheet_names()):
                 _log.info(f"Processing sheet {idx}: {name}")
 
                 sheet = self.workbook[name]
@@ -246,8 +437,28 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
         return doc
 
+    def _selected_sheet_names(self) -> list[str]:
+        """Names of the sheets to convert, in workbook order."""
+        assert self.workbook is not None
+        if (
+            not isinstance(self.options, MsExcelBackendOptions)
+            or self.options.sheet_names is None
+        ):
+            return self.workbook.sheetnames
+        return [
+            name
+            for name in self.workbook.sheetnames
+            if name in self.options.sheet_names
+        ]
+
+    def _get_page_no(self, sheet: Union[Worksheet, ReadOnlyWorksheet]) -> int:
+        """Page number of a selected sheet."""
+        return self._selected_sheet_names().index(sheet.title) + 1
+
     def _convert_sheet(
-        self, doc: DoclingDocument, sheet: Union[Worksheet, Chartsheet]
+        self,
+        doc: DoclingDocument,
+        sheet: Union[Worksheet, ReadOnlyWorksheet, Chartsheet],
     ) -> DoclingDocument:
         """Parse an Excel worksheet and attach its structure to a DoclingDocument
 
@@ -258,7 +469,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         Returns:
             The updated DoclingDocument.
         """
-        if isinstance(sheet, Worksheet):
+        if isinstance(sheet, (Worksheet, ReadOnlyWorksheet)):
             doc = self._find_tables_in_sheet(doc, sheet)
             doc = self._find_images_in_sheet(doc, sheet)
 
@@ -267,7 +478,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         return doc
 
     def _find_tables_in_sheet(
-        self, doc: DoclingDocument, sheet: Worksheet
+        self, doc: DoclingDocument, sheet: Union[Worksheet, ReadOnlyWorksheet]
     ) -> DoclingDocument:
         """Find all tables in an Excel sheet and attach them to a DoclingDocument.
 
@@ -281,7 +492,8 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
         if self.workbook is not None:
             content_layer = self._get_sheet_content_layer(sheet)
-            tables = self._find_data_tables(sheet)
+            # Tables are added as they are found, to release their cells early
+            tables = self._iter_data_tables(sheet)
 
             treat_singleton_as_text = (
                 isinstance(self.options, MsExcelBackendOptions)
@@ -300,7 +512,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
                     and num_cols == 1
                     and excel_table.data
                 ):
-                    page_no = self.workbook.index(sheet) + 1
+                    page_no = self._get_page_no(sheet)
                     doc.add_text(
                         text=excel_table.data[0].text,
                         label=DocItemLabel.TEXT,
@@ -341,7 +553,7 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
                         )
                         table_data.table_cells.append(cell)
 
-                    page_no = self.workbook.index(sheet) + 1
+                    page_no = self._get_page_no(sheet)
                     doc.add_table(
                         data=table_data,
                         parent=self.parents[0],
@@ -363,15 +575,101 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
         return doc
 
-    def _find_true_data_bounds(self, sheet: Worksheet) -> DataRegion:
+    def _read_sheet(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> tuple[dict[tuple[int, int], Any], list[CellRange]]:
+        """Read the values and merged ranges of a worksheet.
+
+        The rows past the cell budget of the options are skipped, along with the
+        merged ranges starting in them.
+
+        Args:
+            sheet: The worksheet to read.
+
+        Returns:
+            The values of the non-empty cells, by 1-based (row, column), and the
+            merged ranges.
+        """
+        budget = (
+            self.options.max_cells_per_sheet
+            if isinstance(self.options, MsExcelBackendOptions)
+            else None
+        )
+        values: dict[tuple[int, int], Any] = {}
+        last_row: Optional[int] = None
+        rows, get_ranges = self._iter_sheet_rows(sheet)
+        for r, row in rows:
+            if last_row is not None:
+                continue  # Read on, for the merged ranges after the rows
+            if budget is not None and len(values) + len(row) > budget:
+                _log.warning(
+                    f"Sheet {sheet.title} has more than {budget} cells, "
+                    f"the rows from {r} are skipped."
+                )
+                last_row = r - 1
+                continue
+            for c, value in row:
+                values[(r, c)] = value
+
+        ranges = get_ranges()
+        if last_row is not None:
+            ranges = [mr for mr in ranges if mr.min_row <= last_row]
+        return values, ranges
+
+    def _iter_sheet_rows(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> tuple[
+        Iterator[tuple[int, list[tuple[int, Any]]]], Callable[[], list[CellRange]]
+    ]:
+        """Iterate the non-empty cells of a worksheet, row by row.
+
+        Read-only worksheets are streamed from their XML, whose merged ranges
+        come after the rows.
+
+        Args:
+            sheet: The worksheet to read.
+
+        Returns:
+            An iterator of the 1-based row indices and their (column, value)
+            pairs, in row order, and a function returning the merged ranges
+            once the rows are consumed.
+        """
+        if isinstance(sheet, Worksheet):
+            cells: dict[int, list[tuple[int, Any]]] = defaultdict(list)
+            for (r, c), cell in sheet._cells.items():
+                if cell.value is not None:
+                    cells[r].append((c, cell.value))
+            rows = ((r, sorted(cells[r])) for r in sorted(cells))
+            return rows, lambda: list(sheet.merged_cells.ranges)
+
+        return _ReadOnlySheetReader(sheet).iter_rows()
+
+    def _get_sheet_images(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> list[Image]:
+        """Get the images of a worksheet.
+
+        The images of read-only worksheets are read from their drawings, when
+        the sheet is converted.
+        """
+        if isinstance(sheet, Worksheet):
+            return sheet._images  # type: ignore[attr-defined]
+
+        return _ReadOnlySheetReader(sheet).images()
+
+    @staticmethod
+    def _find_true_data_bounds(
+        values: dict[tuple[int, int], Any], ranges: list[CellRange]
+    ) -> DataRegion:
         """Find the true data boundaries (min/max rows and columns) in a worksheet.
 
-        This function scans all cells to find the smallest rectangular region that contains
-        all non-empty cells or merged cell ranges. It returns the minimal and maximal
+        This function finds the smallest rectangular region that contains all
+        non-empty cells or merged cell ranges. It returns the minimal and maximal
         row/column indices that bound the actual data region.
 
         Args:
-            sheet: The worksheet to analyze.
+            values: The values of the non-empty cells, by 1-based (row, column).
+            ranges: The merged cell ranges.
 
         Returns:
             A data region representing the smallest rectangle that covers all data and merged cells.
@@ -380,16 +678,14 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         min_row, min_col = None, None
         max_row, max_col = 0, 0
 
-        for cell in sheet._cells.values():
-            if cell.value is not None:
-                r, c = cell.row, cell.column
-                min_row = r if min_row is None else min(min_row, r)
-                min_col = c if min_col is None else min(min_col, c)
-                max_row = max(max_row, r)
-                max_col = max(max_col, c)
+        if values:
+            rows = [r for r, _ in values]
+            cols = [c for _, c in values]
+            min_row, max_row = min(rows), max(rows)
+            min_col, max_col = min(cols), max(cols)
 
         # Expand bounds to include merged cells
-        for merged in sheet.merged_cells.ranges:
+        for merged in ranges:
             min_row = (
                 merged.min_row if min_row is None else min(min_row, merged.min_row)
             )
@@ -405,7 +701,9 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
         return DataRegion(min_row, max_row, min_col, max_col)
 
-    def _find_data_tables(self, sheet: Worksheet) -> list[ExcelTable]:
+    def _find_data_tables(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> list[ExcelTable]:
         """Find all compact rectangular data tables in an Excel worksheet.
 
         Args:
@@ -414,205 +712,142 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         Returns:
             A list of ExcelTable objects representing the data tables.
         """
+        return list(self._iter_data_tables(sheet))
+
+    def _iter_data_tables(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> Iterator[ExcelTable]:
+        """Find the compact rectangular data tables in an Excel worksheet, one by one.
+
+        Args:
+            sheet: The Excel worksheet to be parsed.
+
+        Yields:
+            The ExcelTable objects representing the data tables.
+        """
+        values, ranges = self._read_sheet(sheet)
         bounds: DataRegion = self._find_true_data_bounds(
-            sheet
+            values, ranges
         )  # The true data boundaries
-        tables: list[ExcelTable] = []  # List to store found tables
-        visited: set[tuple[int, int]] = set()  # Track already visited cells
-
-        # Limit scan to actual data bounds
-        for ri, row in enumerate(
-            sheet.iter_rows(
-                min_row=bounds.min_row,
-                max_row=bounds.max_row,
-                min_col=bounds.min_col,
-                max_col=bounds.max_col,
-                values_only=False,
-            ),
-            start=bounds.min_row - 1,
-        ):
-            for rj, cell in enumerate(row, start=bounds.min_col - 1):
-                if cell.value is None or (ri, rj) in visited:
-                    continue
-
-                # If the cell starts a new table, find its bounds
-                table_bounds, visited_cells = self._find_table_bounds(
-                    sheet, ri, rj, bounds.max_row, bounds.max_col
-                )
+        grid = _CellGrid(values, ranges, bounds)
 
-                visited.update(visited_cells)  # Mark these cells as visited
-                tables.append(table_bounds)
+        # Tables only extend down and right, so the cells of the later tables
+        # are always after their start, in row-major order.
+        for i, j in np.argwhere(grid.filled).tolist():
+            if grid.visited[i, j]:
+                continue
 
-        return tables
+            # If the cell starts a new table, find its bounds
+            yield self._find_table_bounds(grid, i + grid.row0, j + grid.col0)
 
     def _find_table_bounds(
         self,
-        sheet: Worksheet,
+        grid: _CellGrid,
         start_row: int,
         start_col: int,
-        max_row: int,
-        max_col: int,
-    ) -> tuple[ExcelTable, set[tuple[int, int]]]:
+    ) -> ExcelTable:
         """Determine the bounds of a compact rectangular table.
 
+        The cells of the table, and the cells its merged cells span, are marked
+        as visited in the grid.
+
         Args:
-            sheet: The Excel worksheet to be parsed.
+            grid: The cell grid of the worksheet data region.
             start_row: The row number of the starting cell.
             start_col: The column number of the starting cell.
-            max_row: Maximum row boundary from true data bounds.
-            max_col: Maximum column boundary from true data bounds.
 
         Returns:
-            A tuple with an Excel table and a set of cell coordinates.
+            An Excel table.
         """
         _log.debug("find_table_bounds")
 
-        table_max_row = self._find_table_bottom(sheet, start_row, start_col, max_row)
-        table_max_col = self._find_table_right(sheet, start_row, start_col, max_col)
+        table_max_row = self._find_table_bottom(grid, start_row, start_col)
+        table_max_col = self._find_table_right(grid, start_row, start_col)
 
         # Collect the data within the bounds
+        i0, j0 = start_row - grid.row0, start_col - grid.col0
+        i1, j1 = table_max_row - grid.row0 + 1, table_max_col - grid.col0 + 1
+        covered = np.zeros((i1 - i0, j1 - j0), dtype=bool)
         data = []
-        visited_cells: set[tuple[int, int]] = set()
-        for ri, row in enumerate(
-            sheet.iter_rows(
-                min_row=start_row + 1,  # start_row is 0-based but iter_rows is 1-based
-                max_row=table_max_row + 1,
-                min_col=start_col + 1,
-                max_col=table_max_col + 1,
-                values_only=False,
-            ),
-            start_row,
-        ):
-            for rj, cell in enumerate(row, start_col):
-                # Check if the cell belongs to a merged range
-                row_span = 1
-                col_span = 1
-
-                for merged_range in sheet.merged_cells.ranges:
-                    if (
-                        merged_range.min_row <= ri + 1
-                        and ri + 1 <= merged_range.max_row
-                        and merged_range.min_col <= rj + 1
-                        and rj + 1 <= merged_range.max_col
-                    ):
-                        row_span = merged_range.max_row - merged_range.min_row + 1
-                        col_span = merged_range.max_col - merged_range.min_col + 1
-                        break
-
-                if (ri, rj) not in visited_cells:
-                    data.append(
-                        ExcelCell(
-                            row=ri - start_row,
-                            col=rj - start_col,
-                            text=str(cell.value),
-                            row_span=row_span,
-                            col_span=col_span,
-                        )
+        for i, merge_ids in enumerate(grid.merged[i0:i1, j0:j1].tolist()):
+            for j, merge_id in enumerate(merge_ids):
+                if merge_id:
+                    if covered[i, j]:
+                        continue
+                    # A merged cell spans its whole range, from its position
+                    row_span, col_span = grid.span(merge_id)
+                    covered[i : i + row_span, j : j + col_span] = True
+                    grid.visited[
+                        i0 + i : i0 + i + row_span, j0 + j : j0 + j + col_span
+                    ] = True
+                else:
+                    if covered[i, j]:
+                        continue
+                    row_span = col_span = 1
+                data.append(
+                    ExcelCell(
+                        row=i,
+                        col=j,
+                        text=str(
+                            grid.values.get((start_row + i + 1, start_col + j + 1))
+                        ),
+                        row_span=row_span,
+                        col_span=col_span,
                     )
+                )
+        grid.visited[i0:i1, j0:j1] = True
 
-                    # Mark all cells in the span as visited
-                    for span_row in range(ri, ri + row_span):
-                        for span_col in range(rj, rj + col_span):
-                            visited_cells.add((span_row, span_col))
-
-        return (
-            ExcelTable(
-                anchor=(start_col, start_row),
-                num_rows=table_max_row + 1 - start_row,
-                num_cols=table_max_col + 1 - start_col,
-                data=data,
-            ),
-            visited_cells,
+        return ExcelTable(
+            anchor=(start_col, start_row),
+            num_rows=table_max_row + 1 - start_row,
+            num_cols=table_max_col + 1 - start_col,
+            data=data,
         )
 
     def _find_table_bottom(
-        self, sheet: Worksheet, start_row: int, start_col: int, max_row: int
+        self, grid: _CellGrid, start_row: int, start_col: int
     ) -> int:
         """Find the bottom boundary of a table.
 
         Args:
-            sheet: The Excel worksheet to be parsed.
+            grid: The cell grid of the worksheet data region.
             start_row: The starting row of the table.
             start_col: The starting column of the table.
-            max_row: Maximum row boundary from true data bounds.
 
         Returns:
             The row index representing the bottom boundary of the table.
         """
-        table_max_row: int = start_row
-
-        for ri, (cell,) in enumerate(
-            sheet.iter_rows(
-                min_row=start_row + 2,
-                max_row=max_row,
-                min_col=start_col + 1,
-                max_col=start_col + 1,
-                values_only=False,
-            ),
-            start_row + 1,
-        ):
-            # Check if the cell is part of a merged range
-            merged_range = next(
-                (mr for mr in sheet.merged_cells.ranges if cell.coordinate in mr),
-                None,
-            )
-
-            if cell.value is None and not merged_range:
-                break  # Stop if the cell is empty and not merged
-
-            # Expand table_max_row to include the merged range if applicable
-            if merged_range:
-                table_max_row = max(table_max_row, merged_range.max_row - 1)
-            else:
-                table_max_row = ri
-
-        return table_max_row
+        i, j = start_row - grid.row0, start_col - grid.col0
+        # Merged ranges extend the table to their last row, 0-based
+        extent = _CellGrid.extent(
+            grid.filled[i + 1 :, j],
+            grid.merged[i + 1 :, j],
+            grid.max_rows - 1 - start_row,
+        )
+        return start_row + extent
 
-    def _find_table_right(
-        self, sheet: Worksheet, start_row: int, start_col: int, max_col: int
-    ) -> int:
+    def _find_table_right(self, grid: _CellGrid, start_row: int, start_col: int) -> int:
         """Find the right boundary of a table.
 
         Args:
-            sheet: The Excel worksheet to be parsed.
+            grid: The cell grid of the worksheet data region.
             start_row: The starting row of the table.
             start_col: The starting column of the table.
-            max_col: The actual max column of the table.
 
         Returns:
-            The column index representing the right boundary of the table."
+            The column index representing the right boundary of the table.
         """
-        table_max_col: int = start_col
-
-        for rj, (cell,) in enumerate(
-            sheet.iter_cols(
-                min_row=start_row + 1,
-                max_row=start_row + 1,
-                min_col=start_col + 2,
-                max_col=max_col,
-                values_only=False,
-            ),
-            start_col + 1,
-        ):
-            # Check if the cell is part of a merged range
-            merged_range = next(
-                (mr for mr in sheet.merged_cells.ranges if cell.coordinate in mr),
-                None,
-            )
-
-            if cell.value is None and not merged_range:
-                break  # Stop if the cell is empty and not merged
-
-            # Expand table_max_col to include the merged range if applicable
-            if merged_range:
-                table_max_col = max(table_max_col, merged_range.max_col - 1)
-            else:
-                table_max_col = rj
-
-        return table_max_col
+        i, j = start_row - grid.row0, start_col - grid.col0
+        # Merged ranges extend the table to their last column, 0-based
+        extent = _CellGrid.extent(
+            grid.filled[i, j + 1 :],
+            grid.merged[i, j + 1 :],
+            grid.max_cols - 1 - start_col,
+        )
+        return start_col + extent
 
     def _find_images_in_sheet(
-        self, doc: DoclingDocument, sheet: Worksheet
+        self, doc: DoclingDocument, sheet: Union[Worksheet, ReadOnlyWorksheet]
     ) -> DoclingDocument:
         """Find images in the Excel sheet and attach them to the DoclingDocument.
 
@@ -626,11 +861,11 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         if self.workbook is not None:
             content_layer = self._get_sheet_content_layer(sheet)
             # Iterate over byte images in the sheet
-            for item in sheet._images:  # type: ignore[attr-defined]
+            for item in self._get_sheet_images(sheet):
                 try:
                     image: Image = cast(Image, item)
                     pil_image = PILImage.open(image.ref)  # type: ignore[arg-type]
-                    page_no = self.workbook.index(sheet) + 1
+                    page_no = self._get_page_no(sheet)
                     anchor = (0, 0, 0, 0)
                     if isinstance(image.anchor, TwoCellAnchor):
                         anchor = (
@@ -678,7 +913,9 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         return (right - left, bottom - top)
 
     @staticmethod
-    def _get_sheet_content_layer(sheet: Worksheet) -> Optional[ContentLayer]:
+    def _get_sheet_content_layer(
+        sheet: Union[Worksheet, ReadOnlyWorksheet],
+    ) -> Optional[ContentLayer]:
         return (
             None
             if sheet.sheet_state == Worksheet.SHEETSTATE_VISIBLE
@@ -12,6 +12,7 @@ from docling.backend.abstract_backend import PaginatedDocumentBackend
 from docling.datamodel.backend_options import PdfBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.utils.pdfium_render_pool import PdfiumPageRenderer, get_render_pool
 
 
 class PdfPageBackend(ABC):
@@ -59,12 +60,32 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
     ):
         super().__init__(in_doc, path_or_stream, options)
         self.options: PdfBackendOptions
+        self._page_renderer: Optional[PdfiumPageRenderer] = None
 
         if self.input_format not in self.supported_formats():
             raise RuntimeError(
                 f"Incompatible file format {self.input_format} was passed to a PdfDocumentBackend. Valid format are {','.join(self.supported_formats())}."
             )
 
+    def _init_page_renderer(self, password: Optional[str]) -> None:
+        """Route page rendering to worker processes if `render_workers` is set.
+
+        Only for backends rasterizing with pypdfium2.
+        """
+        if self.options.render_workers > 0:
+            self._page_renderer = PdfiumPageRenderer(
+                get_render_pool(self.options.render_workers),
+                self.path_or_stream,
+                doc_key=self.document_hash,
+                password=password,
+            )
+
+    def unload(self):
+        super().unload()
+        if self._page_renderer is not None:
+            self._page_renderer.close()
+            self._page_renderer = None
+
     @abstractmethod
     def load_page(self, page_no: int) -> PdfPageBackend:
         pass
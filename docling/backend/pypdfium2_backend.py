@@ -22,6 +22,7 @@ from pypdfium2._helpers.misc import PdfiumError
 from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
 from docling.datamodel.backend_options import PdfBackendOptions
 from docling.utils.locks import pypdfium2_lock
+from docling.utils.pdfium_render_pool import PdfiumPageRenderer
 
 
 def get_pdf_page_geometry(
@@ -101,10 +102,16 @@ _log = logging.getLogger(__name__)
 
 class PyPdfiumPageBackend(PdfPageBackend):
     def __init__(
-        self, pdfium_doc: pdfium.PdfDocument, document_hash: str, page_no: int
+        self,
+        pdfium_doc: pdfium.PdfDocument,
+        document_hash: str,
+        page_no: int,
+        renderer: Optional[PdfiumPageRenderer] = None,
     ):
         # Note: lock applied by the caller
         self.valid = True  # No better way to tell from pypdfium.
+        self._page_no = page_no
+        self._renderer = renderer
         try:
             self._ppage: pdfium.PdfPage = pdfium_doc[page_no]
         except PdfiumError:
@@ -346,6 +353,15 @@ class PyPdfiumPageBackend(PdfPageBackend):
             padbox.r = page_size.width - padbox.r
             padbox.t = page_size.height - padbox.t
 
+        if self._renderer is not None:
+            # Rasterize in a worker process which owns its own pdfium instance.
+            return self._renderer.render(
+                self._page_no,
+                scale=scale * 1.5,
+                crop=padbox.as_tuple(),
+                size=(round(cropbox.width * scale), round(cropbox.height * scale)),
+            )
+
         with pypdfium2_lock:
             image = (
                 self._ppage.render(
@@ -368,6 +384,7 @@ class PyPdfiumPageBackend(PdfPageBackend):
     def unload(self):
         self._ppage = None
         self.text_page = None
+        self._renderer = None
 
 
 class PyPdfiumDocumentBackend(PdfDocumentBackend):
@@ -389,6 +406,7 @@ class PyPdfiumDocumentBackend(PdfDocumentBackend):
             raise RuntimeError(
                 f"pypdfium could not load document with hash {self.document_hash}"
             ) from e
+        self._init_page_renderer(password)
 
     def page_count(self) -> int:
         with pypdfium2_lock:
@@ -396,7 +414,12 @@ class PyPdfiumDocumentBackend(PdfDocumentBackend):
 
     def load_page(self, page_no: int) -> PyPdfiumPageBackend:
         with pypdfium2_lock:
-            return PyPdfiumPageBackend(self._pdoc, self.document_hash, page_no)
+            return PyPdfiumPageBackend(
+                self._pdoc,
+                self.document_hash,
+                page_no,
+                renderer=self._page_renderer,
+            )
 
     def is_valid(self) -> bool:
         return self.page_count() > 0
@@ -11,6 +11,7 @@ import re
 import xml.sax
 import xml.sax.xmlreader
 from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterable, Iterator
 from enum import Enum, unique
 from io import BytesIO
 from pathlib import Path
@@ -57,6 +58,35 @@ class PatentHeading(Enum):
         self.level: LevelNumber = level
 
 
+def _split_patents(
+    lines: Iterable[str],
+) -> Generator[tuple[Optional[str], str], None, None]:
+    """Split the lines of a USPTO file into the patents it contains.
+
+    Bulk files concatenate many patents, each one starting with an XML declaration,
+    a DOCTYPE or a PATN record. Lines before the first patent are kept with it.
+
+    Parameters:
+        lines: The lines of a USPTO file.
+
+    Returns:
+        The DOCTYPE (or PATN) line and the content of each patent.
+    """
+    doctype: Optional[str] = None
+    patent_lines: list[str] = []
+    for line in lines:
+        is_doctype = line.startswith("<!DOCTYPE") or line == "PATN\n"
+        if doctype is not None and (is_doctype or line.startswith("<?xml ")):
+            yield doctype, "".join(patent_lines)
+            doctype = None
+            patent_lines = []
+        if is_doctype:
+            doctype = line
+        patent_lines.append(line)
+    if patent_lines:
+        yield doctype, "".join(patent_lines)
+
+
 class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
     @override
     def __init__(
@@ -66,41 +96,68 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
 
         self.patent_content: str = ""
         self.parser: Optional[PatentUspto] = None
+        # The patents after the first one, read on demand from bulk files
+        self._patents: Generator[tuple[Optional[str], str], None, None] = (
+            _split_patents([])
+        )
+        self._next_patent: Optional[tuple[Optional[str], str]] = None
 
         try:
-            if isinstance(self.path_or_stream, BytesIO):
-                while line := self.path_or_stream.readline().decode("utf-8"):
-                    if line.startswith("<!DOCTYPE") or line == "PATN\n":
-                        self._set_parser(line)
-                    self.patent_content += line
-            elif isinstance(self.path_or_stream, Path):
-                with open(self.path_or_stream, encoding="utf-8") as file_obj:
-                    while line := file_obj.readline():
-                        if line.startswith("<!DOCTYPE") or line == "PATN\n":
-                            self._set_parser(line)
-                        self.patent_content += line
+            self._patents = _split_patents(self._iter_lines())
+            doctype, self.patent_content = next(self._patents, (None, ""))
+            if doctype is not None:
+                self._set_parser(doctype)
         except Exception as exc:
             raise RuntimeError(
                 f"Could not initialize USPTO backend for file with hash {self.document_hash}."
             ) from exc
 
+    def _iter_lines(self) -> Iterator[str]:
+        if isinstance(self.path_or_stream, BytesIO):
+            for raw_line in self.path_or_stream:
+                line = raw_line.decode("utf-8")
+                # Translate newlines like a file opened in text mode
+                if line.endswith("\r\n"):
+                    line = line[:-2] + "\n"
+                yield line
+        elif isinstance(self.path_or_stream, Path):
+            with open(self.path_or_stream, encoding="utf-8") as file_obj:
+                yield from file_obj
+
     def _set_parser(self, doctype: str) -> None:
+        self.parser = self._get_parser(doctype)
+
+    @staticmethod
+    def _get_parser(doctype: str) -> Optional["PatentUspto"]:
         doctype_line = doctype.lower()
         if doctype == "PATN\n":
-            self.parser = PatentUsptoGrantAps()
+            return PatentUsptoGrantAps()
         elif "us-patent-application-v4" in doctype_line:
-            self.parser = PatentUsptoIce()
+            return PatentUsptoIce()
         elif "us-patent-grant-v4" in doctype_line:
-            self.parser = PatentUsptoIce()
+            return PatentUsptoIce()
         elif "us-grant-025" in doctype_line:
-            self.parser = PatentUsptoGrantV2()
+            return PatentUsptoGrantV2()
         elif all(
             item in doctype_line
             for item in ("patent-application-publication", "pap-v1")
         ):
-            self.parser = PatentUsptoAppV1()
+            return PatentUsptoAppV1()
         else:
-            self.parser = None
+            return None
+
+    def _has_more_patents(self) -> bool:
+        if self._next_patent is None:
+            self._next_patent = next(self._patents, None)
+        return self._next_patent is not None
+
+    def _iter_patents(self) -> Iterator[tuple[Optional["PatentUspto"], str]]:
+        yield self.parser, self.patent_content
+        while self._has_more_patents():
+            assert self._next_patent is not None
+            doctype, content = self._next_patent
+            self._next_patent = None
+            yield (self._get_parser(doctype) if doctype else None), content
 
     @override
     def is_valid(self) -> bool:
@@ -113,7 +170,7 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
 
     @override
     def unload(self) -> None:
-        return
+        self._patents.close()
 
     @classmethod
     @override
@@ -123,31 +180,73 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
     @override
     def convert(self) -> DoclingDocument:
         if self.parser is not None:
-            doc = self.parser.parse(self.patent_content)
-            if doc is None:
+            if self._has_more_patents():
                 raise RuntimeError(
-                    f"Failed to convert doc (hash={self.document_hash}, "
-                    f"name={self.file.name})."
+                    f"Cannot convert doc (hash={self.document_hash}, "
+                    f"name={self.file.name}) because it contains several patents. "
+                    "DocumentConverter converts one patent per file: convert a "
+                    "bulk file with PatentUsptoDocumentBackend(in_doc, "
+                    "path_or_stream).convert_all(), which yields one document "
+                    "per patent."
                 )
-            doc.name = self.file.name or "file"
-            mime_type = (
-                "text/plain"
-                if isinstance(self.parser, PatentUsptoGrantAps)
-                else "application/xml"
-            )
-            doc.origin = DocumentOrigin(
-                mimetype=mime_type,
-                binary_hash=self.document_hash,
-                filename=self.file.name or "file",
+            return self._convert_patent(
+                self.parser, self.patent_content, self.file.name or "file"
             )
-
-            return doc
         else:
             raise RuntimeError(
                 f"Cannot convert doc (hash={self.document_hash}, "
                 f"name={self.file.name}) because the backend failed to init."
             )
 
+    def convert_all(self) -> Iterator[DoclingDocument]:
+        """Convert the patents of a USPTO file one at a time.
+
+        USPTO bulk files concatenate thousands of patents. They are read and parsed
+        one patent at a time, so that memory is bounded by the largest patent
+        instead of the whole file. Patents that fail to parse are logged and
+        skipped. The file is read once, so the patents can only be iterated once.
+
+        `DocumentConverter` converts one patent per file, so bulk files are
+        converted by constructing the backend directly:
+        `PatentUsptoDocumentBackend(in_doc, path_or_stream).convert_all()`.
+
+        Returns:
+            The patents parsed as docling documents, named after the file and
+            their position in it.
+        """
+        for index, (parser, content) in enumerate(self._iter_patents()):
+            name = f"{self.file.stem or 'file'}_{index}"
+            if parser is None:
+                _log.warning(f"Skipping patent {name} with an unknown format.")
+                continue
+            try:
+                yield self._convert_patent(parser, content, name)
+            except RuntimeError as exc:
+                _log.error(f"Skipping patent {name}: {exc}")
+
+    def _convert_patent(
+        self, parser: "PatentUspto", patent_content: str, name: str
+    ) -> DoclingDocument:
+        doc = parser.parse(patent_content)
+        if doc is None:
+            raise RuntimeError(
+                f"Failed to convert doc (hash={self.document_hash}, "
+                f"name={self.file.name})."
+            )
+        doc.name = name
+        mime_type = (
+            "text/plain"
+            if isinstance(parser, PatentUsptoGrantAps)
+            else "application/xml"
+        )
+        doc.origin = DocumentOrigin(
+            mimetype=mime_type,
+            binary_hash=self.document_hash,
+            filename=self.file.name or "file",
+        )
+
+        return doc
+
 
 class PatentUspto(ABC):
     """Parser of patent documents from the US Patent Office."""
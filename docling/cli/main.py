@@ -1,14 +1,20 @@
 import importlib
+import itertools
 import logging
+import os
 import platform
 import re
 import sys
 import tempfile
 import time
+import uuid
 import warnings
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
-from typing import Annotated, Dict, List, Optional, Type
+from typing import Annotated, Dict, List, Optional, Type, Union
 
 import rich.table
 import typer
@@ -20,7 +26,7 @@ from docling_core.transforms.serializer.html import (
 from docling_core.transforms.visualizer.layout_visualizer import LayoutVisualizer
 from docling_core.types.doc import ImageRefMode
 from docling_core.utils.file import resolve_source_to_path
-from pydantic import TypeAdapter
+from pydantic import AnyHttpUrl, TypeAdapter, ValidationError
 from rich.console import Console
 
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
@@ -109,6 +115,9 @@ warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr
 
 _log = logging.getLogger(__name__)
 
+# Remote sources downloaded at once, ahead of the conversion
+_MAX_CONCURRENT_DOWNLOADS = 4
+
 console = Console()
 err_console = Console(stderr=True)
 
@@ -197,6 +206,43 @@ def show_external_plugins_callback(value: bool):
         raise typer.Exit()
 
 
+def _write_atomically(
+    fname: Path, write: Callable[[Path], None], previous: Optional[Future] = None
+) -> None:
+    """Write a file through a temporary file renamed into place.
+
+    A partially written file is thus never visible. The write waits for the
+    `previous` write of the same file, so the last submitted one wins.
+    """
+    if previous is not None:
+        wait([previous])
+    tmp = fname.with_name(f".{fname.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, fname)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _save_split_page_html_with_layout(
+    conv_res: ConversionResult, filename: Path, image_mode: ImageRefMode
+) -> None:
+    ser = HTMLDocSerializer(
+        doc=conv_res.document,
+        params=HTMLParams(
+            image_mode=image_mode,
+            output_style=HTMLOutputStyle.SPLIT_PAGE,
+        ),
+    )
+    visualizer = LayoutVisualizer()
+    visualizer.params.show_label = False
+    ser_res = ser.serialize(
+        visualizer=visualizer,
+    )
+    with open(filename, "w") as fw:
+        fw.write(ser_res.text)
+
+
 def export_documents(
     conv_results: Iterable[ConversionResult],
     output_dir: Path,
@@ -209,98 +255,162 @@ def export_documents(
     export_txt: bool,
     export_doctags: bool,
     image_export_mode: ImageRefMode,
+    num_workers: Optional[int] = None,
 ):
+    """Write the output files of the converted documents.
+
+    The files are written by a pool of `num_workers` threads (by default
+    `settings.perf.export_concurrency`), while the next documents are being
+    converted. At most `num_workers` documents are waiting to be written, and
+    each output file is replaced atomically.
+    """
+    num_workers = num_workers or settings.perf.export_concurrency
     success_count = 0
     failure_count = 0
 
-    for conv_res in conv_results:
-        if conv_res.status == ConversionStatus.SUCCESS:
-            success_count += 1
-            doc_filename = conv_res.input.file.stem
-
-            # Export JSON format:
-            if export_json:
-                fname = output_dir / f"{doc_filename}.json"
-                _log.info(f"writing JSON output to {fname}")
-                conv_res.document.save_as_json(
-                    filename=fname, image_mode=image_export_mode
-                )
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        pending: deque[list[tuple[Path, Future]]] = deque()
+        last_writes: Dict[Path, Future] = {}
 
-            # Export YAML format:
-            if export_yaml:
-                fname = output_dir / f"{doc_filename}.yaml"
-                _log.info(f"writing YAML output to {fname}")
-                conv_res.document.save_as_yaml(
-                    filename=fname, image_mode=image_export_mode
-                )
+        def submit(fname: Path, write: Callable[[Path], None]) -> tuple[Path, Future]:
+            future = pool.submit(
+                _write_atomically, fname, write, last_writes.get(fname)
+            )
+            last_writes[fname] = future
+            return fname, future
+
+        def wait_oldest() -> None:
+            for fname, future in pending.popleft():
+                future.result()
+                if last_writes.get(fname) is future:
+                    del last_writes[fname]
+
+        for conv_res in conv_results:
+            if conv_res.status == ConversionStatus.SUCCESS:
+                success_count += 1
+                doc = conv_res.document
+                doc_filename = conv_res.input.file.stem
+                # Where save_as_* would put the images of the final file names
+                artifacts_dir = output_dir / f"{doc_filename}_artifacts"
+                writes: list[tuple[Path, Future]] = []
+
+                # Export JSON format:
+                if export_json:
+                    fname = output_dir / f"{doc_filename}.json"
+                    _log.info(f"writing JSON output to {fname}")
+                    writes.append(
+                        submit(
+                            fname,
+                            partial(
+                                doc.save_as_json,
+                                artifacts_dir=artifacts_dir,
+                                image_mode=image_export_mode,
+                            ),
+                        )
+                    )
 
-            # Export HTML format:
-            if export_html:
-                fname = output_dir / f"{doc_filename}.html"
-                _log.info(f"writing HTML output to {fname}")
-                conv_res.document.save_as_html(
-                    filename=fname, image_mode=image_export_mode, split_page_view=False
-                )
+                # Export YAML format:
+                if export_yaml:
+                    fname = output_dir / f"{doc_filename}.yaml"
+                    _log.info(f"writing YAML output to {fname}")
+                    writes.append(
+                        submit(
+                            fname,
+                            partial(
+                                doc.save_as_yaml,
+                                artifacts_dir=artifacts_dir,
+                                image_mode=image_export_mode,
+                            ),
+                        )
+                    )
 
-            # Export HTML format:
-            if export_html_split_page:
-                fname = output_dir / f"{doc_filename}.html"
-                _log.info(f"writing HTML output to {fname}")
-                if show_layout:
-                    ser = HTMLDocSerializer(
-                        doc=conv_res.document,
-                        params=HTMLParams(
-                            image_mode=image_export_mode,
-                            output_style=HTMLOutputStyle.SPLIT_PAGE,
-                        ),
+                # Export HTML format:
+                if export_html:
+                    fname = output_dir / f"{doc_filename}.html"
+                    _log.info(f"writing HTML output to {fname}")
+                    writes.append(
+                        submit(
+                            fname,
+                            partial(
+                                doc.save_as_html,
+                                artifacts_dir=artifacts_dir,
+                                image_mode=image_export_mode,
+                                split_page_view=False,
+                            ),
+                        )
                     )
-                    visualizer = LayoutVisualizer()
-                    visualizer.params.show_label = False
-                    ser_res = ser.serialize(
-                        visualizer=visualizer,
+
+                # Export HTML format:
+                if export_html_split_page:
+                    fname = output_dir / f"{doc_filename}.html"
+                    _log.info(f"writing HTML output to {fname}")
+                    if show_layout:
+                        write: Callable[[Path], None] = partial(
+                            _save_split_page_html_with_layout,
+                            conv_res,
+                            image_mode=image_export_mode,
+                        )
+                    else:
+                        write = partial(
+                            doc.save_as_html,
+                            artifacts_dir=artifacts_dir,
+                            image_mode=image_export_mode,
+                            split_page_view=True,
+                        )
+                    writes.append(submit(fname, write))
+
+                # Export Text format:
+                if export_txt:
+                    fname = output_dir / f"{doc_filename}.txt"
+                    _log.info(f"writing TXT output to {fname}")
+                    writes.append(
+                        submit(
+                            fname,
+                            partial(
+                                doc.save_as_markdown,
+                                strict_text=True,
+                                image_mode=ImageRefMode.PLACEHOLDER,
+                            ),
+                        )
                     )
-                    with open(fname, "w") as fw:
-                        fw.write(ser_res.text)
-                else:
-                    conv_res.document.save_as_html(
-                        filename=fname,
-                        image_mode=image_export_mode,
-                        split_page_view=True,
+
+                # Export Markdown format:
+                if export_md:
+                    fname = output_dir / f"{doc_filename}.md"
+                    _log.info(f"writing Markdown output to {fname}")
+                    writes.append(
+                        submit(
+                            fname,
+                            partial(
+                                doc.save_as_markdown,
+                                artifacts_dir=artifacts_dir,
+                                image_mode=image_export_mode,
+                            ),
+                        )
                     )
 
-            # Export Text format:
-            if export_txt:
-                fname = output_dir / f"{doc_filename}.txt"
-                _log.info(f"writing TXT output to {fname}")
-                conv_res.document.save_as_markdown(
-                    filename=fname,
-                    strict_text=True,
-                    image_mode=ImageRefMode.PLACEHOLDER,
-                )
+                # Export Document Tags format:
+                if export_doctags:
+                    fname = output_dir / f"{doc_filename}.doctags"
+                    _log.info(f"writing Doc Tags output to {fname}")
+                    writes.append(submit(fname, doc.save_as_doctags))
 
-            # Export Markdown format:
-            if export_md:
-                fname = output_dir / f"{doc_filename}.md"
-                _log.info(f"writing Markdown output to {fname}")
-                conv_res.document.save_as_markdown(
-                    filename=fname, image_mode=image_export_mode
-                )
+                pending.append(writes)
+                if len(pending) > num_workers:
+                    wait_oldest()
 
-            # Export Document Tags format:
-            if export_doctags:
-                fname = output_dir / f"{doc_filename}.doctags"
-                _log.info(f"writing Doc Tags output to {fname}")
-                conv_res.document.save_as_doctags(filename=fname)
+            else:
+                _log.warning(f"Document {conv_res.input.file} failed to convert.")
+                if _log.isEnabledFor(logging.INFO):
+                    for err in conv_res.errors:
+                        _log.info(
+                            f"  [Failure Detail] Component: {err.component_type}, "
+                            f"Module: {err.module_name}, Message: {err.error_message}"
+                        )
+                failure_count += 1
 
-        else:
-            _log.warning(f"Document {conv_res.input.file} failed to convert.")
-            if _log.isEnabledFor(logging.INFO):
-                for err in conv_res.errors:
-                    _log.info(
-                        f"  [Failure Detail] Component: {err.component_type}, "
-                        f"Module: {err.module_name}, Message: {err.error_message}"
-                    )
-            failure_count += 1
+        while pending:
+            wait_oldest()
 
     _log.info(
         f"Processed {success_count + failure_count} docs, of which {failure_count} failed"
@@ -313,6 +423,122 @@ def _split_list(raw: Optional[str]) -> Optional[List[str]]:
     return re.split(r"[;,]", raw)
 
 
+def _is_url(source: str) -> bool:
+    try:
+        TypeAdapter(AnyHttpUrl).validate_python(source)
+        return True
+    except ValidationError:
+        return False
+
+
+def _scan_directory(root: Path, suffixes: tuple[str, ...]) -> Iterator[Path]:
+    """Walk a directory tree once, yielding the files ending with a suffix.
+
+    Suffixes are matched case-insensitively. Entries are visited in name order,
+    the files of a directory before its subdirectories. Symlinked directories
+    are followed once.
+    """
+    visited: set[tuple[int, int]] = set()
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            st = os.stat(directory)
+            if (st.st_dev, st.st_ino) in visited:
+                continue
+            visited.add((st.st_dev, st.st_ino))
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as err:
+            _log.warning(f"Cannot scan the directory {directory}: {err}")
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            name = entry.name.lower()
+            if not name.endswith(suffixes):
+                continue
+            if name.startswith("~$") and name.endswith(".docx"):
+                _log.info(f"Ignoring temporary Word file: {entry.path}")
+                continue
+            yield Path(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+def _iter_input_paths(
+    input_sources: List[str],
+    from_formats: List[InputFormat],
+    headers: Optional[Dict[str, str]],
+    workdir: Path,
+) -> Iterator[Path]:
+    """Resolve the CLI sources to the paths of the documents to convert.
+
+    The sources are checked up front, but directories are scanned and URLs are
+    downloaded lazily, while the first documents are converted. Downloads run
+    concurrently, a few sources ahead of the conversion.
+    """
+    sources: List[Union[str, Path]] = []
+    for src in input_sources:
+        if _is_url(src):
+            sources.append(src)
+            continue
+        try:
+            local_path = TypeAdapter(Path).validate_python(src)
+            exists = local_path.exists()
+        except Exception as err:
+            err_console.print(f"[red]Error: Cannot read the input {src}.[/red]")
+            _log.info(err)  # will print more details if verbose is activated
+            raise typer.Abort()
+        if not exists:
+            err_console.print(f"[red]Error: The input file {src} does not exist.[/red]")
+            raise typer.Abort()
+        sources.append(local_path)
+
+    suffixes = tuple(
+        {f".{ext}" for fmt in from_formats for ext in FormatToExtensions[fmt]}
+    )
+    urls = iter([(i, src) for i, src in enumerate(sources) if isinstance(src, str)])
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_DOWNLOADS) as pool:
+        downloads: Dict[int, Future] = {}
+
+        def schedule_downloads() -> None:
+            lookahead = 2 * _MAX_CONCURRENT_DOWNLOADS - len(downloads)
+            for i, url in itertools.islice(urls, max(lookahead, 0)):
+                # One folder per source, as URLs may share a file name
+                downloads[i] = pool.submit(
+                    resolve_source_to_path,
+                    source=url,
+                    headers=headers,
+                    workdir=workdir / str(i),
+                )
+
+        schedule_downloads()
+        for i, source in enumerate(sources):
+            if isinstance(source, Path):
+                if source.is_dir():
+                    yield from _scan_directory(source, suffixes)
+                else:
+                    yield source
+                continue
+
+            try:
+                path = downloads.pop(i).result()
+            except Exception as err:
+                err_console.print(f"[red]Error: Cannot read the input {source}.[/red]")
+                _log.info(err)  # will print more details if verbose is activated
+                raise typer.Abort()
+            schedule_downloads()
+            yield path
+
+
 @app.command(no_args_is_help=True)
 def convert(  # noqa: C901
     input_sources: Annotated[
@@ -557,55 +783,12 @@ def convert(  # noqa: C901
         parsed_headers = headers_t.validate_json(headers)
 
     with tempfile.TemporaryDirectory() as tempdir:
-        input_doc_paths: List[Path] = []
-        for src in input_sources:
-            try:
-                # check if we can fetch some remote url
-                source = resolve_source_to_path(
-                    source=src, headers=parsed_headers, workdir=Path(tempdir)
-                )
-                input_doc_paths.append(source)
-            except FileNotFoundError:
-                err_console.print(
-                    f"[red]Error: The input file {src} does not exist.[/red]"
-                )
-                raise typer.Abort()
-            except IsADirectoryError:
-                # if the input matches to a file or a folder
-                try:
-                    local_path = TypeAdapter(Path).validate_python(src)
-                    if local_path.exists() and local_path.is_dir():
-                        for fmt in from_formats:
-                            for ext in FormatToExtensions[fmt]:
-                                for path in local_path.glob(f"**/*.{ext}"):
-                                    if path.name.startswith("~$") and ext == "docx":
-                                        _log.info(
-                                            f"Ignoring temporary Word file: {path}"
-                                        )
-                                        continue
-                                    input_doc_paths.append(path)
-
-                                for path in local_path.glob(f"**/*.{ext.upper()}"):
-                                    if path.name.startswith("~$") and ext == "docx":
-                                        _log.info(
-                                            f"Ignoring temporary Word file: {path}"
-                                        )
-                                        continue
-                                    input_doc_paths.append(path)
-                    elif local_path.exists():
-                        if not local_path.name.startswith("~$") and ext == "docx":
-                            _log.info(f"Ignoring temporary Word file: {path}")
-                            continue
-                        input_doc_paths.append(local_path)
-                    else:
-                        err_console.print(
-                            f"[red]Error: The input file {src} does not exist.[/red]"
-                        )
-                        raise typer.Abort()
-                except Exception as err:
-                    err_console.print(f"[red]Error: Cannot read the input {src}.[/red]")
-                    _log.info(err)  # will print more details if verbose is activated
-                    raise typer.Abort()
+        input_doc_paths = _iter_input_paths(
+            input_sources,
+            from_formats=from_formats,
+            headers=parsed_headers,
+            workdir=Path(tempdir),
+        )
 
         if to_formats is None:
             to_formats = [OutputFormat.MARKDOWN]
@@ -873,7 +1056,6 @@ def convert(  # noqa: C901
 
         start_time = time.time()
 
-        _log.info(f"paths: {input_doc_paths}")
         conv_results = doc_converter.convert_all(
             input_doc_paths, headers=parsed_headers, raises_on_error=abort_on_error
         )
@@ -35,6 +35,22 @@ class HTMLBackendOptions(BaseBackendOptions):
             "images in an HTML document."
         ),
     )
+    image_fetch_workers: int = Field(
+        8,
+        ge=1,
+        description=(
+            "Number of images of a document fetched and decoded concurrently, when "
+            "fetch_images is set."
+        ),
+    )
+    image_fetch_timeout: float = Field(
+        20.0,
+        gt=0,
+        description=(
+            "Timeout in seconds to connect to a remote image host, and to wait "
+            "for each chunk of its response, when fetch_images is set."
+        ),
+    )
     source_uri: Optional[Union[AnyUrl, PurePath]] = Field(
         None,
         description=(
@@ -48,6 +64,14 @@ class HTMLBackendOptions(BaseBackendOptions):
     infer_furniture: bool = Field(
         True, description="Infer all the content before the first header as furniture."
     )
+    parser: Literal["html.parser", "lxml"] = Field(
+        "html.parser",
+        description=(
+            "The parser building the HTML tree. 'lxml' is several times faster on "
+            "large documents, but may repair malformed HTML differently from the "
+            "default pure-Python 'html.parser'."
+        ),
+    )
 
 
 class MarkdownBackendOptions(BaseBackendOptions):
@@ -75,6 +99,17 @@ class PdfBackendOptions(BaseBackendOptions):
 
     kind: Literal["pdf"] = Field("pdf", exclude=True, repr=False)
     password: Optional[SecretStr] = None
+    render_workers: int = Field(
+        0,
+        ge=0,
+        description=(
+            "Number of worker processes rasterizing pages, each owning its own "
+            "pdfium instance. Page images of all documents are then rendered in "
+            "parallel instead of under the process-wide pdfium lock. 0 renders "
+            "in-process. Workers are spawned, so scripts must guard their entry "
+            "point with `if __name__ == '__main__'`."
+        ),
+    )
 
 
 class MsExcelBackendOptions(BaseBackendOptions):
@@ -88,6 +123,30 @@ class MsExcelBackendOptions(BaseBackendOptions):
             "cells) as TextItem instead of TableItem."
         ),
     )
+    read_only: bool = Field(
+        False,
+        description=(
+            "Stream the workbook with the read-only mode of openpyxl. The sheets "
+            "are read one at a time when converted, keeping only the cell values, "
+            "instead of loading all the cells, styles and images up front. Falls "
+            "back to the full mode if the installed openpyxl cannot stream them."
+        ),
+    )
+    max_cells_per_sheet: Optional[int] = Field(
+        None,
+        gt=0,
+        description=(
+            "Maximum number of non-empty cells converted per sheet. The rows past "
+            "the budget are skipped. None converts all the cells."
+        ),
+    )
+    sheet_names: Optional[list[str]] = Field(
+        None,
+        description=(
+            "Names of the sheets to convert, numbered as pages from 1 in workbook "
+            "order. None converts all the sheets."
+        ),
+    )
 
 
 BackendOptions = Annotated[
@@ -1,4 +1,5 @@
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING, Optional, Type, Union
 
@@ -294,6 +295,90 @@ class ItemAndImageEnrichmentElement(BaseModel):
     image: Image
 
 
+class PageImageCache:
+    """Images of a page by scale, the smaller scales derived from larger ones.
+
+    Images missing at a scale are downscaled from the closest larger image,
+    only scales above all cached ones need to be rendered by the backend. When
+    the images exceed `max_bytes`, the least recently used ones are evicted,
+    except for the largest, from which they can be derived again.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self._images: OrderedDict[float, Image] = OrderedDict()
+
+    def __contains__(self, scale: object) -> bool:
+        return scale in self._images
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __getitem__(self, scale: float) -> Image:
+        self._images.move_to_end(scale)
+        return self._images[scale]
+
+    def __setitem__(self, scale: float, image: Image) -> None:
+        self._images[scale] = image
+        self._images.move_to_end(scale)
+        self._evict()
+
+    def get(self, scale: float, default: Optional[Image] = None) -> Optional[Image]:
+        return self[scale] if scale in self._images else default
+
+    def scales(self) -> list[float]:
+        return sorted(self._images)
+
+    def source_scale(self, scale: float) -> Optional[float]:
+        """Smallest cached scale from which an image at *scale* can be derived."""
+        return min((s for s in self._images if s >= scale), default=None)
+
+    def derive(
+        self, scale: float, size: Optional[tuple[int, int]] = None
+    ) -> Optional[Image]:
+        """Image at *scale*, downscaled to *size* from a larger one if needed."""
+        source_scale = self.source_scale(scale)
+        if source_scale is None:
+            return None
+        if source_scale == scale:
+            return self[scale]
+        source = self[source_scale]
+        if size is None:
+            factor = scale / source_scale
+            size = (round(source.width * factor), round(source.height * factor))
+        image = source.resize(size)
+        self[scale] = image
+        return image
+
+    def retain(self, scales: Iterable[float]) -> None:
+        """Drop the images at all other scales."""
+        keep = set(scales)
+        for scale in list(self._images):
+            if scale not in keep:
+                del self._images[scale]
+
+    def clear(self) -> None:
+        self._images.clear()
+
+    def nbytes(self) -> int:
+        return sum(_image_nbytes(image) for image in self._images.values())
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        largest = max(self._images, default=None)
+        nbytes = self.nbytes()
+        for scale in list(self._images):  # least recently used first
+            if nbytes <= self.max_bytes:
+                break
+            if scale != largest:
+                nbytes -= _image_nbytes(self._images.pop(scale))
+
+
+def _image_nbytes(image: Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
 class Page(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -308,9 +393,10 @@ class Page(BaseModel):
         None  # Internal PDF backend. By default it is cleared during assembling.
     )
     _default_image_scale: float = 1.0  # Default image scale for external usage.
-    _image_cache: dict[
-        float, Image
-    ] = {}  # Cache of images in different scales. By default it is cleared during assembling.
+    _image_cache: PageImageCache = PageImageCache()  # Cache of images in different scales. By default it is cleared during assembling.
+    _content_hash: Optional[str] = (
+        None  # Hash of the page content, set by the page prediction cache.
+    )
 
     @property
     def cells(self) -> list[TextCell]:
@@ -327,28 +413,50 @@ class Page(BaseModel):
         cropbox: Optional[BoundingBox] = None,
     ) -> Optional[Image]:
         if self._backend is None:
-            return self._image_cache.get(scale, None)
+            return self._get_cached_image(scale, cropbox)
 
         if max_size:
             assert self.size is not None
             scale = min(scale, max_size / max(self.size.as_tuple()))
 
-        if scale not in self._image_cache:
-            if cropbox is None:
-                self._image_cache[scale] = self._backend.get_page_image(scale=scale)
-            else:
-                return self._backend.get_page_image(scale=scale, cropbox=cropbox)
+        page_im = self._get_cached_image(scale, cropbox)
+        if page_im is not None:
+            return page_im
+        if cropbox is not None:
+            return self._backend.get_page_image(scale=scale, cropbox=cropbox)
+
+        self._image_cache[scale] = self._backend.get_page_image(scale=scale)
+        return self._image_cache[scale]
 
+    def _get_cached_image(
+        self, scale: float, cropbox: Optional[BoundingBox] = None
+    ) -> Optional[Image]:
+        """Image at *scale* derived from the image cache, None if not cached."""
         if cropbox is None:
-            return self._image_cache[scale]
-        else:
-            page_im = self._image_cache[scale]
-            assert self.size is not None
-            return page_im.crop(
-                cropbox.to_top_left_origin(page_height=self.size.height)
-                .scaled(scale=scale)
-                .as_tuple()
+            size = (
+                (round(self.size.width * scale), round(self.size.height * scale))
+                if self.size is not None
+                else None
+            )
+            return self._image_cache.derive(scale, size)
+
+        source_scale = self._image_cache.source_scale(scale)
+        if source_scale is None:
+            return None
+        assert self.size is not None
+        page_im = self._image_cache[source_scale].crop(
+            cropbox.to_top_left_origin(page_height=self.size.height)
+            .scaled(scale=source_scale)
+            .as_tuple()
+        )
+        if source_scale != scale:
+            page_im = page_im.resize(
+                (
+                    max(1, round(cropbox.width * scale)),
+                    max(1, round(cropbox.height * scale)),
+                )
             )
+        return page_im
 
     @property
     def image(self) -> Optional[Image]:
@@ -416,6 +416,7 @@ class ConversionAssets(BaseModel):
 
 class ConversionResult(ConversionAssets):
     input: InputDocument
+    input_index: Optional[int] = None  # Position of the source in convert_all()
     assembled: AssembledUnit = AssembledUnit()
 
 
@@ -490,13 +491,14 @@ class _DocumentConversionInput(BaseModel):
         formats: list[InputFormat] = []
 
         if isinstance(obj, Path):
-            mime = filetype.guess_mime(str(obj))
+            with obj.open("rb") as f:
+                head = f.read(8192)
+            mime = filetype.guess_mime(head)
             if mime is None:
                 ext = obj.suffix[1:]
                 mime = _DocumentConversionInput._mime_from_extension(ext)
             if mime is None:  # must guess from
-                with obj.open("rb") as f:
-                    content = f.read(1024)  # Read first 1KB
+                content = head[:1024]  # First 1KB
             if mime is not None and mime.lower() == "application/zip":
                 mime_root = "application/vnd.openxmlformats-officedocument"
                 if obj.suffixes[-1].lower() == ".xlsx":
@@ -684,16 +686,22 @@ class _DocumentConversionInput(BaseModel):
         content = obj if isinstance(obj, Path) else obj.stream
         tar: tarfile.TarFile
         member: tarfile.TarInfo
-        with tarfile.open(
-            name=content if isinstance(content, Path) else None,
-            fileobj=content if isinstance(content, BytesIO) else None,
-            mode="r:gz",
-        ) as tar:
-            for member in tar.getmembers():
-                if member.name.endswith(".xml"):
-                    file = tar.extractfile(member)
-                    if file is not None:
-                        content_str = file.read().decode(errors="ignore")
-                        if "http://www.loc.gov/METS/" in content_str:
-                            return "application/mets+xml"
+        try:
+            with tarfile.open(
+                name=content if isinstance(content, Path) else None,
+                fileobj=content if isinstance(content, BytesIO) else None,
+                mode="r|gz",
+            ) as tar:
+                # Iterate the stream lazily, the archive is only decompressed up
+                # to the METS file. Its namespace is declared by the root element.
+                for member in tar:
+                    if member.isfile() and member.name.endswith(".xml"):
+                        file = tar.extractfile(member)
+                        if file is not None:
+                            content_str = file.read(65536).decode(errors="ignore")
+                            if "http://www.loc.gov/METS/" in content_str:
+                                return "application/mets+xml"
+        finally:
+            if isinstance(content, BytesIO):
+                content.seek(0)
         return None
@@ -42,6 +42,7 @@ from docling.datamodel.vlm_model_specs import (
     SMOLDOCLING_TRANSFORMERS as smoldocling_vlm_conversion_options,
     VlmModelType,
 )
+from docling.utils.options_fingerprint import options_fingerprint
 
 _log = logging.getLogger(__name__)
 
@@ -192,6 +193,10 @@ class TesseractCliOcrOptions(OcrOptions):
     psm: Optional[int] = (
         None  # Page Segmentation Mode (0-13), defaults to tesseract's default
     )
+    detect_orientation: bool = True  # Detect the orientation of OCR rectangles. Always on with lang "auto", which detects the script.
+    max_workers: Optional[int] = (
+        None  # Number of concurrent tesseract processes, defaults to the number of CPUs
+    )
 
     model_config = ConfigDict(
         extra="forbid",
@@ -243,6 +248,17 @@ class PictureDescriptionApiOptions(PictureDescriptionBaseOptions):
     params: Dict[str, Any] = {}
     timeout: float = 20
     concurrency: int = 1
+    max_retries: int = 2  # Retries on connection errors and 429/5xx responses
+    retry_backoff: float = 0.5  # Exponential backoff factor between retries, in seconds
+    requests_per_second: Optional[float] = None  # Rate limit of the endpoint
+    image_format: Literal["png", "jpeg", "webp"] = (
+        "png"  # Encoding of the images sent to the API
+    )
+    image_quality: int = 90  # Quality of JPEG and WebP images, from 1 to 100
+    image_max_edge: Optional[int] = (
+        None  # Downscale images to this many pixels on their longest edge
+    )
+    image_grayscale: bool = False  # Send images in grayscale
 
     prompt: str = "Describe this image in a few sentences."
     provenance: str = ""
@@ -340,6 +356,14 @@ class PipelineOptions(BaseOptions):
         ),
     ] = None
 
+    def fingerprint(self) -> str:
+        """Return a stable hash of the options.
+
+        The hash is computed on every call, so that any change of the options,
+        including in-place changes of nested lists and dicts, is reflected.
+        """
+        return options_fingerprint(self)
+
 
 class ConvertPipelineOptions(PipelineOptions):
     """Base convert pipeline options."""
@@ -428,6 +452,22 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
 
     generate_parsed_pages: bool = False
 
+    # Besides the 1.0 image of the layout model, rasterize each page once at the
+    # largest scale needed on every page (images_scale, or the OCR scale with
+    # force_full_page_ocr), and derive the smaller scales by downscaling it.
+    # When the page images exceed page_image_cache_max_bytes, the derived ones
+    # are evicted and derived again on demand.
+    render_page_images_once: bool = True
+    page_image_cache_max_bytes: Optional[int] = None
+
+    # Memoize the OCR, layout and table structure predictions of each page,
+    # keyed by the page content and the model options, in an on-disk cache
+    # shared across documents and runs. The directory defaults to `pages` in
+    # the Docling cache directory.
+    page_prediction_cache: bool = False
+    page_prediction_cache_dir: Optional[Path] = None
+    page_prediction_cache_max_size_bytes: int = 1 << 30
+
     ### Arguments for threaded PDF pipeline with batching and backpressure control
 
     # Batch sizes for different stages
@@ -441,6 +481,17 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
     # Backpressure and queue control
     queue_max_size: int = 100
 
+    # Stage lifecycle: keep the stage threads alive for the lifetime of the
+    # pipeline and multiplex all documents through them by run id, instead of
+    # starting and stopping them on every document.
+    persistent_stages: bool = False
+
+    # Cross-document batching (requires persistent_stages): the layout and table
+    # stages run pages of different documents in one model call. A stage waits
+    # at most batch_flush_deadline_seconds for a batch to fill up.
+    cross_document_batching: bool = False
+    batch_flush_deadline_seconds: float = 0.05
+
 
 class ProcessingPipeline(str, Enum):
     LEGACY = "legacy"
@@ -127,6 +127,17 @@ class ApiVlmOptions(BaseVlmOptions):
     params: Dict[str, Any] = {}
     timeout: float = 60
     concurrency: int = 1
+    max_retries: int = 2  # Retries on connection errors and 429/5xx responses
+    retry_backoff: float = 0.5  # Exponential backoff factor between retries, in seconds
+    requests_per_second: Optional[float] = None  # Rate limit of the endpoint
+    image_format: Literal["png", "jpeg", "webp"] = (
+        "png"  # Encoding of the images sent to the API
+    )
+    image_quality: int = 90  # Quality of JPEG and WebP images, from 1 to 100
+    image_max_edge: Optional[int] = (
+        None  # Downscale images to this many pixels on their longest edge
+    )
+    image_grayscale: bool = False  # Send images in grayscale
     response_format: ResponseFormat
 
     stop_strings: List[str] = []
@@ -1,6 +1,6 @@
 import sys
 from pathlib import Path
-from typing import Annotated, Optional, Tuple
+from typing import Annotated, Literal, Optional, Tuple
 
 from pydantic import BaseModel, PlainValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,13 +26,25 @@ class DocumentLimits(BaseModel):
 
 
 class BatchConcurrencySettings(BaseModel):
-    doc_batch_size: int = 1  # Number of documents processed in one batch. Should be >= doc_batch_concurrency
+    doc_batch_size: int = 1  # Number of documents in flight when converting concurrently. Should be >= doc_batch_concurrency
     doc_batch_concurrency: int = 1  # Number of parallel threads processing documents. Warning: Experimental! No benefit expected without free-threaded python.
+    doc_batch_executor: Literal["thread", "process"] = (
+        "thread"  # Run parallel documents in threads or in worker processes, each holding its own pipelines.
+    )
+    doc_hash_method: Literal["sha256", "xxh3", "size_mtime"] = (
+        "sha256"  # Hash identifying input documents. xxh3 is faster (requires xxhash), size_mtime skips reading files and keys them by path, size and modification time.
+    )
+    image_cache_max_bytes: int = (
+        128
+        * 1024
+        * 1024  # Memory for the images fetched by the HTML and Markdown backends, shared across documents. 0 disables the cache.
+    )
     page_batch_size: int = 4  # Number of pages processed in one batch.
     page_batch_concurrency: int = 1  # Currently unused.
     elements_batch_size: int = (
         16  # Number of elements processed in one batch, in enrichment models.
     )
+    export_concurrency: int = 4  # Number of threads writing the output files of the CLI, overlapping with the conversion.
 
     # To force models into single core: export OMP_NUM_THREADS=1
 
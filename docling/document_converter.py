@@ -1,16 +1,26 @@
 import hashlib
 import logging
+import multiprocessing
 import sys
 import threading
 import time
 import warnings
+from collections import deque
 from collections.abc import Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime
 from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Type, Union
+from typing import Any, Callable, Optional, Type, Union
 
 from pydantic import ConfigDict, model_validator, validate_call
 from typing_extensions import Self
@@ -51,10 +61,12 @@ from docling.datamodel.document import (
     ConversionResult,
     InputDocument,
     _DocumentConversionInput,
+    _DummyBackend,
 )
 from docling.datamodel.pipeline_options import PipelineOptions
 from docling.datamodel.settings import (
     DEFAULT_PAGE_RANGE,
+    AppSettings,
     DocumentLimits,
     PageRange,
     settings,
@@ -64,7 +76,7 @@ from docling.pipeline.asr_pipeline import AsrPipeline
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
-from docling.utils.utils import chunkify
+from docling.utils.cache import ConversionResultCache
 
 _log = logging.getLogger(__name__)
 _PIPELINE_CACHE_LOCK = threading.Lock()
@@ -199,6 +211,7 @@ class DocumentConverter:
         self,
         allowed_formats: Optional[list[InputFormat]] = None,
         format_options: Optional[dict[InputFormat, FormatOption]] = None,
+        result_cache: Optional[ConversionResultCache] = None,
     ) -> None:
         """Initialize the converter based on format preferences.
 
@@ -206,6 +219,9 @@ class DocumentConverter:
             allowed_formats: List of allowed input formats. By default, any
                 format supported by Docling is allowed.
             format_options: Dictionary of format-specific options.
+            result_cache: Optional cache of conversion results. Documents
+                converted before with the same options are then loaded from
+                the cache instead of running their pipeline.
         """
         self.allowed_formats: list[InputFormat] = (
             allowed_formats if allowed_formats is not None else list(InputFormat)
@@ -247,6 +263,12 @@ class DocumentConverter:
         self.initialized_pipelines: dict[
             tuple[Type[BasePipeline], str], BasePipeline
         ] = {}
+        self._pipeline_futures: dict[
+            tuple[Type[BasePipeline], str], Future[BasePipeline]
+        ] = {}
+        self.result_cache = result_cache
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
 
     def _get_initialized_pipelines(
         self,
@@ -255,10 +277,7 @@ class DocumentConverter:
 
     def _get_pipeline_options_hash(self, pipeline_options: PipelineOptions) -> str:
         """Generate a hash of pipeline options to use as part of the cache key."""
-        options_str = str(pipeline_options.model_dump())
-        return hashlib.md5(
-            options_str.encode("utf-8"), usedforsecurity=False
-        ).hexdigest()
+        return pipeline_options.fingerprint()
 
     def initialize_pipeline(self, format: InputFormat):
         """Initialize the conversion pipeline for the selected format.
@@ -280,6 +299,33 @@ class DocumentConverter:
                 f"No pipeline could be initialized for format {format}"
             )
 
+    def warmup(
+        self,
+        formats: Optional[Iterable[InputFormat]] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize the pipelines of several formats in parallel.
+
+        Services can call this at start-up, so that the first documents do not
+        wait for model loading. Formats sharing a pipeline class and options
+        share a single pipeline instance.
+
+        Args:
+            formats: The input formats to initialize pipelines for. By default,
+                all allowed formats.
+            max_workers: Maximum number of pipelines initialized concurrently.
+
+        Raises:
+            ConversionError: If no pipeline could be initialized for one of the
+                formats.
+        """
+        formats = list(formats) if formats is not None else self.allowed_formats
+        if not formats:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or len(formats)) as pool:
+            for _ in pool.map(self.initialize_pipeline, formats):
+                pass
+
     @validate_call(config=ConfigDict(strict=True))
     def convert(
         self,
@@ -333,6 +379,7 @@ class DocumentConverter:
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
         page_range: PageRange = DEFAULT_PAGE_RANGE,
+        ordered: bool = True,
     ) -> Iterator[ConversionResult]:
         """Convert multiple documents from file paths, URLs, or DocumentStreams.
 
@@ -346,6 +393,10 @@ class DocumentConverter:
             max_file_size: Maximum number of pages accepted per document. Documents
                 exceeding this number will be skipped.
             page_range: Range of pages to convert in each document.
+            ordered: Whether to yield the results in input order. If False and
+                documents are converted concurrently, results are yielded as
+                soon as they complete; their `input_index` gives the position
+                of their source in `source`.
 
         Yields:
             The conversion results, each containing a `DoclingDocument` in the
@@ -362,7 +413,9 @@ class DocumentConverter:
         conv_input = _DocumentConversionInput(
             path_or_stream_iterator=source, limits=limits, headers=headers
         )
-        conv_res_iter = self._convert(conv_input, raises_on_error=raises_on_error)
+        conv_res_iter = self._convert(
+            conv_input, raises_on_error=raises_on_error, ordered=ordered
+        )
 
         had_result = False
         for conv_res in conv_res_iter:
@@ -437,43 +490,165 @@ class DocumentConverter:
         else:
             raise ValueError(f"format {format} is not supported in `convert_string`")
 
-    def _convert(
-        self, conv_input: _DocumentConversionInput, raises_on_error: bool
+    def shutdown(self) -> None:
+        """Stop the worker processes of the process-based batch executor.
+
+        Only needed with `settings.perf.doc_batch_executor = "process"`. The
+        workers are started again on the next conversion.
+        """
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                _log.info(
+                    f"Starting {settings.perf.doc_batch_concurrency} conversion "
+                    "worker processes"
+                )
+                # spawn: forking after models were loaded or threads were started
+                # is unsafe for torch, onnxruntime and pdfium alike.
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=settings.perf.doc_batch_concurrency,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_conversion_worker,
+                    initargs=(
+                        self.allowed_formats,
+                        self.format_to_options,
+                        self.result_cache,
+                        settings,
+                    ),
+                )
+            return self._process_pool
+
+    def _reset_process_pool(self) -> None:
+        with self._process_pool_lock:
+            broken_pool, self._process_pool = self._process_pool, None
+        if broken_pool is not None:
+            broken_pool.shutdown(wait=False)
+
+    def _convert_in_processes(
+        self,
+        conv_input: _DocumentConversionInput,
+        raises_on_error: bool,
+        ordered: bool = True,
     ) -> Iterator[ConversionResult]:
-        start_time = time.monotonic()
-
-        for input_batch in chunkify(
-            conv_input.docs(self.format_to_options),
-            settings.perf.doc_batch_size,  # pass format_options
-        ):
-            _log.info("Going to convert document batch...")
-            process_func = partial(
-                self._process_document, raises_on_error=raises_on_error
-            )
+        """Convert the input documents in a pool of worker processes.
 
-            if (
-                settings.perf.doc_batch_concurrency > 1
-                and settings.perf.doc_batch_size > 1
-            ):
-                with ThreadPoolExecutor(
-                    max_workers=settings.perf.doc_batch_concurrency
-                ) as pool:
-                    for item in pool.map(
-                        process_func,
-                        input_batch,
-                    ):
-                        yield item
-            else:
-                for item in map(
-                    process_func,
-                    input_batch,
-                ):
-                    elapsed = time.monotonic() - start_time
-                    start_time = time.monotonic()
-                    _log.info(
-                        f"Finished converting document {item.input.file.name} in {elapsed:.2f} sec."
+        Sources are sent as paths, URLs or byte buffers, so format detection,
+        backend parsing and the whole pipeline run in the workers. A document
+        crashing its worker process only fails this document: the documents in
+        flight with it are rerun one at a time in a fresh pool.
+        """
+
+        def submit(item: Union[Path, str, DocumentStream]) -> Future:
+            try:
+                return self._get_process_pool().submit(
+                    _convert_in_worker,
+                    item,
+                    conv_input.headers,
+                    conv_input.limits,
+                    raises_on_error,
+                )
+            except BrokenProcessPool as e:
+                # The pool broke before its failure was seen in a result
+                future: Future = Future()
+                future.set_exception(e)
+                return future
+
+        queue = _RollingQueue(
+            conv_input.path_or_stream_iterator,
+            submit=submit,
+            window=max(
+                settings.perf.doc_batch_size, settings.perf.doc_batch_concurrency
+            ),
+            ordered=ordered,
+        )
+        for sub in queue:
+            try:
+                conv_res = sub.future.result()
+            except BrokenProcessPool as e:
+                if sub.attempt > 0:
+                    if raises_on_error:
+                        raise ConversionError(
+                            f"Worker process crashed while converting {sub.item}"
+                        ) from e
+                    conv_res = _failed_conversion_result(
+                        conv_input, sub.item, f"Worker process crashed: {e}"
                     )
-                    yield item
+                else:
+                    # Which document crashed the pool is unknown, so every
+                    # document lost with it is rerun alone in a fresh pool.
+                    self._reset_process_pool()
+                    lost = [sub] + [
+                        other
+                        for other in queue.in_flight
+                        if isinstance(other.future.exception(), BrokenProcessPool)
+                    ]
+                    for lost_sub in lost:
+                        lost_sub.future = submit(lost_sub.item)
+                        lost_sub.attempt += 1
+                        if isinstance(lost_sub.future.exception(), BrokenProcessPool):
+                            self._reset_process_pool()
+                    queue.requeue(sub)
+                    continue
+            except Exception as e:
+                if raises_on_error:
+                    raise
+                conv_res = _failed_conversion_result(conv_input, sub.item, str(e))
+
+            conv_res.input_index = sub.index
+            yield conv_res
+
+    def _convert(
+        self,
+        conv_input: _DocumentConversionInput,
+        raises_on_error: bool,
+        ordered: bool = True,
+    ) -> Iterator[ConversionResult]:
+        parallel = (
+            settings.perf.doc_batch_concurrency > 1 and settings.perf.doc_batch_size > 1
+        )
+        if parallel and settings.perf.doc_batch_executor == "process":
+            yield from self._convert_in_processes(
+                conv_input, raises_on_error=raises_on_error, ordered=ordered
+            )
+            return
+
+        process_func = partial(self._process_document, raises_on_error=raises_on_error)
+
+        if parallel:
+            # A rolling window of documents in flight: a new document starts as
+            # soon as any finishes, so a long document never idles the others.
+            with ThreadPoolExecutor(
+                max_workers=settings.perf.doc_batch_concurrency
+            ) as pool:
+                queue = _RollingQueue(
+                    conv_input.docs(self.format_to_options),
+                    submit=partial(pool.submit, process_func),
+                    window=max(
+                        settings.perf.doc_batch_size,
+                        settings.perf.doc_batch_concurrency,
+                    ),
+                    ordered=ordered,
+                )
+                for sub in queue:
+                    conv_res = sub.future.result()
+                    conv_res.input_index = sub.index
+                    yield conv_res
+        else:
+            start_time = time.monotonic()
+            for index, in_doc in enumerate(conv_input.docs(self.format_to_options)):
+                conv_res = process_func(in_doc)
+                conv_res.input_index = index
+                elapsed = time.monotonic() - start_time
+                start_time = time.monotonic()
+                _log.info(
+                    f"Finished converting document {conv_res.input.file.name} in {elapsed:.2f} sec."
+                )
+                yield conv_res
 
     def _get_pipeline(self, doc_format: InputFormat) -> Optional[BasePipeline]:
         """Retrieve or initialize a pipeline, reusing instances based on class and options."""
@@ -489,20 +664,83 @@ class DocumentConverter:
         # Use a composite key to cache pipelines
         cache_key = (pipeline_class, options_hash)
 
+        pipeline = self.initialized_pipelines.get(cache_key)
+        if pipeline is not None:
+            _log.debug(
+                f"Reusing cached pipeline for {pipeline_class.__name__} with options hash {options_hash}"
+            )
+            return pipeline
+
+        # The lock only guards the registry. Pipelines are built outside of it,
+        # other threads asking for the same pipeline wait on its future.
         with _PIPELINE_CACHE_LOCK:
-            if cache_key not in self.initialized_pipelines:
-                _log.info(
-                    f"Initializing pipeline for {pipeline_class.__name__} with options hash {options_hash}"
-                )
-                self.initialized_pipelines[cache_key] = pipeline_class(
-                    pipeline_options=pipeline_options
-                )
-            else:
-                _log.debug(
-                    f"Reusing cached pipeline for {pipeline_class.__name__} with options hash {options_hash}"
-                )
+            future = self._pipeline_futures.get(cache_key)
+            is_builder = future is None
+            if future is None:
+                future = Future()
+                self._pipeline_futures[cache_key] = future
+
+        if not is_builder:
+            return future.result()
+
+        _log.info(
+            f"Initializing pipeline for {pipeline_class.__name__} with options hash {options_hash}"
+        )
+        try:
+            pipeline = pipeline_class(pipeline_options=pipeline_options)
+        except BaseException as e:
+            # Let the next call try again
+            with _PIPELINE_CACHE_LOCK:
+                del self._pipeline_futures[cache_key]
+            future.set_exception(e)
+            raise
+        self.initialized_pipelines[cache_key] = pipeline
+        future.set_result(pipeline)
+        return pipeline
+
+    def _get_result_cache_key(self, in_doc: InputDocument) -> Optional[str]:
+        """Key of the conversion result of `in_doc` in the result cache."""
+        if self.result_cache is None:
+            return None
+        fopt = self.format_to_options.get(in_doc.format)
+        if fopt is None or fopt.pipeline_options is None:
+            return None
+
+        # Everything besides the input content which shapes the result
+        options_str = str(
+            (
+                fopt.pipeline_cls.__module__,
+                fopt.pipeline_cls.__qualname__,
+                fopt.backend.__module__,
+                fopt.backend.__qualname__,
+                self._get_pipeline_options_hash(fopt.pipeline_options),
+                in_doc.backend_options.model_dump()
+                if in_doc.backend_options is not None
+                else None,
+                in_doc.limits.page_range,
+            )
+        )
+        options_hash = hashlib.md5(
+            options_str.encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+        return ConversionResultCache.make_key(in_doc.document_hash, options_hash)
+
+    def _load_cached_result(
+        self, in_doc: InputDocument, cache_key: str
+    ) -> Optional[ConversionResult]:
+        assert self.result_cache is not None
+        assets = self.result_cache.load(cache_key)
+        if assets is None:
+            return None
 
-            return self.initialized_pipelines[cache_key]
+        _log.info(f"Loaded cached conversion result of {in_doc.file.name}")
+        conv_res = ConversionResult(input=in_doc, **dict(assets))
+        # The same content may have been converted under another name
+        if conv_res.document.origin is not None:
+            conv_res.document.origin.filename = in_doc.file.name
+            conv_res.document.name = in_doc.file.stem or conv_res.document.name
+        in_doc._backend.unload()
+        return conv_res
 
     def _process_document(
         self, in_doc: InputDocument, raises_on_error: bool
@@ -532,9 +770,21 @@ class DocumentConverter:
         self, in_doc: InputDocument, raises_on_error: bool
     ) -> ConversionResult:
         if in_doc.valid:
+            cache_key = self._get_result_cache_key(in_doc)
+            if cache_key is not None and (
+                cached_res := self._load_cached_result(in_doc, cache_key)
+            ):
+                return cached_res
+
             pipeline = self._get_pipeline(in_doc.format)
             if pipeline is not None:
                 conv_res = pipeline.execute(in_doc, raises_on_error=raises_on_error)
+                if cache_key is not None and conv_res.status in {
+                    ConversionStatus.SUCCESS,
+                    ConversionStatus.PARTIAL_SUCCESS,
+                }:
+                    assert self.result_cache is not None
+                    self.result_cache.save(cache_key, conv_res)
             else:
                 if raises_on_error:
                     raise ConversionError(
@@ -557,3 +807,139 @@ class DocumentConverter:
                 # TODO add error log why it failed.
 
         return conv_res
+
+
+@dataclass
+class _Submission:
+    index: int
+    item: Any
+    future: Future
+    attempt: int = 0
+
+
+class _RollingQueue:
+    """Keep up to `window` submissions in flight, refilling as each completes.
+
+    Iterating yields the completed submissions, in input order if `ordered`,
+    otherwise as soon as they complete.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        submit: Callable[[Any], Future],
+        window: int,
+        ordered: bool = True,
+    ):
+        self._items = enumerate(items)
+        self._submit = submit
+        self._window = window
+        self._ordered = ordered
+        self.in_flight: deque[_Submission] = deque()
+
+    def requeue(self, sub: _Submission) -> None:
+        """Put a yielded submission back, ahead of the ones in flight."""
+        self.in_flight.appendleft(sub)
+
+    def _fill(self) -> None:
+        while len(self.in_flight) < self._window:
+            try:
+                index, item = next(self._items)
+            except StopIteration:
+                return
+            self.in_flight.append(
+                _Submission(index=index, item=item, future=self._submit(item))
+            )
+
+    def __iter__(self) -> Iterator[_Submission]:
+        self._fill()
+        while self.in_flight:
+            if self._ordered:
+                sub = self.in_flight.popleft()
+                wait([sub.future])
+            else:
+                done, _ = wait(
+                    [s.future for s in self.in_flight], return_when=FIRST_COMPLETED
+                )
+                sub = next(s for s in self.in_flight if s.future in done)
+                self.in_flight.remove(sub)
+            self._fill()
+            yield sub
+
+
+# Converter of a worker process of the process-based batch executor.
+_worker_converter: Optional[DocumentConverter] = None
+
+
+def _init_conversion_worker(
+    allowed_formats: list[InputFormat],
+    format_options: dict[InputFormat, FormatOption],
+    result_cache: Optional[ConversionResultCache],
+    parent_settings: AppSettings,
+) -> None:
+    global _worker_converter
+
+    # Spawned workers start from the environment, carry over runtime changes.
+    for name in type(settings).model_fields:
+        setattr(settings, name, getattr(parent_settings, name))
+    settings.perf.doc_batch_executor = "thread"
+
+    _worker_converter = DocumentConverter(
+        allowed_formats=allowed_formats,
+        format_options=format_options,
+        result_cache=result_cache,
+    )
+
+
+def _convert_in_worker(
+    item: Union[Path, str, DocumentStream],
+    headers: Optional[dict[str, str]],
+    limits: Optional[DocumentLimits],
+    raises_on_error: bool,
+) -> ConversionResult:
+    assert _worker_converter is not None, "Conversion worker not initialized"
+    conv_input = _DocumentConversionInput(
+        path_or_stream_iterator=[item], limits=limits, headers=headers
+    )
+    in_doc = next(iter(conv_input.docs(_worker_converter.format_to_options)))
+    conv_res = _worker_converter._process_document(
+        in_doc, raises_on_error=raises_on_error
+    )
+
+    # Backends hold native parser handles, which cannot be sent back to the
+    # parent process. They are unloaded once the pipeline is done anyway.
+    for page in conv_res.pages:
+        page._backend = None
+    conv_res.input._backend = _DummyBackend(conv_res.input, path_or_stream=BytesIO())
+    conv_res.input._backend.unload()
+    return conv_res
+
+
+def _failed_conversion_result(
+    conv_input: _DocumentConversionInput,
+    item: Union[Path, str, DocumentStream],
+    error_message: str,
+) -> ConversionResult:
+    """Result for a document whose conversion failed outside of its pipeline."""
+    if isinstance(item, str):
+        name = item.rsplit("/", 1)[-1] or item
+        format = None
+    else:
+        name = item.name
+        format = conv_input._guess_format(item)
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(),
+        format=format,  # type: ignore[arg-type]
+        backend=_DummyBackend,
+        filename=name,
+        limits=conv_input.limits,
+    )
+    in_doc.valid = False
+    error_item = ErrorItem(
+        component_type=DoclingComponentType.USER_INPUT,
+        module_name="",
+        error_message=error_message,
+    )
+    return ConversionResult(
+        input=in_doc, status=ConversionStatus.FAILURE, errors=[error_item]
+    )
@@ -336,7 +336,7 @@ class ThreadedLayoutVlmPipeline(BasePipeline):
         for p in pages_to_remove:
             if p._backend is not None:
                 p._backend.unload()
-            p._image_cache = {}
+            p._image_cache.clear()
             # Clean up parsed_page if it exists (it's Optional[SegmentedPdfPage])
             if p.parsed_page is not None:
                 del p.parsed_page
@@ -345,7 +345,7 @@ class ThreadedLayoutVlmPipeline(BasePipeline):
         # Clean up images if not needed for remaining pages
         if not self.pipeline_options.generate_page_images:
             for p in conv_res.pages:
-                p._image_cache = {}
+                p._image_cache.clear()
 
     def _assemble_document(self, conv_res: ConversionResult) -> ConversionResult:
         """Assemble final document from VLM predictions."""
@@ -11,9 +11,11 @@ from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions
 from docling.exceptions import OperationNotAllowed
 from docling.models.base_model import BaseVlmPageModel
 from docling.models.utils.generation_utils import GenerationStopper
+from docling.utils.api_client import get_api_client
 from docling.utils.api_image_request import (
     api_image_request,
     api_image_request_streaming,
+    encode_image,
 )
 from docling.utils.profiling import TimeRecorder
 
@@ -44,6 +46,24 @@ class ApiVlmModel(BaseVlmPageModel):
                 **self.vlm_options.params,
                 "temperature": self.vlm_options.temperature,
             }
+            self.client = get_api_client(
+                str(self.vlm_options.url),
+                max_connections=self.concurrency,
+                max_retries=self.vlm_options.max_retries,
+                backoff_factor=self.vlm_options.retry_backoff,
+                requests_per_second=self.vlm_options.requests_per_second,
+            )
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="api_vlm"
+            )
+            self._encoder = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="api_vlm_encode"
+            )
+
+    def __del__(self):
+        if hasattr(self, "_executor"):
+            self._executor.shutdown(wait=False)
+            self._encoder.shutdown(wait=False)
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -112,25 +132,9 @@ class ApiVlmModel(BaseVlmPageModel):
                 )
             prompts = prompt
 
-        def _process_single_image(image_prompt_pair):
-            image, prompt_text = image_prompt_pair
-
-            # Convert numpy array to PIL Image if needed
-            if isinstance(image, np.ndarray):
-                if image.ndim == 3 and image.shape[2] in [3, 4]:
-                    from PIL import Image as PILImage
-
-                    image = PILImage.fromarray(image.astype(np.uint8))
-                elif image.ndim == 2:
-                    from PIL import Image as PILImage
-
-                    image = PILImage.fromarray(image.astype(np.uint8), mode="L")
-                else:
-                    raise ValueError(f"Unsupported numpy array shape: {image.shape}")
-
-            # Ensure image is in RGB mode
-            if image.mode != "RGB":
-                image = image.convert("RGB")
+        def _process_single_image(encoded_prompt_pair):
+            encoded, prompt_text = encoded_prompt_pair
+            image = encoded.result()
 
             stop_reason = VlmStopReason.UNSPECIFIED
 
@@ -154,6 +158,7 @@ class ApiVlmModel(BaseVlmPageModel):
                     timeout=self.timeout,
                     headers=self.vlm_options.headers,
                     generation_stoppers=instantiated_stoppers,
+                    client=self.client,
                     **self.params,
                 )
             else:
@@ -164,6 +169,7 @@ class ApiVlmModel(BaseVlmPageModel):
                     url=self.vlm_options.url,
                     timeout=self.timeout,
                     headers=self.vlm_options.headers,
+                    client=self.client,
                     **self.params,
                 )
 
@@ -176,5 +182,28 @@ class ApiVlmModel(BaseVlmPageModel):
                 input_prompt=input_prompt,
             )
 
-        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            yield from executor.map(_process_single_image, zip(images, prompts))
+        # Encode the images ahead, while the requests of the previous ones are in flight
+        encoded = [self._encoder.submit(self._encode_image, image) for image in images]
+        yield from self._executor.map(_process_single_image, zip(encoded, prompts))
+
+    def _encode_image(self, image: Union[Image, np.ndarray]) -> str:
+        # Convert numpy array to PIL Image if needed
+        if isinstance(image, np.ndarray):
+            if image.ndim == 3 and image.shape[2] in [3, 4]:
+                from PIL import Image as PILImage
+
+                image = PILImage.fromarray(image.astype(np.uint8))
+            elif image.ndim == 2:
+                from PIL import Image as PILImage
+
+                image = PILImage.fromarray(image.astype(np.uint8), mode="L")
+            else:
+                raise ValueError(f"Unsupported numpy array shape: {image.shape}")
+
+        return encode_image(
+            image,
+            self.vlm_options.image_format,
+            quality=self.vlm_options.image_quality,
+            max_edge=self.vlm_options.image_max_edge,
+            grayscale=self.vlm_options.image_grayscale,
+        )
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any, Generic, Optional, Protocol, Type, Union
 
 import numpy as np
@@ -42,6 +42,32 @@ class BasePageModel(ABC):
     ) -> Iterable[Page]:
         pass
 
+    def process_pages(
+        self, batch: Sequence[tuple[ConversionResult, Page]]
+    ) -> Iterable[Page]:
+        """Process pages which may belong to different documents.
+
+        Pages are returned in input order. The default implementation calls the
+        model once per document; models which can run pages of several documents
+        in a single inference call override it.
+        """
+        processed: list[Optional[Page]] = [None] * len(batch)
+        doc_groups: dict[int, list[int]] = {}
+        for idx, (conv_res, _) in enumerate(batch):
+            doc_groups.setdefault(id(conv_res), []).append(idx)
+
+        for indices in doc_groups.values():
+            conv_res = batch[indices[0]][0]
+            pages = list(self(conv_res, [batch[i][1] for i in indices]))
+            if len(pages) != len(indices):
+                raise RuntimeError(
+                    f"Model {self.__class__.__name__} returned wrong number of pages"
+                )
+            for idx, page in zip(indices, pages):
+                processed[idx] = page
+
+        return [page for page in processed if page is not None]
+
 
 class BaseVlmModel(ABC):
     """Base class for Vision-Language Models that adds image processing capability."""
@@ -5,10 +5,9 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Type
 
-import numpy as np
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 from rtree import index
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
@@ -17,6 +16,7 @@ from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import OcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BaseModelWithOptions, BasePageModel
+from docling.utils.ocr_utils import find_ocr_rects
 
 _log = logging.getLogger(__name__)
 
@@ -30,61 +30,23 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
         options: OcrOptions,
         accelerator_options: AcceleratorOptions,
     ):
-        # Make sure any delay/error from import occurs on ocr model init and not first use
-        from scipy.ndimage import binary_dilation, find_objects, label
-
         self.enabled = enabled
         self.options = options
 
     # Computes the optimum amount and coordinates of rectangles to OCR on a given page
     def get_ocr_rects(self, page: Page) -> List[BoundingBox]:
-        from scipy.ndimage import binary_dilation, find_objects, label
-
         BITMAP_COVERAGE_TRESHOLD = 0.75
         assert page.size is not None
 
-        def find_ocr_rects(size, bitmap_rects):
-            image = Image.new(
-                "1", (round(size.width), round(size.height))
-            )  # '1' mode is binary
-
-            # Draw all bitmap rects into a binary image
-            draw = ImageDraw.Draw(image)
-            for rect in bitmap_rects:
-                x0, y0, x1, y1 = rect.as_tuple()
-                x0, y0, x1, y1 = round(x0), round(y0), round(x1), round(y1)
-                draw.rectangle([(x0, y0), (x1, y1)], fill=1)
-
-            np_image = np.array(image)
-
-            # Dilate the image by 10 pixels to merge nearby bitmap rectangles
-            structure = np.ones(
-                (20, 20)
-            )  # Create a 20x20 structure element (10 pixels in all directions)
-            np_image = binary_dilation(np_image > 0, structure=structure)
-
-            # Find the connected components
-            labeled_image, num_features = label(
-                np_image > 0
-            )  # Label black (0 value) regions
-
-            # Find enclosing bounding boxes for each connected component.
-            slices = find_objects(labeled_image)
-            bounding_boxes = [
-                BoundingBox(
-                    l=slc[1].start,
-                    t=slc[0].start,
-                    r=slc[1].stop - 1,
-                    b=slc[0].stop - 1,
-                    coord_origin=CoordOrigin.TOPLEFT,
-                )
-                for slc in slices
-            ]
-
-            # Compute area fraction on page covered by bitmaps
-            area_frac = np.sum(np_image > 0) / (size.width * size.height)
-
-            return (area_frac, bounding_boxes)  # fraction covered  # boxes
+        full_page_rect = BoundingBox(
+            l=0,
+            t=0,
+            r=page.size.width,
+            b=page.size.height,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        if self.options.force_full_page_ocr:
+            return [full_page_rect]
 
         if page._backend is not None:
             bitmap_rects = page._backend.get_bitmap_rects()
@@ -93,18 +55,8 @@ class BaseOcrModel(BasePageModel, BaseModelWithOptions):
         coverage, ocr_rects = find_ocr_rects(page.size, bitmap_rects)
 
         # return full-page rectangle if page is dominantly covered with bitmaps
-        if self.options.force_full_page_ocr or coverage > max(
-            BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold
-        ):
-            return [
-                BoundingBox(
-                    l=0,
-                    t=0,
-                    r=page.size.width,
-                    b=page.size.height,
-                    coord_origin=CoordOrigin.TOPLEFT,
-                )
-            ]
+        if coverage > max(BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold):
+            return [full_page_rect]
         # return individual rectangles if the bitmap coverage is above the threshold
         elif coverage > self.options.bitmap_area_threshold:
             return ocr_rects
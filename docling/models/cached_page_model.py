@@ -0,0 +1,235 @@
+"""Memoization of page model predictions across runs and documents.
+
+A :class:`CachedPageModel` wraps the OCR, layout or table structure model of a
+pipeline. Pages are identified by a hash of their content, i.e. their rendered
+image and their programmatic text cells, taken before any model modified them.
+On a hit the stored outputs are applied to the page and the model is skipped,
+so re-running a corpus with other enrichment or export options, or converting
+recurring cover pages, no longer runs inference on known pages.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from typing import Generic, Optional, TypeVar
+
+from docling_core.types.doc.page import TextCell
+from pydantic import BaseModel, ConfigDict
+
+from docling.datamodel.base_models import (
+    LayoutPrediction,
+    Page,
+    TableStructurePrediction,
+)
+from docling.datamodel.document import ConversionResult, DoclingVersion
+from docling.models.base_model import BasePageModel
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.utils.cache import PagePredictionCache
+
+EntryT = TypeVar("EntryT", bound=BaseModel)
+
+
+def page_content_hash(page: Page) -> Optional[str]:
+    """Hash of the rendered page and its text cells, None for invalid pages."""
+    if page._content_hash is not None:
+        return page._content_hash
+    if page._backend is None or not page._backend.is_valid():
+        return None
+
+    page_image = page.get_image(scale=1.0)
+    if page_image is None:
+        return None
+
+    hasher = hashlib.sha256(usedforsecurity=False)
+    hasher.update(f"{page_image.mode}{page_image.size}".encode())
+    hasher.update(page_image.tobytes())
+    if page.parsed_page is not None:
+        for cells in (page.parsed_page.textline_cells, page.parsed_page.word_cells):
+            hasher.update(b"\x00")
+            for cell in cells:
+                hasher.update(
+                    f"{cell.text}\x1f{cell.rect.to_bounding_box().as_tuple()}"
+                    f"\x1f{cell.from_ocr}\x1e".encode()
+                )
+
+    page._content_hash = hasher.hexdigest()
+    return page._content_hash
+
+
+def model_fingerprint(
+    model: object, options: Optional[BaseModel], upstream: Sequence[str] = ()
+) -> str:
+    """Fingerprint of a model implementation, its options and Docling versions.
+
+    The *upstream* fingerprints are those of the models producing the inputs of
+    *model*, e.g. the OCR cells seen by the layout model. Since the page hash is
+    taken before any model ran, changing an upstream model must change the keys.
+    """
+    version = DoclingVersion()
+    return "|".join(
+        [
+            type(model).__module__,
+            type(model).__qualname__,
+            options.model_dump_json() if options is not None else "",
+            version.docling_version,
+            version.docling_ibm_models_version,
+            *upstream,
+        ]
+    )
+
+
+def ocr_fingerprint(ocr_model: object, options: Optional[BaseModel]) -> str:
+    """Fingerprint of the OCR step of a pipeline, also when OCR is disabled."""
+    if not getattr(ocr_model, "enabled", True):
+        return "ocr disabled"
+    return model_fingerprint(ocr_model, options)
+
+
+class PageCacheAdapter(ABC, Generic[EntryT]):
+    """Extracts the outputs of a model from a page, and applies them back."""
+
+    entry_type: type[EntryT]
+
+    @abstractmethod
+    def extract(self, conv_res: ConversionResult, page: Page) -> EntryT:
+        pass
+
+    @abstractmethod
+    def apply(self, conv_res: ConversionResult, page: Page, entry: EntryT) -> None:
+        pass
+
+
+class OcrCacheEntry(BaseModel):
+    ocr_cells: list[TextCell]
+
+
+class OcrCacheAdapter(PageCacheAdapter[OcrCacheEntry]):
+    """OCR cells, merged into the page cells again by the OCR model."""
+
+    entry_type = OcrCacheEntry
+
+    def __init__(self, ocr_model: BaseOcrModel):
+        self.ocr_model = ocr_model
+
+    def extract(self, conv_res: ConversionResult, page: Page) -> OcrCacheEntry:
+        return OcrCacheEntry(ocr_cells=[cell for cell in page.cells if cell.from_ocr])
+
+    def apply(
+        self, conv_res: ConversionResult, page: Page, entry: OcrCacheEntry
+    ) -> None:
+        self.ocr_model.post_process_cells(entry.ocr_cells, page)
+
+
+class LayoutCacheEntry(BaseModel):
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
+    layout: LayoutPrediction
+    # The layout postprocessing also updates the page cells and confidences
+    textline_cells: list[TextCell]
+    layout_score: float
+    ocr_score: float
+
+
+class LayoutCacheAdapter(PageCacheAdapter[LayoutCacheEntry]):
+    entry_type = LayoutCacheEntry
+
+    def extract(self, conv_res: ConversionResult, page: Page) -> LayoutCacheEntry:
+        assert page.predictions.layout is not None
+        scores = conv_res.confidence.pages[page.page_no]
+        return LayoutCacheEntry(
+            layout=page.predictions.layout,
+            textline_cells=page.cells,
+            layout_score=scores.layout_score,
+            ocr_score=scores.ocr_score,
+        )
+
+    def apply(
+        self, conv_res: ConversionResult, page: Page, entry: LayoutCacheEntry
+    ) -> None:
+        assert page.parsed_page is not None
+        page.parsed_page.textline_cells = entry.textline_cells
+        page.parsed_page.has_lines = len(entry.textline_cells) > 0
+        page.predictions.layout = entry.layout
+        conv_res.confidence.pages[page.page_no].layout_score = entry.layout_score
+        conv_res.confidence.pages[page.page_no].ocr_score = entry.ocr_score
+
+
+class TableCacheAdapter(PageCacheAdapter[TableStructurePrediction]):
+    entry_type = TableStructurePrediction
+
+    def extract(
+        self, conv_res: ConversionResult, page: Page
+    ) -> TableStructurePrediction:
+        return page.predictions.tablestructure or TableStructurePrediction()
+
+    def apply(
+        self, conv_res: ConversionResult, page: Page, entry: TableStructurePrediction
+    ) -> None:
+        page.predictions.tablestructure = entry
+
+
+class CachedPageModel(BasePageModel, Generic[EntryT]):
+    """Runs *model* only on the pages missing from the prediction cache.
+
+    Args:
+        model: The wrapped page model.
+        cache: The cache shared by all models of the pipeline.
+        adapter: Moves the outputs of *model* between pages and cache entries.
+        fingerprint: Identifies *model* and its options, see
+            :func:`model_fingerprint`.
+    """
+
+    def __init__(
+        self,
+        model: BasePageModel,
+        cache: PagePredictionCache,
+        adapter: PageCacheAdapter[EntryT],
+        fingerprint: str,
+    ):
+        self.model = model
+        self.cache = cache
+        self.adapter = adapter
+        self.fingerprint = fingerprint
+
+    def _key(self, page: Page) -> Optional[str]:
+        content_hash = page_content_hash(page)
+        if content_hash is None:
+            return None
+        return hashlib.sha256(
+            f"{content_hash}|{self.fingerprint}".encode(), usedforsecurity=False
+        ).hexdigest()
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        return self.process_pages([(conv_res, page) for page in page_batch])
+
+    def process_pages(
+        self, batch: Sequence[tuple[ConversionResult, Page]]
+    ) -> Iterable[Page]:
+        processed = [page for _, page in batch]
+        misses: list[tuple[int, Optional[str]]] = []
+        for idx, (conv_res, page) in enumerate(batch):
+            key = self._key(page)
+            entry = (
+                self.cache.load(key, self.adapter.entry_type)
+                if key is not None
+                else None
+            )
+            if entry is not None:
+                self.adapter.apply(conv_res, page, entry)
+            else:
+                misses.append((idx, key))
+
+        if misses:
+            pages = list(self.model.process_pages([batch[idx] for idx, _ in misses]))
+            if len(pages) != len(misses):
+                raise RuntimeError(
+                    f"Model {type(self.model).__name__} returned wrong number of pages"
+                )
+            for (idx, key), page in zip(misses, pages):
+                processed[idx] = page
+                if key is not None:
+                    self.cache.save(key, self.adapter.extract(batch[idx][0], page))
+
+        return processed
@@ -1,7 +1,8 @@
 import copy
 import logging
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -153,15 +154,31 @@ class LayoutModel(BaseLayoutModel):
         self,
         conv_res: ConversionResult,
         pages: Sequence[Page],
+    ) -> Sequence[LayoutPrediction]:
+        return self._predict_layout_pages([(conv_res, page) for page in pages])
+
+    def process_pages(
+        self, batch: Sequence[tuple[ConversionResult, Page]]
+    ) -> Iterable[Page]:
+        # Pages of all documents go through a single predict_batch call.
+        batch = list(batch)
+        predictions = self._predict_layout_pages(batch)
+
+        for (_, page), prediction in zip(batch, predictions):
+            page.predictions.layout = prediction
+            yield page
+
+    def _predict_layout_pages(
+        self,
+        batch: Sequence[tuple[ConversionResult, Page]],
     ) -> Sequence[LayoutPrediction]:
         # Convert to list to ensure predictable iteration
-        pages = list(pages)
+        batch = list(batch)
 
         # Separate valid and invalid pages
-        valid_pages = []
         valid_page_images: List[Union[Image.Image, np.ndarray]] = []
 
-        for page in pages:
+        for _, page in batch:
             assert page._backend is not None
             if not page._backend.is_valid():
                 continue
@@ -170,13 +187,15 @@ class LayoutModel(BaseLayoutModel):
             page_image = page.get_image(scale=1.0)
             assert page_image is not None
 
-            valid_pages.append(page)
             valid_page_images.append(page_image)
 
         # Process all valid pages with batch prediction
         batch_predictions = []
         if valid_page_images:
-            with TimeRecorder(conv_res, "layout"):
+            with ExitStack() as stack:
+                # Record the shared inference time on every involved document
+                for conv_res in {id(c): c for c, _ in batch}.values():
+                    stack.enter_context(TimeRecorder(conv_res, "layout"))
                 batch_predictions = self.layout_predictor.predict_batch(  # type: ignore[attr-defined]
                     valid_page_images
                 )
@@ -184,7 +203,7 @@ class LayoutModel(BaseLayoutModel):
         # Process each page with its predictions
         layout_predictions: list[LayoutPrediction] = []
         valid_page_idx = 0
-        for page in pages:
+        for conv_res, page in batch:
             assert page._backend is not None
             if not page._backend.is_valid():
                 existing_prediction = page.predictions.layout or LayoutPrediction()
@@ -76,9 +76,10 @@ class OcrMacModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
+                        high_res_image = page.get_image(
                             scale=self.scale, cropbox=ocr_rect
                         )
+                        assert high_res_image is not None
 
                         with tempfile.NamedTemporaryFile(
                             suffix=".png", mode="w"
@@ -17,6 +17,10 @@ from docling.utils.profiling import TimeRecorder
 
 class PagePreprocessingOptions(BaseModel):
     images_scale: Optional[float]
+    render_scale: Optional[float] = (
+        None  # Also render the page at this scale, smaller scales are derived from it
+    )
+    image_cache_max_bytes: Optional[int] = None  # Budget of the page image cache
     skip_cell_extraction: bool = (
         False  # Skip text cell extraction for VLM-only processing
     )
@@ -50,11 +54,17 @@ class PagePreprocessingModel(BasePageModel):
 
     # Generate the page image and store it in the page object
     def _populate_page_images(self, page: Page) -> Page:
+        page._image_cache.max_bytes = self.options.image_cache_max_bytes
         # default scale
         page.get_image(
             scale=1.0
         )  # puts the page image on the image cache at default scale
 
+        if self.options.render_scale is not None:
+            page.get_image(
+                scale=self.options.render_scale
+            )  # the larger scales below it are downscaled from this rendering
+
         images_scale = self.options.images_scale
         # user requested scales
         if images_scale is not None:
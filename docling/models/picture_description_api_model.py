@@ -12,7 +12,8 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.exceptions import OperationNotAllowed
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
-from docling.utils.api_image_request import api_image_request
+from docling.utils.api_client import get_api_client
+from docling.utils.api_image_request import api_image_request, encode_image
 
 
 class PictureDescriptionApiModel(PictureDescriptionBaseModel):
@@ -46,21 +47,51 @@ class PictureDescriptionApiModel(PictureDescriptionBaseModel):
                     "Connections to remote services is only allowed when set explicitly. "
                     "pipeline_options.enable_remote_services=True."
                 )
+            self.client = get_api_client(
+                str(self.options.url),
+                max_connections=self.concurrency,
+                max_retries=self.options.max_retries,
+                backoff_factor=self.options.retry_backoff,
+                requests_per_second=self.options.requests_per_second,
+            )
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="picture_description"
+            )
+            self._encoder = ThreadPoolExecutor(
+                max_workers=self.concurrency,
+                thread_name_prefix="picture_description_encode",
+            )
+
+    def __del__(self):
+        if hasattr(self, "_executor"):
+            self._executor.shutdown(wait=False)
+            self._encoder.shutdown(wait=False)
+
+    def _encode_image(self, image: Image.Image) -> str:
+        return encode_image(
+            image,
+            self.options.image_format,
+            quality=self.options.image_quality,
+            max_edge=self.options.image_max_edge,
+            grayscale=self.options.image_grayscale,
+        )
 
     def _annotate_images(self, images: Iterable[Image.Image]) -> Iterable[str]:
         # Note: technically we could make a batch request here,
         # but not all APIs will allow for it. For example, vllm won't allow more than 1.
-        def _api_request(image):
+        def _api_request(encoded):
             page_tags, _, _ = api_image_request(
-                image=image,
+                image=encoded.result(),
                 prompt=self.options.prompt,
                 url=self.options.url,
                 timeout=self.options.timeout,
                 headers=self.options.headers,
+                client=self.client,
                 **self.options.params,
             )
 
             return page_tags
 
-        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
-            yield from executor.map(_api_request, images)
+        # Encode the images ahead, while the requests of the previous ones are in flight
+        encoded = [self._encoder.submit(self._encode_image, image) for image in images]
+        yield from self._executor.map(_api_request, encoded)
@@ -266,9 +266,10 @@ class RapidOcrModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
+                        high_res_image = page.get_image(
                             scale=self.scale, cropbox=ocr_rect
                         )
+                        assert high_res_image is not None
                         im = numpy.array(high_res_image)
                         result = self.reader(
                             im,
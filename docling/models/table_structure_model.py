@@ -1,4 +1,3 @@
-import copy
 import warnings
 from collections.abc import Iterable, Sequence
 from pathlib import Path
@@ -6,10 +5,7 @@ from typing import Optional
 
 import numpy
 from docling_core.types.doc import BoundingBox, DocItemLabel, TableCell
-from docling_core.types.doc.page import (
-    BoundingRectangle,
-    TextCellUnit,
-)
+from docling_core.types.doc.page import TextCell, TextCellUnit
 from PIL import ImageDraw
 
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
@@ -171,15 +167,50 @@ class TableStructureModel(BaseTableStructureModel):
             out_file = out_path / f"table_struct_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
+    def _make_tokens(self, cells: Iterable[TextCell]) -> list[dict]:
+        """TableFormer tokens of the non-empty *cells*, in scaled page coordinates."""
+        return [
+            {
+                "id": cell.index,
+                "text": cell.text,
+                "bbox": cell.rect.to_bounding_box()
+                .scaled(scale=self.scale)
+                .model_dump(),
+            }
+            for cell in cells
+            # Only allow non empty strings (spaces) into the cells of a table
+            if len(cell.text.strip()) > 0
+        ]
+
     def predict_tables(
         self,
         conv_res: ConversionResult,
         pages: Sequence[Page],
     ) -> Sequence[TableStructurePrediction]:
-        pages = list(pages)
+        return self._predict_table_pages([(conv_res, page) for page in pages])
+
+    def process_pages(
+        self, batch: Sequence[tuple[ConversionResult, Page]]
+    ) -> Iterable[Page]:
+        if not self.enabled:
+            yield from (page for _, page in batch)
+            return
+
+        # Pages of all documents are handled in one pass over the batch.
+        batch = list(batch)
+        predictions = self._predict_table_pages(batch)
+
+        for (_, page), prediction in zip(batch, predictions):
+            page.predictions.tablestructure = prediction
+            yield page
+
+    def _predict_table_pages(
+        self,
+        batch: Sequence[tuple[ConversionResult, Page]],
+    ) -> Sequence[TableStructurePrediction]:
         predictions: list[TableStructurePrediction] = []
 
-        for page in pages:
+        for conv_res, page in batch:
             assert page._backend is not None
             if not page._backend.is_valid():
                 existing_prediction = (
@@ -219,10 +250,11 @@ class TableStructureModel(BaseTableStructureModel):
                     "height": page.size.height * self.scale,
                     "image": numpy.asarray(page.get_image(scale=self.scale)),
                 }
+                # Word-level cells of the backend, parsed once for all tables
+                sp = page._backend.get_segmented_page()
 
                 for table_cluster, tbl_box in in_tables:
                     # Check if word-level cells are available from backend:
-                    sp = page._backend.get_segmented_page()
                     if sp is not None:
                         tcells = sp.get_cells_in_bbox(
                             cell_unit=TextCellUnit.WORD,
@@ -234,25 +266,10 @@ class TableStructureModel(BaseTableStructureModel):
                     else:
                         # Otherwise - we use normal (line/phrase) cells
                         tcells = table_cluster.cells
-                    tokens = []
-                    for c in tcells:
-                        # Only allow non empty strings (spaces) into the cells of a table
-                        if len(c.text.strip()) > 0:
-                            new_cell = copy.deepcopy(c)
-                            new_cell.rect = BoundingRectangle.from_bounding_box(
-                                new_cell.rect.to_bounding_box().scaled(scale=self.scale)
-                            )
-                            tokens.append(
-                                {
-                                    "id": new_cell.index,
-                                    "text": new_cell.text,
-                                    "bbox": new_cell.rect.to_bounding_box().model_dump(),
-                                }
-                            )
-                    page_input["tokens"] = tokens
+                    table_input = {**page_input, "tokens": self._make_tokens(tcells)}
 
                     tf_output = self.tf_predictor.multi_table_predict(
-                        page_input, [tbl_box], do_matching=self.do_cell_matching
+                        table_input, [tbl_box], do_matching=self.do_cell_matching
                     )
                     table_out = tf_output[0]
                     table_cells = []
@@ -5,13 +5,15 @@ import os
 import subprocess
 import tempfile
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen
-from typing import List, Optional, Tuple, Type
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 import pandas as pd
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from docling_core.types.doc.page import TextCell
+from PIL.Image import Image
 
 from docling.datamodel.accelerator_options import AcceleratorOptions
 from docling.datamodel.base_models import Page
@@ -56,6 +58,16 @@ class TesseractOcrCliModel(BaseOcrModel):
         self._script_prefix: Optional[str] = None
         self._is_auto: bool = "auto" in self.options.lang
 
+        self._max_workers = self.options.max_workers or os.cpu_count() or 1
+        # Concurrent tesseract processes each run single-threaded, unless
+        # configured otherwise in the environment.
+        self._env = (
+            {"OMP_THREAD_LIMIT": "1", **os.environ} if self._max_workers > 1 else None
+        )
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="tesseract"
+        )
+
         if self.enabled:
             try:
                 self._get_name_and_version()
@@ -69,6 +81,10 @@ class TesseractOcrCliModel(BaseOcrModel):
                     "Alternatively, Docling has support for other OCR engines. See the documentation."
                 )
 
+    def __del__(self):
+        if hasattr(self, "_pool"):
+            self._pool.shutdown(wait=False)
+
     def _get_name_and_version(self) -> Tuple[str, str]:
         if self._name is not None and self._version is not None:
             return self._name, self._version  # type: ignore
@@ -99,19 +115,18 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return name, version
 
-    def _run_tesseract(self, ifilename: str, osd: Optional[pd.DataFrame]):
+    def _run_tesseract(self, ifilename: str, lang: Optional[str]) -> pd.DataFrame:
         r"""
         Run tesseract CLI
+
+        The input is an image, or a list of image files processed by a single
+        tesseract process. Rows are indexed per image, the image of a row is
+        given by its `page_num`, starting at 1.
         """
         cmd = [self.options.tesseract_cmd]
-        if self._is_auto and osd is not None:
-            lang = self._parse_language(osd)
-            if lang is not None:
-                cmd.append("-l")
-                cmd.append(lang)
-        elif self.options.lang is not None and len(self.options.lang) > 0:
+        if lang is not None:
             cmd.append("-l")
-            cmd.append("+".join(self.options.lang))
+            cmd.append(lang)
 
         if self.options.path is not None:
             cmd.append("--tessdata-dir")
@@ -124,25 +139,23 @@ class TesseractOcrCliModel(BaseOcrModel):
         cmd += [ifilename, "stdout", "tsv"]
         _log.info("command: {}".format(" ".join(cmd)))
 
-        output = subprocess.run(cmd, stdout=PIPE, stderr=DEVNULL, check=True)
-
-        # _log.info(output)
+        output = subprocess.run(
+            cmd, stdout=PIPE, stderr=DEVNULL, check=True, env=self._env
+        )
 
         # Decode the byte string to a regular string
         decoded_data = output.stdout.decode("utf-8")
-        # _log.info(decoded_data)
 
         # Read the TSV file generated by Tesseract
         df_result = pd.read_csv(
             io.StringIO(decoded_data), quoting=csv.QUOTE_NONE, sep="\t"
         )
-
-        # Display the dataframe (optional)
-        # _log.info("df: ", df.head())
+        df_result.index = df_result.groupby("page_num").cumcount()
 
         # Filter rows that contain actual text (ignore header or empty rows)
         df_filtered = df_result[
-            df_result["text"].notna() & (df_result["text"].apply(str).str.strip() != "")
+            df_result["text"].notna()
+            & (df_result["text"].astype(str).str.strip() != "")
         ]
 
         return df_filtered
@@ -155,13 +168,20 @@ class TesseractOcrCliModel(BaseOcrModel):
         cmd = [self.options.tesseract_cmd]
         cmd.extend(["--psm", "0", "-l", "osd", ifilename, "stdout"])
         _log.info("command: {}".format(" ".join(cmd)))
-        output = subprocess.run(cmd, capture_output=True, check=True)
+        output = subprocess.run(cmd, capture_output=True, check=True, env=self._env)
         decoded_data = output.stdout.decode("utf-8")
         df_detected = pd.read_csv(
             io.StringIO(decoded_data), sep=":", header=None, names=["key", "value"]
         )
         return df_detected
 
+    def _recognition_lang(self, df_osd: Optional[pd.DataFrame]) -> Optional[str]:
+        if self._is_auto and df_osd is not None:
+            return self._parse_language(df_osd)
+        elif self.options.lang is not None and len(self.options.lang) > 0:
+            return "+".join(self.options.lang)
+        return None
+
     def _parse_language(self, df_osd: pd.DataFrame) -> Optional[str]:
         assert self._tesseract_languages is not None
         scripts = df_osd.loc[df_osd["key"] == "Script"].value.tolist()
@@ -219,95 +239,7 @@ class TesseractOcrCliModel(BaseOcrModel):
             else:
                 with TimeRecorder(conv_res, "ocr"):
                     ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect_i, ocr_rect in enumerate(ocr_rects):
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        try:
-                            with tempfile.NamedTemporaryFile(
-                                suffix=".png", mode="w+b", delete=False
-                            ) as image_file:
-                                fname = image_file.name
-                                high_res_image.save(image_file)
-                            doc_orientation = 0
-                            df_osd: Optional[pd.DataFrame] = None
-                            try:
-                                df_osd = self._perform_osd(fname)
-                                doc_orientation = _parse_orientation(df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "OSD failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                # Skipping if OSD fail when in auto mode, otherwise proceed
-                                # to OCR in the hope OCR will succeed while OSD failed
-                                if self._is_auto:
-                                    continue
-                            if doc_orientation != 0:
-                                high_res_image = high_res_image.rotate(
-                                    -doc_orientation, expand=True
-                                )
-                                high_res_image.save(fname)
-                            try:
-                                df_result = self._run_tesseract(fname, df_osd)
-                            except subprocess.CalledProcessError as exc:
-                                _log.error(
-                                    "tesseract OCR failed (doc %s, page: %s, "
-                                    "OCR rectangle: %s, processed image file %s):\n %s",
-                                    conv_res.input.file,
-                                    page_i,
-                                    ocr_rect_i,
-                                    image_file,
-                                    exc.stderr,
-                                )
-                                continue
-                        finally:
-                            if os.path.exists(fname):
-                                os.remove(fname)
-
-                        # _log.info(df_result)
-
-                        # Print relevant columns (bounding box and text)
-                        for ix, row in df_result.iterrows():
-                            text = row["text"]
-                            conf = row["conf"]
-
-                            left, top = float(row["left"]), float(row["top"])
-                            right = left + float(row["width"])
-                            bottom = top + row["height"]
-                            bbox = BoundingBox(
-                                l=left,
-                                t=top,
-                                r=right,
-                                b=bottom,
-                                coord_origin=CoordOrigin.TOPLEFT,
-                            )
-                            rect = tesseract_box_to_bounding_rectangle(
-                                bbox,
-                                original_offset=ocr_rect,
-                                scale=self.scale,
-                                orientation=doc_orientation,
-                                im_size=high_res_image.size,
-                            )
-                            cell = TextCell(
-                                index=ix,
-                                text=str(text),
-                                orig=str(text),
-                                from_ocr=True,
-                                confidence=conf / 100.0,
-                                rect=rect,
-                            )
-                            all_ocr_cells.append(cell)
+                    all_ocr_cells = self._ocr_page(conv_res, page, page_i, ocr_rects)
 
                     # Post-process the cells
                     self.post_process_cells(all_ocr_cells, page)
@@ -318,6 +250,171 @@ class TesseractOcrCliModel(BaseOcrModel):
 
                 yield page
 
+    def _ocr_page(
+        self,
+        conv_res: ConversionResult,
+        page: Page,
+        page_i: int,
+        ocr_rects: List[BoundingBox],
+    ) -> List[TextCell]:
+        """OCR all rectangles of a page, with one tesseract process per language."""
+        # Skip zero area boxes
+        rect_ids = [i for i, ocr_rect in enumerate(ocr_rects) if ocr_rect.area() != 0]
+        if not rect_ids:
+            return []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            images: Dict[int, Image] = {}
+            fnames: Dict[int, str] = {}
+            for i in rect_ids:
+                image = page.get_image(scale=self.scale, cropbox=ocr_rects[i])
+                assert image is not None
+                images[i] = image
+                fnames[i] = os.path.join(tmp_dir, f"{i}.png")
+                image.save(fnames[i], compress_level=1)
+
+            orientations: Dict[int, int] = dict.fromkeys(rect_ids, 0)
+            osds: Dict[int, pd.DataFrame] = {}
+            if self.options.detect_orientation or self._is_auto:
+                results = list(
+                    self._pool.map(self._try_perform_osd, [fnames[i] for i in rect_ids])
+                )
+                for i, result in zip(list(rect_ids), results):
+                    if isinstance(result, subprocess.CalledProcessError):
+                        _log.error(
+                            "OSD failed (doc %s, page: %s, "
+                            "OCR rectangle: %s, processed image file %s):\n %s",
+                            conv_res.input.file,
+                            page_i,
+                            i,
+                            fnames[i],
+                            result.stderr,
+                        )
+                        # Skipping if OSD fail when in auto mode, otherwise proceed
+                        # to OCR in the hope OCR will succeed while OSD failed
+                        if self._is_auto:
+                            rect_ids.remove(i)
+                        continue
+                    osds[i] = result
+                    orientations[i] = _parse_orientation(result)
+                    if orientations[i] != 0:
+                        images[i] = images[i].rotate(-orientations[i], expand=True)
+                        images[i].save(fnames[i], compress_level=1)
+
+            # Rectangles sharing a language are recognized by the same process,
+            # split in chunks run in parallel.
+            by_lang: Dict[Optional[str], List[int]] = {}
+            for i in rect_ids:
+                by_lang.setdefault(self._recognition_lang(osds.get(i)), []).append(i)
+            tasks = [
+                (lang, ids[start :: self._max_workers])
+                for lang, ids in by_lang.items()
+                for start in range(min(self._max_workers, len(ids)))
+            ]
+            results_by_rect: Dict[int, pd.DataFrame] = {}
+            for task_results in self._pool.map(
+                lambda task: self._recognize(conv_res, page_i, fnames, *task), tasks
+            ):
+                results_by_rect.update(task_results)
+
+        all_ocr_cells: List[TextCell] = []
+        for i in sorted(results_by_rect):
+            all_ocr_cells.extend(
+                self._make_cells(
+                    results_by_rect[i], ocr_rects[i], orientations[i], images[i].size
+                )
+            )
+        return all_ocr_cells
+
+    def _try_perform_osd(
+        self, ifilename: str
+    ) -> Union[pd.DataFrame, subprocess.CalledProcessError]:
+        try:
+            return self._perform_osd(ifilename)
+        except subprocess.CalledProcessError as exc:
+            return exc
+
+    def _recognize(
+        self,
+        conv_res: ConversionResult,
+        page_i: int,
+        fnames: Dict[int, str],
+        lang: Optional[str],
+        rect_ids: List[int],
+    ) -> Dict[int, pd.DataFrame]:
+        if len(rect_ids) > 1:
+            # Tesseract reads a text file as a list of images to process
+            list_fname = fnames[rect_ids[0]] + ".txt"
+            with open(list_fname, "w", encoding="utf-8") as list_file:
+                list_file.write("".join(f"{fnames[i]}\n" for i in rect_ids))
+            try:
+                df_result = self._run_tesseract(list_fname, lang)
+                return {
+                    i: df_result[df_result["page_num"] == page_num]
+                    for page_num, i in enumerate(rect_ids, start=1)
+                }
+            except subprocess.CalledProcessError:
+                _log.debug("Batched tesseract run failed, retrying per rectangle")
+
+        results: Dict[int, pd.DataFrame] = {}
+        for i in rect_ids:
+            try:
+                results[i] = self._run_tesseract(fnames[i], lang)
+            except subprocess.CalledProcessError as exc:
+                _log.error(
+                    "tesseract OCR failed (doc %s, page: %s, "
+                    "OCR rectangle: %s, processed image file %s):\n %s",
+                    conv_res.input.file,
+                    page_i,
+                    i,
+                    fnames[i],
+                    exc.stderr,
+                )
+        return results
+
+    def _make_cells(
+        self,
+        df_result: pd.DataFrame,
+        ocr_rect: BoundingBox,
+        orientation: int,
+        im_size: Tuple[int, int],
+    ) -> List[TextCell]:
+        cells = []
+        for ix, text, conf, left, top, width, height in zip(
+            df_result.index,
+            df_result["text"].astype(str),
+            df_result["conf"].to_numpy(dtype=float) / 100.0,
+            df_result["left"].to_numpy(dtype=float),
+            df_result["top"].to_numpy(dtype=float),
+            df_result["width"].to_numpy(dtype=float),
+            df_result["height"].to_numpy(dtype=float),
+        ):
+            bbox = BoundingBox(
+                l=left,
+                t=top,
+                r=left + width,
+                b=top + height,
+                coord_origin=CoordOrigin.TOPLEFT,
+            )
+            rect = tesseract_box_to_bounding_rectangle(
+                bbox,
+                original_offset=ocr_rect,
+                scale=self.scale,
+                orientation=orientation,
+                im_size=im_size,
+            )
+            cells.append(
+                TextCell(
+                    index=ix,
+                    text=text,
+                    orig=text,
+                    from_ocr=True,
+                    confidence=conf,
+                    rect=rect,
+                )
+            )
+        return cells
+
     @classmethod
     def get_options_type(cls) -> Type[OcrOptions]:
         return TesseractCliOcrOptions
@@ -144,9 +144,10 @@ class TesseractOcrModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
+                        high_res_image = page.get_image(
                             scale=self.scale, cropbox=ocr_rect
                         )
+                        assert high_res_image is not None
 
                         local_reader = self.reader
                         self.osd_reader.SetImage(high_res_image)
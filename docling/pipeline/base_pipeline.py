@@ -237,7 +237,7 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                     for p in pipeline_pages:  # Must exhaust!
                         # Cleanup cached images
                         if not self.keep_images:
-                            p._image_cache = {}
+                            p._image_cache.clear()
 
                         # Cleanup page backends
                         if not self.keep_backend and p._backend is not None:
@@ -4,6 +4,9 @@ A self-contained, thread-safe PDF conversion pipeline exploiting parallelism bet
 
 * **Per-run isolation** - every :py:meth:`execute` call uses its own bounded queues and worker
   threads so that concurrent invocations never share mutable state.
+* **Persistent stages (opt-in)** - with ``persistent_stages`` the worker threads are created
+  once per pipeline instance and multiplex concurrent runs; a dispatcher routes finished
+  pages back to their run by *run-id*.
 * **Deterministic run identifiers** - pages are tracked with an internal *run-id* instead of
   relying on :pyfunc:`id`, which may clash after garbage collection.
 * **Explicit back-pressure & shutdown** - producers block on full queues; queue *close()*
@@ -27,6 +30,7 @@ from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, cas
 
 import numpy as np
 from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
+from pydantic import BaseModel
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
@@ -40,6 +44,17 @@ from docling.datamodel.base_models import (
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
 from docling.datamodel.settings import settings
+from docling.models.base_model import BasePageModel
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.cached_page_model import (
+    CachedPageModel,
+    LayoutCacheAdapter,
+    OcrCacheAdapter,
+    PageCacheAdapter,
+    TableCacheAdapter,
+    model_fingerprint,
+    ocr_fingerprint,
+)
 from docling.models.code_formula_model import CodeFormulaModel, CodeFormulaModelOptions
 from docling.models.factories import (
     get_layout_factory,
@@ -53,6 +68,7 @@ from docling.models.page_preprocessing_model import (
 )
 from docling.models.readingorder_model import ReadingOrderModel, ReadingOrderOptions
 from docling.pipeline.base_pipeline import ConvertPipeline
+from docling.utils.cache import PagePredictionCache
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
@@ -136,9 +152,16 @@ class ThreadedQueue:
 
     # ------------------------------------------------------------ get_batch()
     def get_batch(
-        self, size: int, timeout: Optional[float] | None = None
+        self,
+        size: int,
+        timeout: Optional[float] | None = None,
+        fill_timeout: Optional[float] | None = None,
     ) -> List[ThreadedItem]:
-        """Return up to *size* items.  Blocks until ≥1 item present or queue closed/timeout."""
+        """Return up to *size* items.  Blocks until ≥1 item present or queue closed/timeout.
+
+        With *fill_timeout*, waits up to that long after the first item for the
+        batch to fill up to *size*, trading a bounded latency for fuller batches.
+        """
         with self._not_empty:
             start = time.monotonic()
             while not self._items and not self._closed:
@@ -149,6 +172,13 @@ class ThreadedQueue:
                     self._not_empty.wait(remaining)
                 else:
                     self._not_empty.wait()
+            if fill_timeout:
+                deadline = time.monotonic() + fill_timeout
+                while len(self._items) < size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._not_empty.wait(remaining)
             batch: List[ThreadedItem] = []
             while self._items and len(batch) < size:
                 batch.append(self._items.popleft())
@@ -182,6 +212,9 @@ class ThreadedPipelineStage:
         queue_max_size: int,
         postprocess: Optional[Callable[[ThreadedItem], None]] = None,
         timed_out_run_ids: Optional[set[int]] = None,
+        daemon: bool = False,
+        cross_document: bool = False,
+        batch_fill_timeout: Optional[float] = None,
     ) -> None:
         self.name = name
         self.model = model
@@ -195,6 +228,9 @@ class ThreadedPipelineStage:
         self._timed_out_run_ids = (
             timed_out_run_ids if timed_out_run_ids is not None else set()
         )
+        self._daemon = daemon
+        self._cross_document = cross_document
+        self.batch_fill_timeout = batch_fill_timeout
 
     # ---------------------------------------------------------------- wiring
     def add_output_queue(self, q: ThreadedQueue) -> None:
@@ -206,7 +242,7 @@ class ThreadedPipelineStage:
             return
         self._running = True
         self._thread = threading.Thread(
-            target=self._run, name=f"Stage-{self.name}", daemon=False
+            target=self._run, name=f"Stage-{self.name}", daemon=self._daemon
         )
         self._thread.start()
 
@@ -229,7 +265,11 @@ class ThreadedPipelineStage:
     def _run(self) -> None:
         try:
             while self._running:
-                batch = self.input_queue.get_batch(self.batch_size, self.batch_timeout)
+                batch = self.input_queue.get_batch(
+                    self.batch_size,
+                    self.batch_timeout,
+                    fill_timeout=self.batch_fill_timeout,
+                )
                 if not batch and self.input_queue.closed:
                     break
                 processed = self._process_batch(batch)
@@ -248,6 +288,7 @@ class ThreadedPipelineStage:
             groups[itm.run_id].append(itm)
 
         result: list[ThreadedItem] = []
+        runnable: list[tuple[int, list[ThreadedItem], list[ThreadedItem]]] = []
         for rid, items in groups.items():
             # If run_id is timed out, skip processing but pass through items as-is
             # This allows already-completed work to flow through while aborting new work
@@ -263,44 +304,90 @@ class ThreadedPipelineStage:
             if not good:
                 result.extend(items)
                 continue
-            try:
-                # Filter out None payloads and ensure type safety
-                pages_with_payloads = [
-                    (i, i.payload) for i in good if i.payload is not None
-                ]
-                if len(pages_with_payloads) != len(good):
-                    # Some items have None payloads, mark all as failed
-                    for it in items:
-                        it.is_failed = True
-                        it.error = RuntimeError("Page payload is None")
-                    result.extend(items)
-                    continue
-
-                pages: List[Page] = [payload for _, payload in pages_with_payloads]
-                processed_pages = list(self.model(good[0].conv_res, pages))  # type: ignore[arg-type]
-                if len(processed_pages) != len(pages):  # strict mismatch guard
-                    raise RuntimeError(
-                        f"Model {self.name} returned wrong number of pages"
-                    )
-                for idx, page in enumerate(processed_pages):
-                    result.append(
-                        ThreadedItem(
-                            payload=page,
-                            run_id=rid,
-                            page_no=good[idx].page_no,
-                            conv_res=good[idx].conv_res,
-                        )
-                    )
-            except Exception as exc:
-                _log.error(
-                    "Stage %s failed for run %d: %s", self.name, rid, exc, exc_info=True
-                )
+            if any(i.payload is None for i in good):
+                # Some items have None payloads, mark all as failed
                 for it in items:
                     it.is_failed = True
-                    it.error = exc
+                    it.error = RuntimeError("Page payload is None")
                 result.extend(items)
+                continue
+            runnable.append((rid, items, good))
+
+        if self._cross_document and len(runnable) > 1:
+            try:
+                result.extend(self._run_model_across_runs(runnable))
+                return result
+            except Exception as exc:
+                # Contain the failure: retry run by run so only the
+                # offending document is marked as failed.
+                _log.warning(
+                    "Stage %s failed on a cross-document batch, retrying per run: %s",
+                    self.name,
+                    exc,
+                )
+
+        for rid, items, good in runnable:
+            result.extend(self._run_model(rid, items, good))
         return result
 
+    def _run_model(
+        self, rid: int, items: list[ThreadedItem], good: list[ThreadedItem]
+    ) -> list[ThreadedItem]:
+        try:
+            pages: List[Page] = [cast(Page, i.payload) for i in good]
+            processed_pages = list(self.model(good[0].conv_res, pages))  # type: ignore[arg-type]
+            if len(processed_pages) != len(pages):  # strict mismatch guard
+                raise RuntimeError(f"Model {self.name} returned wrong number of pages")
+            return [
+                ThreadedItem(
+                    payload=page,
+                    run_id=rid,
+                    page_no=good[idx].page_no,
+                    conv_res=good[idx].conv_res,
+                )
+                for idx, page in enumerate(processed_pages)
+            ]
+        except Exception as exc:
+            _log.error(
+                "Stage %s failed for run %d: %s", self.name, rid, exc, exc_info=True
+            )
+            for it in items:
+                it.is_failed = True
+                it.error = exc
+            return list(items)
+
+    def _run_model_across_runs(
+        self, runnable: list[tuple[int, list[ThreadedItem], list[ThreadedItem]]]
+    ) -> list[ThreadedItem]:
+        """Run *model* once on the pages of several runs and route results back."""
+        good = [it for _, _, run_good in runnable for it in run_good]
+        if isinstance(self.model, BasePageModel):
+            processed_pages = list(
+                self.model.process_pages(
+                    [(it.conv_res, cast(Page, it.payload)) for it in good]
+                )
+            )
+        else:
+            # Models without multi-document support still see one call per run.
+            processed_pages = [
+                page
+                for _, _, run_good in runnable
+                for page in self.model(
+                    run_good[0].conv_res, [it.payload for it in run_good]
+                )
+            ]
+        if len(processed_pages) != len(good):  # strict mismatch guard
+            raise RuntimeError(f"Model {self.name} returned wrong number of pages")
+        return [
+            ThreadedItem(
+                payload=page,
+                run_id=it.run_id,
+                page_no=it.page_no,
+                conv_res=it.conv_res,
+            )
+            for it, page in zip(good, processed_pages)
+        ]
+
     # -------------------------------------------------------------- _emit()
     def _emit(self, items: Iterable[ThreadedItem]) -> None:
         for item in items:
@@ -321,6 +408,7 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         queue_max_size: int,
         model: Any,
         timed_out_run_ids: Optional[set[int]] = None,
+        daemon: bool = False,
     ) -> None:
         super().__init__(
             name="preprocess",
@@ -329,6 +417,7 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
             batch_timeout=batch_timeout,
             queue_max_size=queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
         )
 
     def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
@@ -403,6 +492,8 @@ class RunContext:
     first_stage: ThreadedPipelineStage
     output_queue: ThreadedQueue
     timed_out_run_ids: set[int] = field(default_factory=set)
+    # Output queue of each run using persistent stages, fed by the dispatcher
+    run_output_queues: dict[int, ThreadedQueue] = field(default_factory=dict)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -418,6 +509,19 @@ class StandardPdfPipeline(ConvertPipeline):
         self.pipeline_options: ThreadedPdfPipelineOptions = pipeline_options
         self._run_seq = itertools.count(1)  # deterministic, monotonic run ids
 
+        # persistent-stage state (only used with ``persistent_stages``)
+        self._shared_ctx: Optional[RunContext] = None
+        self._shared_lock = threading.Lock()
+
+        self.page_prediction_cache: Optional[PagePredictionCache] = (
+            PagePredictionCache(
+                cache_dir=pipeline_options.page_prediction_cache_dir,
+                max_size_bytes=pipeline_options.page_prediction_cache_max_size_bytes,
+            )
+            if pipeline_options.page_prediction_cache
+            else None
+        )
+
         # initialise heavy models once
         self._init_models()
 
@@ -432,11 +536,6 @@ class StandardPdfPipeline(ConvertPipeline):
             or self.pipeline_options.generate_picture_images
             or self.pipeline_options.generate_table_images
         )
-        self.preprocessing_model = PagePreprocessingModel(
-            options=PagePreprocessingOptions(
-                images_scale=self.pipeline_options.images_scale
-            )
-        )
         self.ocr_model = self._make_ocr_model(art_path)
         layout_factory = get_layout_factory(
             allow_external_plugins=self.pipeline_options.allow_external_plugins
@@ -455,6 +554,13 @@ class StandardPdfPipeline(ConvertPipeline):
             artifacts_path=art_path,
             accelerator_options=self.pipeline_options.accelerator_options,
         )
+        self.preprocessing_model = PagePreprocessingModel(
+            options=PagePreprocessingOptions(
+                images_scale=self.pipeline_options.images_scale,
+                render_scale=self._page_render_scale(),
+                image_cache_max_bytes=self.pipeline_options.page_image_cache_max_bytes,
+            )
+        )
         self.assemble_model = PageAssembleModel(options=PageAssembleOptions())
         self.reading_order_model = ReadingOrderModel(options=ReadingOrderOptions())
 
@@ -495,12 +601,55 @@ class StandardPdfPipeline(ConvertPipeline):
             accelerator_options=self.pipeline_options.accelerator_options,
         )
 
+    def _page_render_scale(self) -> Optional[float]:
+        """Largest page image scale needed for every page, if rendered once.
+
+        Only the scales known to be used on every page are planned. The table
+        model only needs its images on pages with tables, and the OCR model
+        only the crops of bitmaps unless full page OCR is forced; these are
+        rendered on demand, or derived when a larger image is cached.
+        """
+        opts = self.pipeline_options
+        if not opts.render_page_images_once:
+            return None
+        scales = [opts.images_scale]
+        if opts.do_ocr and opts.ocr_options.force_full_page_ocr:
+            scales.append(getattr(self.ocr_model, "scale", 1.0))
+        render_scale = max(scales)
+        # The 1.0 image of the layout model is always rendered natively
+        return render_scale if render_scale > 1.0 else None
+
+    def _with_prediction_cache(
+        self,
+        model: Any,
+        adapter: PageCacheAdapter,
+        fingerprint: str,
+    ) -> Any:
+        """Wrap *model* with the page prediction cache, if enabled."""
+        if (
+            self.page_prediction_cache is None
+            or not isinstance(model, BasePageModel)
+            or not getattr(model, "enabled", True)
+        ):
+            return model
+        return CachedPageModel(
+            model,
+            cache=self.page_prediction_cache,
+            adapter=adapter,
+            fingerprint=fingerprint,
+        )
+
     def _release_page_resources(self, item: ThreadedItem) -> None:
         page = item.payload
         if page is None:
             return
         if not self.keep_images:
-            page._image_cache = {}
+            page._image_cache.clear()
+        elif not self.keep_backend:
+            # Only the page images at images_scale are used from here on, the
+            # larger renderings needed by the models are released.
+            page.get_image(scale=page._default_image_scale)
+            page._image_cache.retain([page._default_image_scale])
         if not self.keep_backend and page._backend is not None:
             page._backend.unload()
             page._backend = None
@@ -511,7 +660,7 @@ class StandardPdfPipeline(ConvertPipeline):
     # Build - thread pipeline
     # ────────────────────────────────────────────────────────────────────────
 
-    def _create_run_ctx(self) -> RunContext:
+    def _create_run_ctx(self, daemon: bool = False) -> RunContext:
         opts = self.pipeline_options
         timed_out_run_ids: set[int] = set()
         preprocess = PreprocessThreadedStage(
@@ -519,30 +668,59 @@ class StandardPdfPipeline(ConvertPipeline):
             queue_max_size=opts.queue_max_size,
             model=self.preprocessing_model,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
+        )
+        # The layout entries hold the OCR cells, and the table entries depend on
+        # the layout clusters, so their keys include the upstream fingerprints.
+        ocr_key = ocr_fingerprint(self.ocr_model, opts.ocr_options)
+        layout_key = model_fingerprint(
+            self.layout_model, opts.layout_options, upstream=[ocr_key]
         )
+        table_key = model_fingerprint(
+            self.table_model, opts.table_structure_options, upstream=[layout_key]
+        )
+        ocr_model = self.ocr_model
+        if isinstance(ocr_model, BaseOcrModel):
+            ocr_model = self._with_prediction_cache(
+                ocr_model, OcrCacheAdapter(ocr_model), ocr_key
+            )
         ocr = ThreadedPipelineStage(
             name="ocr",
-            model=self.ocr_model,
+            model=ocr_model,
             batch_size=opts.ocr_batch_size,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
         )
+        # Cross-document batching only pays off when several runs share stages
+        cross_document = opts.cross_document_batching and opts.persistent_stages
+        fill_timeout = opts.batch_flush_deadline_seconds if cross_document else None
         layout = ThreadedPipelineStage(
             name="layout",
-            model=self.layout_model,
+            model=self._with_prediction_cache(
+                self.layout_model, LayoutCacheAdapter(), layout_key
+            ),
             batch_size=opts.layout_batch_size,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
+            cross_document=cross_document,
+            batch_fill_timeout=fill_timeout,
         )
         table = ThreadedPipelineStage(
             name="table",
-            model=self.table_model,
+            model=self._with_prediction_cache(
+                self.table_model, TableCacheAdapter(), table_key
+            ),
             batch_size=opts.table_batch_size,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
+            cross_document=cross_document,
+            batch_fill_timeout=fill_timeout,
         )
         assemble = ThreadedPipelineStage(
             name="assemble",
@@ -552,6 +730,7 @@ class StandardPdfPipeline(ConvertPipeline):
             queue_max_size=opts.queue_max_size,
             postprocess=self._release_page_resources,
             timed_out_run_ids=timed_out_run_ids,
+            daemon=daemon,
         )
 
         # wire stages
@@ -570,6 +749,79 @@ class StandardPdfPipeline(ConvertPipeline):
             timed_out_run_ids=timed_out_run_ids,
         )
 
+    # ---------------------------------------------------- persistent stages
+    def _get_shared_run_ctx(self) -> RunContext:
+        """Return the long-lived stage wiring, starting it on first use."""
+        with self._shared_lock:
+            if self._shared_ctx is None:
+                # Daemon threads: a long-lived pipeline must not keep the
+                # interpreter alive if shutdown() is never called.
+                ctx = self._create_run_ctx(daemon=True)
+                for st in ctx.stages:
+                    st.start()
+                threading.Thread(
+                    target=self._dispatch_outputs,
+                    args=(ctx,),
+                    name="Stage-dispatch",
+                    daemon=True,
+                ).start()
+                self._shared_ctx = ctx
+            return self._shared_ctx
+
+    def _dispatch_outputs(self, ctx: RunContext) -> None:
+        """Route items from the shared output queue to the queue of their run."""
+        try:
+            while True:
+                batch = ctx.output_queue.get_batch(32)
+                if not batch and ctx.output_queue.closed:
+                    break
+                with self._shared_lock:
+                    for itm in batch:
+                        run_q = ctx.run_output_queues.get(itm.run_id)
+                        # Items of runs that already returned (e.g. timed out)
+                        # are dropped; their resources were released in assemble.
+                        if run_q is not None:
+                            run_q.put(itm)
+        finally:
+            # Only the runs of this context end here: after shutdown(), runs
+            # of a fresh context keep their queues.
+            with self._shared_lock:
+                for run_q in ctx.run_output_queues.values():
+                    run_q.close()
+
+    def _register_run(
+        self, run_id: int, total_pages: int, ctx: RunContext
+    ) -> ThreadedQueue:
+        # Sized to hold every page of the run, so the dispatcher never blocks
+        # on a slow consumer and stalls the other runs.
+        run_q = ThreadedQueue(max(total_pages, 1))
+        with self._shared_lock:
+            ctx.run_output_queues[run_id] = run_q
+            if ctx.output_queue.closed:
+                # Shut down in the meantime, the dispatcher is gone
+                run_q.close()
+        return run_q
+
+    def _unregister_run(self, run_id: int, ctx: RunContext) -> None:
+        with self._shared_lock:
+            run_q = ctx.run_output_queues.pop(run_id, None)
+        ctx.timed_out_run_ids.discard(run_id)
+        if run_q is not None:
+            run_q.close()
+
+    def shutdown(self) -> None:
+        """Stop the persistent stage threads, if they were started.
+
+        A later conversion with this pipeline starts a fresh set of stages.
+        """
+        with self._shared_lock:
+            ctx, self._shared_ctx = self._shared_ctx, None
+        if ctx is None:
+            return
+        for st in ctx.stages:
+            st.stop()
+        ctx.output_queue.close()
+
     # --------------------------------------------------------------------- build
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         """Stream-build the document while interleaving producer and consumer work.
@@ -596,18 +848,28 @@ class StandardPdfPipeline(ConvertPipeline):
             return conv_res
 
         total_pages: int = len(pages)
-        ctx: RunContext = self._create_run_ctx()
-        for st in ctx.stages:
-            st.start()
+        persistent = self.pipeline_options.persistent_stages
+        ctx: RunContext
+        if persistent:
+            ctx = self._get_shared_run_ctx()
+            out_q = self._register_run(run_id, total_pages, ctx)
+        else:
+            ctx = self._create_run_ctx()
+            for st in ctx.stages:
+                st.start()
+            out_q = ctx.output_queue
 
         proc = ProcessingResult(total_expected=total_pages)
         fed_idx: int = 0  # number of pages successfully queued
         batch_size: int = 32  # drain chunk
         start_time = time.monotonic()
         timeout_exceeded = False
-        input_queue_closed = False
+        feeding_done = False
         try:
-            while proc.success_count + proc.failure_count < total_pages:
+            # After a timeout, only the pages already fed are still awaited
+            while proc.success_count + proc.failure_count < (
+                fed_idx if timeout_exceeded else total_pages
+            ):
                 # Check timeout
                 if (
                     self.pipeline_options.document_timeout is not None
@@ -621,14 +883,22 @@ class StandardPdfPipeline(ConvertPipeline):
                         )
                         timeout_exceeded = True
                         ctx.timed_out_run_ids.add(run_id)
-                        if not input_queue_closed:
-                            ctx.first_stage.input_queue.close()
-                            input_queue_closed = True
-                        # Break immediately - don't wait for in-flight work
-                        break
+                        if not feeding_done:
+                            # The shared input queue of persistent stages stays open
+                            # for other runs; we simply stop feeding it.
+                            if not persistent:
+                                ctx.first_stage.input_queue.close()
+                            feeding_done = True
+                        if not persistent:
+                            # Break immediately - don't wait for in-flight work
+                            break
+                        # Persistent stages outlive the run: keep draining until
+                        # every fed page came out, so that no stage still uses
+                        # the document backend when the caller unloads it. The
+                        # stages skip the pages of timed-out runs.
 
                 # 1) feed - try to enqueue until the first queue is full
-                if not input_queue_closed:
+                if not feeding_done:
                     while fed_idx < total_pages:
                         ok = ctx.first_stage.input_queue.put(
                             ThreadedItem(
@@ -642,13 +912,14 @@ class StandardPdfPipeline(ConvertPipeline):
                         if ok:
                             fed_idx += 1
                             if fed_idx == total_pages:
-                                ctx.first_stage.input_queue.close()
-                                input_queue_closed = True
+                                if not persistent:
+                                    ctx.first_stage.input_queue.close()
+                                feeding_done = True
                         else:  # queue full - switch to draining
                             break
 
                 # 2) drain - pull whatever is ready from the output side
-                out_batch = ctx.output_queue.get_batch(batch_size, timeout=0.05)
+                out_batch = out_q.get_batch(batch_size, timeout=0.05)
                 for itm in out_batch:
                     if itm.run_id != run_id:
                         continue
@@ -661,7 +932,7 @@ class StandardPdfPipeline(ConvertPipeline):
                         proc.pages.append(itm.payload)
 
                 # 3) failure safety - downstream closed early
-                if not out_batch and ctx.output_queue.closed:
+                if not out_batch and out_q.closed:
                     missing = total_pages - (proc.success_count + proc.failure_count)
                     if missing > 0:
                         proc.failed_pages.extend(
@@ -680,9 +951,12 @@ class StandardPdfPipeline(ConvertPipeline):
                             (page.page_no, RuntimeError("document timeout exceeded"))
                         )
         finally:
-            for st in ctx.stages:
-                st.stop()
-            ctx.output_queue.close()
+            if persistent:
+                self._unregister_run(run_id, ctx)
+            else:
+                for st in ctx.stages:
+                    st.stop()
+                ctx.output_queue.close()
 
         self._integrate_results(conv_res, proc, timeout_exceeded=timeout_exceeded)
         return conv_res
@@ -720,7 +994,7 @@ class StandardPdfPipeline(ConvertPipeline):
             conv_res.status = ConversionStatus.SUCCESS
         if not self.keep_images:
             for p in conv_res.pages:
-                p._image_cache = {}
+                p._image_cache.clear()
         for p in conv_res.pages:
             if not self.keep_backend and p._backend is not None:
                 p._backend.unload()
@@ -0,0 +1,155 @@
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_log = logging.getLogger(__name__)
+
+# Statuses worth retrying on an inference server: rate limiting and transient
+# gateway or overload errors.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    r"""
+    Spaces out calls to at most `rate` per second, across threads
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ApiClient:
+    r"""
+    HTTP client for one API endpoint
+
+    Requests go through a pooled keep-alive session, so the connections (and
+    their TLS handshakes) are reused across calls and threads. Connection
+    errors and transient server statuses are retried with exponential backoff,
+    honouring Retry-After. Read errors and timeouts are not retried, as the
+    server may still be processing the request. The number of requests in
+    flight is bounded by `max_connections`, and requests can be rate limited.
+    Connection pools are kept for the `max_hosts` most recently used hosts.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 10,
+        max_retries: int = 0,
+        backoff_factor: float = 0.5,
+        requests_per_second: Optional[float] = None,
+        max_hosts: int = 1,
+    ):
+        retry = Retry(
+            total=max_retries,
+            read=False,  # A timed out POST may still be generating, never resend it
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None,  # Retry POST too
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max_hosts,
+            pool_maxsize=max_connections,
+            pool_block=True,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._rate_limiter = (
+            RateLimiter(requests_per_second)
+            if requests_per_second is not None
+            else None
+        )
+
+    @contextmanager
+    def _slot(self) -> Iterator[None]:
+        with self._slots:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            yield
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        with self._slot():
+            return self.session.get(url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        with self._slot():
+            return self.session.post(url, **kwargs)
+
+    @contextmanager
+    def stream(self, url: str, **kwargs) -> Iterator[requests.Response]:
+        r"""
+        POST a request and hold its slot until the streamed response is closed
+        """
+        with self._slot():
+            with self.session.post(url, stream=True, **kwargs) as r:
+                yield r
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_clients: Dict[Tuple, ApiClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_api_client(
+    url: str,
+    *,
+    max_connections: int = 10,
+    max_retries: int = 0,
+    backoff_factor: float = 0.5,
+    requests_per_second: Optional[float] = None,
+) -> ApiClient:
+    r"""
+    Get the shared client of an endpoint
+
+    Clients are shared per scheme, host and port, and per client settings, so
+    that all the models calling the same server reuse its connections and
+    share its concurrency and rate limits.
+    """
+    parts = urlsplit(str(url))
+    key = (
+        parts.scheme,
+        parts.netloc,
+        max_connections,
+        max_retries,
+        backoff_factor,
+        requests_per_second,
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            _log.debug("Creating API client for %s://%s", parts.scheme, parts.netloc)
+            client = ApiClient(
+                max_connections=max_connections,
+                max_retries=max_retries,
+                backoff_factor=backoff_factor,
+                requests_per_second=requests_per_second,
+            )
+            _clients[key] = client
+    return client
@@ -2,51 +2,106 @@ import base64
 import json
 import logging
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
-import requests
 from PIL import Image
 from pydantic import AnyUrl
 
 from docling.datamodel.base_models import OpenAiApiResponse, VlmStopReason
 from docling.models.utils.generation_utils import GenerationStopper
+from docling.utils.api_client import ApiClient, get_api_client
 
 _log = logging.getLogger(__name__)
 
+ImageFormat = Literal["png", "jpeg", "webp"]
 
-def api_image_request(
+# Image modes each format can encode without a conversion
+_NATIVE_MODES: Dict[str, Tuple[str, ...]] = {
+    "png": ("1", "L", "LA", "P", "RGB", "RGBA"),
+    "jpeg": ("L", "RGB"),
+    "webp": ("L", "RGB", "RGBA"),
+}
+
+
+def encode_image(
     image: Image.Image,
+    image_format: ImageFormat = "png",
+    *,
+    quality: int = 90,
+    max_edge: Optional[int] = None,
+    grayscale: bool = False,
+) -> str:
+    r"""
+    Encode an image as a base64 data URL for a chat completion request
+
+    The image is downscaled to `max_edge` pixels on its longest edge and
+    converted to grayscale when requested. It is only converted to another
+    mode when the format cannot encode its own. `quality` applies to JPEG and
+    WebP.
+    """
+    # Encode a private copy: it fixes PIL images whose width and height are
+    # inconsistent with their byte data, and keeps encoding on a worker thread
+    # away from the caller's image, which other stages may still be using.
+    image = image.copy()
+    if max_edge is not None and max(image.size) > max_edge:
+        ratio = max_edge / max(image.size)
+        image = image.resize(
+            (max(1, round(image.width * ratio)), max(1, round(image.height * ratio))),
+            Image.Resampling.LANCZOS,
+            reducing_gap=3.0,
+        )
+    if grayscale and image.mode not in ("1", "L"):
+        image = image.convert("L")
+    if image.mode not in _NATIVE_MODES[image_format]:
+        has_alpha = image.mode in ("LA", "PA", "RGBA") or "transparency" in image.info
+        if grayscale:
+            image = image.convert("L")
+        elif has_alpha and image_format != "jpeg":
+            image = image.convert("RGBA")
+        else:
+            image = image.convert("RGB")
+
+    img_io = BytesIO()
+    if image_format == "png":
+        image.save(img_io, "PNG", compress_level=1)
+    else:
+        image.save(img_io, image_format.upper(), quality=quality)
+    image_base64 = base64.b64encode(img_io.getbuffer()).decode("ascii")
+    return f"data:image/{image_format};base64,{image_base64}"
+
+
+def api_image_request(
+    image: Union[Image.Image, str],
     prompt: str,
     url: AnyUrl,
     timeout: float = 20,
     headers: Optional[dict[str, str]] = None,
+    client: Optional[ApiClient] = None,
     **params,
 ) -> Tuple[str, Optional[int], VlmStopReason]:
-    img_io = BytesIO()
-    image = (
-        image.copy()
-    )  # Fix for inconsistent PIL image width/height to actual byte data
-    image = image.convert("RGBA")
-    good_image = True
-    try:
-        image.save(img_io, "PNG")
-    except Exception as e:
-        good_image = False
-        _log.error(f"Error, corrupter PNG of size: {image.size}: {e}")
-
-    if good_image:
+    """
+    Request a chat completion about an image from an OpenAI-compatible server.
+    The image is either a PIL image, sent as a PNG, or the URL of an image,
+    such as the data URL made by `encode_image`.
+    """
+    if isinstance(image, Image.Image):
         try:
-            image_base64 = base64.b64encode(img_io.getvalue()).decode("utf-8")
+            image_url = encode_image(image)
+        except Exception as e:
+            _log.error(f"Error, corrupter PNG of size: {image.size}: {e}")
+            return "", 0, VlmStopReason.UNSPECIFIED
+    else:
+        image_url = image
 
+    if image_url:
+        try:
             messages = [
                 {
                     "role": "user",
                     "content": [
                         {
                             "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_base64}"
-                            },
+                            "image_url": {"url": image_url},
                         },
                         {
                             "type": "text",
@@ -62,8 +117,9 @@ def api_image_request(
             }
 
             headers = headers or {}
+            client = client or get_api_client(str(url))
 
-            r = requests.post(
+            r = client.post(
                 str(url),
                 headers=headers,
                 json=payload,
@@ -92,13 +148,14 @@ def api_image_request(
 
 
 def api_image_request_streaming(
-    image: Image.Image,
+    image: Union[Image.Image, str],
     prompt: str,
     url: AnyUrl,
     *,
     timeout: float = 20,
     headers: Optional[dict[str, str]] = None,
     generation_stoppers: list[GenerationStopper] = [],
+    client: Optional[ApiClient] = None,
     **params,
 ) -> Tuple[str, Optional[int]]:
     """
@@ -106,10 +163,10 @@ def api_image_request_streaming(
     Parses SSE lines: 'data: {json}\\n\\n', terminated by 'data: [DONE]'.
     Accumulates text and calls stopper.should_stop(window) as chunks arrive.
     If stopper triggers, the HTTP connection is closed to abort server-side generation.
+    The image is either a PIL image, sent as a PNG, or the URL of an image.
     """
-    img_io = BytesIO()
-    image.save(img_io, "PNG")
-    image_b64 = base64.b64encode(img_io.getvalue()).decode("utf-8")
+    if isinstance(image, Image.Image):
+        image = encode_image(image)
 
     messages = [
         {
@@ -117,7 +174,7 @@ def api_image_request_streaming(
             "content": [
                 {
                     "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{image_b64}"},
+                    "image_url": {"url": image},
                 },
                 {"type": "text", "text": prompt},
             ],
@@ -142,9 +199,8 @@ def api_image_request_streaming(
         hdrs["X-Temperature"] = str(params["temperature"])
 
     # Stream the HTTP response
-    with requests.post(
-        str(url), headers=hdrs, json=payload, timeout=timeout, stream=True
-    ) as r:
+    client = client or get_api_client(str(url))
+    with client.stream(str(url), headers=hdrs, json=payload, timeout=timeout) as r:
         if not r.ok:
             _log.error(
                 f"Error calling the API {url} in streaming mode. Response was {r.text}"
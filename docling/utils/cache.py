@@ -0,0 +1,320 @@
+"""Caches of conversion inputs and outputs."""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional, TypeVar
+
+from pydantic import BaseModel
+
+from docling.datamodel.document import ConversionAssets, DoclingVersion
+from docling.datamodel.settings import settings
+
+_log = logging.getLogger(__name__)
+
+EntryT = TypeVar("EntryT", bound=BaseModel)
+
+
+class CacheStats(BaseModel):
+    """Counters of a cache, since its creation in this process."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DiskLruCache:
+    """Size-bounded directory of cache files, evicting the least recently used.
+
+    Recency is tracked by the modification time of the files, which is
+    refreshed on every hit, so several processes can share one directory.
+    Entries are written to a temporary file and moved in place, readers never
+    see partial files.
+    """
+
+    def __init__(self, cache_dir: Path, max_size_bytes: int, suffix: str = ""):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.suffix = suffix
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._size_bytes = sum(size for _, size, _ in self._scan())
+
+    def __getstate__(self):
+        # Caches are shared with worker processes, which count their own stats.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_stats"] = CacheStats()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{self.suffix}"
+
+    def _scan(self) -> list[tuple[Path, int, float]]:
+        entries = []
+        for path in self.cache_dir.glob(f"*/*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:  # removed by another process
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """Return the file of *key* and mark it as recently used, if cached."""
+        path = self._path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._stats.misses += 1
+            return None
+        with self._lock:
+            self._stats.hits += 1
+        return path
+
+    def store(self, key: str, write: Callable[[Path], None]) -> None:
+        """Store the entry of *key*, written by *write* to the given path."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            write(tmp_path)
+            size = tmp_path.stat().st_size
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._stats.stores += 1
+            self._size_bytes += size
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def discard(self, key: str) -> None:
+        """Remove the entry of *key* after a hit which could not be read."""
+        self._path(key).unlink(missing_ok=True)
+        with self._lock:
+            self._stats.hits -= 1
+            self._stats.misses += 1
+
+    def _evict(self) -> None:
+        # Rescan, other processes may have added or removed entries.
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        self._size_bytes = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._size_bytes <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._size_bytes -= size
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            for path, _, _ in self._scan():
+                path.unlink(missing_ok=True)
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        entries = self._scan()
+        with self._lock:
+            return self._stats.model_copy(
+                update={
+                    "entries": len(entries),
+                    "size_bytes": sum(size for _, size, _ in entries),
+                }
+            )
+
+
+class MemoryContentStore:
+    """Size-bounded in-memory store of blobs, addressed by their content.
+
+    Blobs are looked up by the key of their source, such as a URL, but stored
+    once under the digest of their content, so identical content from several
+    sources is kept once. The least recently used blobs are evicted first.
+    """
+
+    def __init__(self, max_size_bytes: int):
+        self.max_size_bytes = max_size_bytes
+
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._digests: dict[str, str] = {}
+        self._keys: dict[str, set[str]] = {}
+        self._blobs: OrderedDict[str, bytes] = OrderedDict()
+        self._size_bytes = 0
+
+    def lookup(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest is None:
+                self._stats.misses += 1
+                return None
+            self._blobs.move_to_end(digest)
+            self._stats.hits += 1
+            return self._blobs[digest]
+
+    def store(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_size_bytes:
+            # Too large to keep, but the key must not serve its previous content
+            with self._lock:
+                self._unlink(key)
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+            else:
+                self._blobs[digest] = data
+                self._size_bytes += len(data)
+                self._stats.stores += 1
+            if self._digests.get(key) != digest:
+                self._unlink(key)
+            self._digests[key] = digest
+            self._keys.setdefault(digest, set()).add(key)
+            self._evict()
+
+    def _unlink(self, key: str) -> None:
+        """Remove *key*, and the blob it pointed to if no other key does."""
+        digest = self._digests.pop(key, None)
+        if digest is None:
+            return
+        keys = self._keys[digest]
+        keys.discard(key)
+        if not keys:
+            del self._keys[digest]
+            self._size_bytes -= len(self._blobs.pop(digest))
+
+    def _evict(self) -> None:
+        while self._size_bytes > self.max_size_bytes:
+            digest, data = self._blobs.popitem(last=False)
+            self._size_bytes -= len(data)
+            for key in self._keys.pop(digest, ()):
+                del self._digests[key]
+            self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._digests.clear()
+            self._keys.clear()
+            self._blobs.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return self._stats.model_copy(
+                update={"entries": len(self._blobs), "size_bytes": self._size_bytes}
+            )
+
+
+class ConversionResultCache(DiskLruCache):
+    """Cache of conversion results, keyed by input content and options.
+
+    Entries are stored with `ConversionAssets.save`. The key combines the
+    `document_hash` of the input, a hash of everything configuring its
+    conversion and the Docling versions, so upgrades never serve stale
+    results.
+
+    Args:
+        cache_dir: Directory of the cache, by default `results` in the Docling
+            cache directory.
+        max_size_bytes: Size of the cache above which the least recently used
+            results are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_bytes: int = 1 << 30):
+        super().__init__(
+            cache_dir=cache_dir or settings.cache_dir / "results",
+            max_size_bytes=max_size_bytes,
+            suffix=".zip",
+        )
+
+    @staticmethod
+    def make_key(document_hash: str, options_hash: str) -> str:
+        version = DoclingVersion()
+        key_str = "|".join(
+            [
+                document_hash,
+                options_hash,
+                version.docling_version,
+                version.docling_core_version,
+            ]
+        )
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[ConversionAssets]:
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            return ConversionAssets.load(path)
+        except Exception as e:
+            _log.warning(f"Discarding unreadable cached result {path}: {e}")
+            self.discard(key)
+            return None
+
+    def save(self, key: str, assets: ConversionAssets) -> None:
+        self.store(key, lambda path: assets.save(filename=path))
+
+
+class PagePredictionCache(DiskLruCache):
+    """Cache of model predictions, keyed by page content and model options.
+
+    Entries are pydantic models stored as JSON. Keys are built by the caller
+    from a hash of the page content and a fingerprint of the model, see
+    `docling.models.cached_page_model`.
+
+    Args:
+        cache_dir: Directory of the cache, by default `pages` in the Docling
+            cache directory.
+        max_size_bytes: Size of the cache above which the least recently used
+            predictions are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_size_bytes: int = 1 << 30):
+        super().__init__(
+            cache_dir=cache_dir or settings.cache_dir / "pages",
+            max_size_bytes=max_size_bytes,
+            suffix=".json",
+        )
+
+    def load(self, key: str, entry_type: type[EntryT]) -> Optional[EntryT]:
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            return entry_type.model_validate_json(path.read_bytes())
+        except Exception as e:
+            _log.warning(f"Discarding unreadable cached prediction {path}: {e}")
+            self.discard(key)
+            return None
+
+    def save(self, key: str, entry: BaseModel) -> None:
+        def write(path: Path) -> None:
+            path.write_text(entry.model_dump_json(), encoding="utf-8")
+
+        self.store(key, write)
@@ -3,7 +3,8 @@ import logging
 import sys
 from collections import defaultdict
 
-from docling_core.types.doc import DocItemLabel, Size
+import numpy as np
+from docling_core.types.doc import CoordOrigin, DocItemLabel, Size
 from docling_core.types.doc.page import TextCell
 from rtree import index
 
@@ -151,6 +152,62 @@ class IntervalTree:
         return result
 
 
+def _boxes_to_array(bboxes: list[BoundingBox]) -> np.ndarray:
+    """Pack bounding boxes into an (N, 4) array of (x0, y0, x1, y1).
+
+    The vertical extent is stored such that ``min(y1) - max(y0)`` of two boxes
+    reproduces ``BoundingBox.intersection_area_with`` for their common origin.
+    """
+    arr = np.empty((len(bboxes), 4), dtype=np.float64)
+    for i, bbox in enumerate(bboxes):
+        if bbox.coord_origin == CoordOrigin.TOPLEFT:
+            arr[i] = (bbox.l, bbox.t, bbox.r, bbox.b)
+        else:
+            arr[i] = (bbox.l, bbox.b, bbox.r, bbox.t)
+    return arr
+
+
+def best_overlap_assignment(
+    cell_boxes: np.ndarray,
+    cluster_boxes: np.ndarray,
+    min_overlap: float,
+    chunk_size: int = 4096,
+) -> np.ndarray:
+    """Find, for every cell, the cluster with the highest intersection-over-self.
+
+    Both inputs are arrays produced by ``_boxes_to_array`` for boxes sharing the
+    same coordinate origin. Returns an int array with the index of the best
+    cluster per cell, or -1 if no cluster overlaps more than ``min_overlap``.
+    Ties resolve to the first cluster, as in a sequential scan.
+    """
+    result = np.full(len(cell_boxes), -1, dtype=np.int64)
+    if len(cell_boxes) == 0 or len(cluster_boxes) == 0:
+        return result
+
+    cl_x0, cl_y0, cl_x1, cl_y1 = (cluster_boxes[:, k][None, :] for k in range(4))
+
+    # Cells are processed in chunks to bound the size of the cells x clusters
+    # intermediates on very dense pages.
+    for start in range(0, len(cell_boxes), chunk_size):
+        chunk = cell_boxes[start : start + chunk_size]
+        x0, y0, x1, y1 = (chunk[:, k][:, None] for k in range(4))
+        area = np.abs(x1 - x0) * np.abs(y1 - y0)
+
+        width = np.minimum(x1, cl_x1) - np.maximum(x0, cl_x0)
+        height = np.minimum(y1, cl_y1) - np.maximum(y0, cl_y0)
+        inter = np.where((width > 0) & (height > 0), width * height, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(area > 0, inter / area, 0.0)
+
+        best = np.argmax(ratio, axis=1)
+        best_ratio = ratio[np.arange(len(chunk)), best]
+        result[start : start + len(chunk)] = np.where(
+            best_ratio > min_overlap, best, -1
+        )
+
+    return result
+
+
 class LayoutPostprocessor:
     """Postprocesses layout predictions by cleaning up clusters and mapping cells."""
 
@@ -588,26 +645,36 @@ class LayoutPostprocessor:
         for cluster in clusters:
             cluster.cells = []
 
+        cells = []
+        cell_bboxes = []
         for cell in self.cells:
             if not cell.text.strip():
                 continue
+            bbox = cell.rect.to_bounding_box()
+            if bbox.area() <= 0:
+                continue
+            cells.append(cell)
+            cell_bboxes.append(bbox)
+
+        origins = {b.coord_origin for b in cell_bboxes}
+        origins.update(c.bbox.coord_origin for c in clusters)
+        if len(origins) > 1:
+            # Mixed coordinate origins are not comparable, take the scalar path
+            # which surfaces the same error as BoundingBox.intersection_area_with.
+            assignment = [
+                self._best_cluster_for_cell(bbox, clusters, min_overlap)
+                for bbox in cell_bboxes
+            ]
+        else:
+            assignment = best_overlap_assignment(
+                _boxes_to_array(cell_bboxes),
+                _boxes_to_array([c.bbox for c in clusters]),
+                min_overlap,
+            ).tolist()
 
-            best_overlap = min_overlap
-            best_cluster = None
-
-            for cluster in clusters:
-                if cell.rect.to_bounding_box().area() <= 0:
-                    continue
-
-                overlap_ratio = cell.rect.to_bounding_box().intersection_over_self(
-                    cluster.bbox
-                )
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_cluster = cluster
-
-            if best_cluster is not None:
-                best_cluster.cells.append(cell)
+        for cell, cluster_idx in zip(cells, assignment):
+            if cluster_idx >= 0:
+                clusters[cluster_idx].cells.append(cell)
 
         # Deduplicate cells in each cluster after assignment
         for cluster in clusters:
@@ -615,6 +682,19 @@ class LayoutPostprocessor:
 
         return clusters
 
+    def _best_cluster_for_cell(
+        self, cell_bbox: BoundingBox, clusters: list[Cluster], min_overlap: float
+    ) -> int:
+        """Index of the best overlapping cluster for a single cell, or -1."""
+        best_overlap = min_overlap
+        best_idx = -1
+        for idx, cluster in enumerate(clusters):
+            overlap_ratio = cell_bbox.intersection_over_self(cluster.bbox)
+            if overlap_ratio > best_overlap:
+                best_overlap = overlap_ratio
+                best_idx = idx
+        return best_idx
+
     def _find_unassigned_cells(self, clusters: list[Cluster]) -> list[TextCell]:
         """Find cells not assigned to any cluster."""
         assigned = {cell.index for cluster in clusters for cell in cluster.cells}
@@ -1,7 +1,10 @@
-from typing import Optional, Tuple
+from collections.abc import Iterable
+from typing import List, Optional, Tuple
 
-from docling_core.types.doc import BoundingBox, CoordOrigin
+import numpy as np
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
 from docling_core.types.doc.page import BoundingRectangle
+from PIL import Image, ImageDraw
 
 from docling.utils.orientation import CLIPPED_ORIENTATIONS, rotate_bounding_box
 
@@ -67,3 +70,142 @@ def tesseract_box_to_bounding_rectangle(
             rect.r_y2 += original_offset.t
             rect.r_y3 += original_offset.t
     return rect
+
+
+# Above this number of bitmap rects, merging them on a raster is cheaper.
+_MAX_GEOMETRIC_RECTS = 1024
+
+
+def find_ocr_rects(
+    size: Size, bitmap_rects: Iterable[BoundingBox]
+) -> Tuple[float, List[BoundingBox]]:
+    r"""
+    Merge nearby bitmap rects into the rects to OCR on a page
+
+    The bitmap rects are dilated by 10 pixels on the page pixel grid, and
+    touching ones are merged. Returns the fraction of the page covered by the
+    dilated rects and the bounding boxes of the merged ones, in the same order
+    as a connected component labelling of the page raster, without rendering
+    the raster.
+    """
+    bitmap_rects = list(bitmap_rects)
+    width, height = round(size.width), round(size.height)
+    boxes = []
+    for rect in bitmap_rects:
+        x0, y0, x1, y1 = (round(v) for v in rect.as_tuple())
+        # Only the part of a rect which lies on the page is dilated
+        if max(x0, 0) > min(x1, width - 1) or max(y0, 0) > min(y1, height - 1):
+            continue
+        boxes.append(
+            (
+                max(x0 - 10, 0),
+                max(y0 - 10, 0),
+                min(x1 + 9, width - 1),
+                min(y1 + 9, height - 1),
+            )
+        )
+
+    if not boxes:
+        return 0.0, []
+    if len(boxes) > _MAX_GEOMETRIC_RECTS:
+        return _find_ocr_rects_raster(size, bitmap_rects)
+
+    # Pixel-inclusive l, t, r, b of the dilated rects
+    lt_rb = np.array(boxes)
+    left, top, right, bottom = lt_rb.T
+
+    # Rects are 4-connected if they overlap along one axis and overlap or
+    # are adjacent along the other one.
+    gap_x = np.maximum.outer(left, left) - np.minimum.outer(right, right)
+    gap_y = np.maximum.outer(top, top) - np.minimum.outer(bottom, bottom)
+    connected = ((gap_x <= 0) & (gap_y <= 1)) | ((gap_x <= 1) & (gap_y <= 0))
+
+    parents = list(range(len(boxes)))
+
+    def find(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    for i, j in zip(*np.nonzero(np.triu(connected, k=1))):
+        parents[find(int(i))] = find(int(j))
+
+    components: dict[int, List[int]] = {}
+    for i in range(len(boxes)):
+        components.setdefault(find(i), []).append(i)
+
+    # Components are labelled in the order of their first pixel, row by row
+    ordered = sorted(
+        components.values(), key=lambda ids: min((top[i], left[i]) for i in ids)
+    )
+    bounding_boxes = [
+        BoundingBox(
+            l=int(left[ids].min()),
+            t=int(top[ids].min()),
+            r=int(right[ids].max()),
+            b=int(bottom[ids].max()),
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        for ids in ordered
+    ]
+
+    # Area of the union of the rects, on the grid of their edges
+    xs = np.unique(np.concatenate([left, right + 1]))
+    ys = np.unique(np.concatenate([top, bottom + 1]))
+    covered = np.zeros((len(ys) - 1, len(xs) - 1), dtype=bool)
+    for x0, y0, x1, y1 in boxes:
+        covered[
+            np.searchsorted(ys, y0) : np.searchsorted(ys, y1 + 1),
+            np.searchsorted(xs, x0) : np.searchsorted(xs, x1 + 1),
+        ] = True
+    area = np.outer(np.diff(ys), np.diff(xs))[covered].sum()
+    area_frac = float(area) / (size.width * size.height)
+
+    return area_frac, bounding_boxes
+
+
+def _find_ocr_rects_raster(
+    size: Size, bitmap_rects: Iterable[BoundingBox]
+) -> Tuple[float, List[BoundingBox]]:
+    from scipy.ndimage import binary_dilation, find_objects, label
+
+    image = Image.new(
+        "1", (round(size.width), round(size.height))
+    )  # '1' mode is binary
+
+    # Draw all bitmap rects into a binary image
+    draw = ImageDraw.Draw(image)
+    for rect in bitmap_rects:
+        x0, y0, x1, y1 = rect.as_tuple()
+        x0, y0, x1, y1 = round(x0), round(y0), round(x1), round(y1)
+        draw.rectangle([(x0, y0), (x1, y1)], fill=1)
+
+    np_image = np.array(image)
+
+    # Dilate the image by 10 pixels to merge nearby bitmap rectangles
+    structure = np.ones(
+        (20, 20)
+    )  # Create a 20x20 structure element (10 pixels in all directions)
+    np_image = binary_dilation(np_image > 0, structure=structure)
+
+    # Find the connected components
+    labeled_image, num_features = label(np_image > 0)  # Label black (0 value) regions
+
+    # Find enclosing bounding boxes for each connected component.
+    slices = find_objects(labeled_image)
+    bounding_boxes = [
+        BoundingBox(
+            l=slc[1].start,
+            t=slc[0].start,
+            r=slc[1].stop - 1,
+            b=slc[0].stop - 1,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        for slc in slices
+    ]
+
+    # Compute area fraction on page covered by bitmaps
+    area_frac = np.sum(np_image > 0) / (size.width * size.height)
+
+    return (area_frac, bounding_boxes)  # fraction covered  # boxes
@@ -0,0 +1,15 @@
+"""Stable fingerprints of option models."""
+
+import hashlib
+
+from pydantic import BaseModel
+
+
+def options_fingerprint(options: BaseModel) -> str:
+    """Hash of the serialized *options*."""
+    try:
+        options_str = options.model_dump_json()
+    except Exception:
+        # Options holding arbitrary objects, e.g. custom stopping criteria
+        options_str = str(options.model_dump())
+    return hashlib.md5(options_str.encode("utf-8"), usedforsecurity=False).hexdigest()
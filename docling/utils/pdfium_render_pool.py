@@ -0,0 +1,202 @@
+"""Out-of-process page rendering with pypdfium2.
+
+PDFium is not thread-safe, not even across different documents, so every
+in-process call is serialized by :data:`docling.utils.locks.pypdfium2_lock`.
+A :class:`PdfiumRenderPool` lifts this limit for rasterization: each worker
+process owns its own PDFium instance and opens documents by path, so pages of
+any number of documents are rendered in parallel.
+"""
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Optional, Union
+
+import pypdfium2 as pdfium
+from PIL import Image
+
+_log = logging.getLogger(__name__)
+
+# Documents kept open per worker process, most recently used last.
+_WORKER_MAX_OPEN_DOCS = 8
+_worker_docs: "OrderedDict[tuple[str, str], pdfium.PdfDocument]" = OrderedDict()
+
+
+def _worker_get_document(
+    path: str, doc_key: str, password: Optional[str]
+) -> pdfium.PdfDocument:
+    key = (path, doc_key)
+    pdoc = _worker_docs.get(key)
+    if pdoc is None:
+        pdoc = pdfium.PdfDocument(path, password=password)
+        _worker_docs[key] = pdoc
+        while len(_worker_docs) > _WORKER_MAX_OPEN_DOCS:
+            _, evicted = _worker_docs.popitem(last=False)
+            evicted.close()
+    else:
+        _worker_docs.move_to_end(key)
+    return pdoc
+
+
+def _worker_release(path: str, doc_key: str) -> None:
+    pdoc = _worker_docs.pop((path, doc_key), None)
+    if pdoc is not None:
+        pdoc.close()
+
+
+def _worker_render(
+    path: str,
+    doc_key: str,
+    password: Optional[str],
+    page_no: int,
+    scale: float,
+    crop: tuple[float, float, float, float],
+    size: tuple[int, int],
+) -> Image.Image:
+    pdoc = _worker_get_document(path, doc_key, password)
+    ppage = pdoc[page_no]
+    try:
+        return (
+            ppage.render(scale=scale, rotation=0, crop=crop).to_pil().resize(size=size)
+        )
+    finally:
+        ppage.close()
+
+
+class PdfiumRenderPool:
+    """Pool of worker processes rendering PDF pages, each with its own PDFium.
+
+    Each worker is a single-process executor, so that a document can be
+    released in exactly the workers which opened it.
+    """
+
+    def __init__(self, num_workers: int):
+        self.num_workers = num_workers
+        # spawn: forking a process while another thread is inside PDFium could
+        # leave the child with a corrupted library state.
+        mp_context = multiprocessing.get_context("spawn")
+        self._workers = [
+            ProcessPoolExecutor(max_workers=1, mp_context=mp_context)
+            for _ in range(num_workers)
+        ]
+        self._pending = [0] * num_workers
+        # Documents each worker may hold open
+        self._opened: list[set[tuple[str, str]]] = [set() for _ in range(num_workers)]
+        self._lock = threading.Lock()
+
+    def render(
+        self,
+        path: Path,
+        doc_key: str,
+        page_no: int,
+        scale: float,
+        crop: tuple[float, float, float, float],
+        size: tuple[int, int],
+        password: Optional[str] = None,
+    ) -> Image.Image:
+        """Render a page at *scale*, cropped by *crop* and resized to *size*."""
+        with self._lock:
+            # The least busy worker
+            idx = min(range(self.num_workers), key=self._pending.__getitem__)
+            self._pending[idx] += 1
+            self._opened[idx].add((str(path), doc_key))
+        try:
+            future = self._workers[idx].submit(
+                _worker_render, str(path), doc_key, password, page_no, scale, crop, size
+            )
+            return future.result()
+        finally:
+            with self._lock:
+                self._pending[idx] -= 1
+
+    def release(self, path: Path, doc_key: str) -> None:
+        """Close the document in the workers which opened it."""
+        key = (str(path), doc_key)
+        futures = []
+        with self._lock:
+            for worker, opened in zip(self._workers, self._opened):
+                if key in opened:
+                    opened.discard(key)
+                    futures.append(worker.submit(_worker_release, *key))
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+
+
+_pools: dict[int, PdfiumRenderPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_render_pool(num_workers: int) -> PdfiumRenderPool:
+    """Return the process-wide render pool with *num_workers* workers."""
+    with _pools_lock:
+        pool = _pools.get(num_workers)
+        if pool is None:
+            pool = PdfiumRenderPool(num_workers)
+            _pools[num_workers] = pool
+        return pool
+
+
+class PdfiumPageRenderer:
+    """Renders the pages of one document through a :class:`PdfiumRenderPool`.
+
+    Workers open documents by path, so in-memory streams are spilled once to a
+    temporary file. :meth:`close` releases the document in the workers, then
+    removes that file.
+    """
+
+    def __init__(
+        self,
+        pool: PdfiumRenderPool,
+        path_or_stream: Union[BytesIO, Path],
+        doc_key: str,
+        password: Optional[str] = None,
+    ):
+        self._pool = pool
+        self._doc_key = doc_key
+        self._password = password
+        self._tmp_path: Optional[Path] = None
+
+        if isinstance(path_or_stream, Path):
+            self._path = path_or_stream
+        else:
+            fd, tmp_name = tempfile.mkstemp(suffix=".pdf", prefix="docling_render_")
+            with os.fdopen(fd, "wb") as fw:
+                fw.write(path_or_stream.getbuffer())
+            self._tmp_path = Path(tmp_name)
+            self._path = self._tmp_path
+
+    def render(
+        self,
+        page_no: int,
+        scale: float,
+        crop: tuple[float, float, float, float],
+        size: tuple[int, int],
+    ) -> Image.Image:
+        return self._pool.render(
+            self._path,
+            self._doc_key,
+            page_no,
+            scale=scale,
+            crop=crop,
+            size=size,
+            password=self._password,
+        )
+
+    def close(self) -> None:
+        self._pool.release(self._path, self._doc_key)
+        if self._tmp_path is not None:
+            try:
+                self._tmp_path.unlink()
+            except OSError:
+                _log.debug("Could not remove render file %s", self._tmp_path)
+            self._tmp_path = None
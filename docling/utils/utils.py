@@ -1,12 +1,16 @@
 import hashlib
+import mmap
+import os
 from io import BytesIO
 from itertools import islice
 from pathlib import Path
-from typing import List, Union
+from typing import Any, List, Literal, Optional, Union
 
 import requests
 from tqdm import tqdm
 
+from docling.datamodel.settings import settings
+
 
 def chunkify(iterator, chunk_size):
     """Yield successive chunks of chunk_size from the iterable."""
@@ -16,23 +20,44 @@ def chunkify(iterator, chunk_size):
         yield [first, *list(islice(iterator, chunk_size - 1))]
 
 
-def create_file_hash(path_or_stream: Union[BytesIO, Path]) -> str:
-    """Create a stable page_hash of the path_or_stream of a file"""
-
-    block_size = 65536
-    hasher = hashlib.sha256(usedforsecurity=False)
+def create_file_hash(
+    path_or_stream: Union[BytesIO, Path],
+    method: Optional[Literal["sha256", "xxh3", "size_mtime"]] = None,
+) -> str:
+    """Create a stable page_hash of the path_or_stream of a file
+
+    Files are memory-mapped and streams hashed from their buffer, so the content
+    is hashed in a single pass without copies and streams keep their position.
+    The method defaults to `settings.perf.doc_hash_method`.
+    """
+    method = method or settings.perf.doc_hash_method
+    if method == "size_mtime" and isinstance(path_or_stream, Path):
+        stat = path_or_stream.stat()
+        return create_hash(
+            f"{path_or_stream.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+        )
 
-    def _hash_buf(binary_stream):
-        buf = binary_stream.read(block_size)  # read and page_hash in chunks
-        while len(buf) > 0:
-            hasher.update(buf)
-            buf = binary_stream.read(block_size)
+    hasher: Any
+    if method == "xxh3":
+        try:
+            import xxhash
+        except ImportError:
+            raise ImportError(
+                "xxhash is not installed. Please install it via `pip install xxhash` "
+                "to hash documents with xxh3."
+            )
+        hasher = xxhash.xxh3_128()
+    else:
+        hasher = hashlib.sha256(usedforsecurity=False)
 
     if isinstance(path_or_stream, Path):
         with path_or_stream.open("rb") as afile:
-            _hash_buf(afile)
+            if os.fstat(afile.fileno()).st_size > 0:  # empty files can't be mapped
+                with mmap.mmap(afile.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    hasher.update(view)
     elif isinstance(path_or_stream, BytesIO):
-        _hash_buf(path_or_stream)
+        with path_or_stream.getbuffer() as view:
+            hasher.update(view)
 
     return hasher.hexdigest()
 
@@ -0,0 +1,88 @@
+# %% [markdown]
+# What this example does
+# - Measure the payload size and encoding time of the page images sent to a
+#   remote VLM (`ApiVlmOptions`) or picture description API
+#   (`PictureDescriptionApiOptions`), for each image encoding.
+#
+# Requirements
+# - Python 3.9+
+# - Install Docling: `pip install docling`
+#
+# How to run
+# - `python docs/examples/api_image_encoding.py [PDF ...]`
+#
+# Notes
+# - Pages are rendered at `SCALE`, like `ApiVlmOptions.scale`.
+# - The payload is the base64 data URL embedded in each request.
+# - The options `image_format`, `image_quality`, `image_max_edge` and
+#   `image_grayscale` select the encoding.
+# %%
+
+import sys
+import time
+from pathlib import Path
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+from docling.utils.api_image_request import encode_image
+
+SCALE = 2.0
+
+ENCODINGS = [
+    ("png", dict()),
+    ("png", dict(grayscale=True)),
+    ("jpeg", dict(quality=90)),
+    ("jpeg", dict(quality=75)),
+    ("jpeg", dict(quality=75, grayscale=True)),
+    ("jpeg", dict(quality=75, max_edge=1280)),
+    ("webp", dict(quality=90)),
+    ("webp", dict(quality=75)),
+    ("webp", dict(quality=75, max_edge=1280)),
+]
+
+
+def main():
+    sources = [Path(p) for p in sys.argv[1:]] or [
+        Path("tests/data/pdf/2206.01062.pdf"),
+        Path("tests/data/pdf/2305.03393v1-pg9.pdf"),
+        Path("tests/data/pdf/redp5110_sampled.pdf"),
+    ]
+
+    images = []
+    for source in sources:
+        if not source.exists():
+            continue
+        doc = InputDocument(
+            path_or_stream=source,
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+        for page_no in range(doc.page_count):
+            page = doc._backend.load_page(page_no)  # type: ignore[attr-defined]
+            images.append(page.get_page_image(scale=SCALE))
+            page.unload()
+        doc._backend.unload()
+    if not images:
+        print("No pages to encode")
+        return
+
+    print(f"{len(images)} pages rendered at scale {SCALE}\n")
+    print(f"{'encoding':<40} {'KB/page':>9} {'ms/page':>9}")
+    for image_format, kwargs in ENCODINGS:
+        start = time.perf_counter()
+        num_bytes = sum(
+            len(encode_image(image, image_format, **kwargs))  # type: ignore[arg-type]
+            for image in images
+        )
+        elapsed = time.perf_counter() - start
+
+        name = ", ".join([image_format] + [f"{k}={v}" for k, v in kwargs.items()])
+        print(
+            f"{name:<40} {num_bytes / len(images) / 1024:9.1f} "
+            f"{elapsed / len(images) * 1000:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
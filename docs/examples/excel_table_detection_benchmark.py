@@ -0,0 +1,102 @@
+# %% [markdown]
+# What this example does
+# - Measure the conversion time of large Excel workbooks, where most of the time
+#   goes to detecting the tables of each sheet and their merged cells.
+#
+# Requirements
+# - Python 3.9+
+# - Install Docling: `pip install docling`
+#
+# How to run
+# - `python docs/examples/excel_table_detection_benchmark.py [XLSX ...]`
+#
+# Notes
+# - Without arguments, workbooks of report-like tables are generated: a merged
+#   title, merged group headers, merged row labels and numeric cells.
+# - The load time is spent in openpyxl, the convert time in the backend.
+# %%
+
+import random
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from docling.backend.msexcel_backend import MsExcelDocumentBackend
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+
+
+def synthetic_workbook(
+    num_tables: int, num_rows: int = 40, num_groups: int = 6, group_width: int = 4
+) -> bytes:
+    rnd = random.Random(42)
+    wb = Workbook()
+    ws = wb.active
+    num_cols = 1 + num_groups * group_width
+    row = 1
+    for t in range(num_tables):
+        # Title spanning the whole table
+        ws.cell(row, 1, f"Table {t}")
+        ws.merge_cells(start_row=row, start_column=1, end_row=row, end_column=num_cols)
+        # Group headers spanning their columns, and one header per column
+        for g in range(num_groups):
+            col = 2 + g * group_width
+            ws.cell(row + 1, col, f"Group {g}")
+            ws.merge_cells(
+                start_row=row + 1,
+                start_column=col,
+                end_row=row + 1,
+                end_column=col + group_width - 1,
+            )
+        ws.cell(row + 1, 1, "Label")
+        for c in range(2, num_cols + 1):
+            ws.cell(row + 2, c, f"Q{(c - 2) % group_width + 1}")
+        # Row labels spanning blocks of rows
+        for r in range(row + 3, row + 3 + num_rows, 5):
+            ws.cell(r, 1, f"Block {r}")
+            ws.merge_cells(start_row=r, start_column=1, end_row=r + 4, end_column=1)
+        for r in range(row + 3, row + 3 + num_rows):
+            for c in range(2, num_cols + 1):
+                ws.cell(r, c, rnd.randint(0, 99999) / 100)
+        row += num_rows + 5  # Blank rows between tables
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def convert(name: str, data: bytes) -> tuple[float, float, int]:
+    """Load and convert a workbook, return the load and convert times."""
+    start = time.perf_counter()
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(data),
+        format=InputFormat.XLSX,
+        backend=MsExcelDocumentBackend,
+        filename=name,
+    )
+    loaded = time.perf_counter()
+    doc = in_doc._backend.convert()  # type: ignore[attr-defined]
+    return loaded - start, time.perf_counter() - loaded, len(doc.tables)
+
+
+def main():
+    if len(sys.argv) > 1:
+        sources = [(Path(p).name, Path(p).read_bytes()) for p in sys.argv[1:]]
+    else:
+        sources = [
+            (f"synthetic_{n}.xlsx", synthetic_workbook(n)) for n in [10, 50, 200]
+        ]
+
+    print(f"{'workbook':<24} {'size':>8} {'tables':>7} {'load':>8} {'convert':>8}")
+    for name, data in sources:
+        load_time, convert_time, num_tables = convert(name, data)
+        print(
+            f"{name:<24} {len(data) / 1024:6.0f}KB {num_tables:7d} "
+            f"{load_time:7.2f}s {convert_time:7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
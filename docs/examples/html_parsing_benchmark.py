@@ -0,0 +1,94 @@
+# %% [markdown]
+# What this example does
+# - Measure the conversion time of large, table-heavy HTML documents with each
+#   parser engine of the HTML backend (`HTMLBackendOptions.parser`).
+#
+# Requirements
+# - Python 3.9+
+# - Install Docling: `pip install docling`
+#
+# How to run
+# - `python docs/examples/html_parsing_benchmark.py [HTML ...]`
+#
+# Notes
+# - Without arguments, synthetic documents with sections of nested divs,
+#   formatted paragraphs, lists and tables are generated.
+# - Parsing builds the HTML tree, conversion walks it into a DoclingDocument.
+# %%
+
+import random
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from docling.backend.html_backend import HTMLDocumentBackend
+from docling.datamodel.backend_options import HTMLBackendOptions
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+
+PARSERS = ["html.parser", "lxml"]
+
+
+def synthetic_html(num_sections: int, num_rows: int = 60, num_cols: int = 8) -> bytes:
+    rnd = random.Random(42)
+    out = ["<html><head><title>Synthetic</title></head><body>"]
+    for s in range(num_sections):
+        out.append(f"<div class='section'><h2>Section {s}</h2>")
+        for p in range(5):
+            out.append(
+                f"<div><div><p>Paragraph <b>bold {p}</b> and <i>italic</i> with "
+                f"<a href='https://example.com/{p}'>a link</a> {'lorem ipsum ' * 20}"
+                "</p></div></div>"
+            )
+        out.append("<table><thead><tr>")
+        out.extend(f"<th>Header {c}</th>" for c in range(num_cols))
+        out.append("</tr></thead><tbody>")
+        for r in range(num_rows):
+            out.append(f"<tr><td><span>Row {r}</span></td>")
+            out.extend(
+                f"<td>{rnd.randint(0, 9999) / 100}</td>" for _ in range(num_cols - 1)
+            )
+            out.append("</tr>")
+        out.append("</tbody></table><ul>")
+        out.extend(f"<li>Item {i} <em>emphasis</em></li>" for i in range(10))
+        out.append("</ul></div>")
+    out.append("</body></html>")
+    return "".join(out).encode()
+
+
+def convert(name: str, data: bytes, parser: str) -> tuple[float, float]:
+    """Parse and convert a document, return the parsing and conversion times."""
+    options = HTMLBackendOptions(parser=parser)
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(data),
+        format=InputFormat.HTML,
+        backend=HTMLDocumentBackend,
+        filename=name,
+        backend_options=options,
+    )
+    start = time.perf_counter()
+    backend = HTMLDocumentBackend(in_doc, BytesIO(data), options)
+    parsed = time.perf_counter()
+    backend.convert()
+    return parsed - start, time.perf_counter() - parsed
+
+
+def main():
+    if len(sys.argv) > 1:
+        sources = [(Path(p).name, Path(p).read_bytes()) for p in sys.argv[1:]]
+    else:
+        sources = [(f"synthetic_{n}.html", synthetic_html(n)) for n in [10, 40, 160]]
+
+    print(f"{'document':<24} {'size':>8} {'parser':<12} {'parse':>8} {'convert':>8}")
+    for name, data in sources:
+        for parser in PARSERS:
+            parse_time, convert_time = convert(name, data, parser)
+            print(
+                f"{name:<24} {len(data) / 1024:6.0f}KB {parser:<12} "
+                f"{parse_time:7.2f}s {convert_time:7.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
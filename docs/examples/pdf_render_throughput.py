@@ -0,0 +1,88 @@
+# %% [markdown]
+# What this example does
+# - Measure page rendering throughput of a PDF backend against the number of
+#   threads requesting page images, with in-process rendering (serialized by the
+#   global pypdfium2 lock) and with a pool of render worker processes.
+#
+# Requirements
+# - Python 3.9+
+# - Install Docling: `pip install docling`
+#
+# How to run
+# - `python docs/examples/pdf_render_throughput.py [PDF ...]`
+#
+# Notes
+# - Each render worker owns its own pdfium instance, see
+#   `PdfBackendOptions.render_workers`.
+# - Throughput is reported in rendered pages per second.
+# %%
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.backend_options import PdfBackendOptions
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import InputDocument
+
+SCALE = 2.0
+ROUNDS = 2
+
+
+def render_all(docs: list[InputDocument], num_threads: int) -> float:
+    """Render every page of every document once, return pages per second."""
+    jobs = [(doc, page_no) for doc in docs for page_no in range(doc.page_count)]
+    jobs = jobs * ROUNDS
+
+    def render(job):
+        doc, page_no = job
+        page = doc._backend.load_page(page_no)  # type: ignore[attr-defined]
+        page.get_page_image(scale=SCALE)
+        page.unload()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        list(pool.map(render, jobs))
+    return len(jobs) / (time.perf_counter() - start)
+
+
+def main():
+    sources = [Path(p) for p in sys.argv[1:]] or [
+        Path("tests/data/pdf/2206.01062.pdf"),
+        Path("tests/data/pdf/2305.03393v1-pg9.pdf"),
+        Path("tests/data/pdf/redp5110_sampled.pdf"),
+    ]
+    thread_counts = [1, 2, 4, 8]
+
+    print(f"{'mode':<22} " + " ".join(f"{t:>4} thr" for t in thread_counts))
+    for render_workers in [0, 2, 4, 8]:
+        options = PdfBackendOptions(render_workers=render_workers)
+        docs = [
+            InputDocument(
+                path_or_stream=source,
+                format=InputFormat.PDF,
+                backend=PyPdfiumDocumentBackend,
+                backend_options=options,
+            )
+            for source in sources
+            if source.exists()
+        ]
+        # Warm up the worker processes before measuring
+        render_all(docs[:1], num_threads=max(render_workers, 1))
+
+        rates = [render_all(docs, num_threads=t) for t in thread_counts]
+        mode = (
+            "in-process (lock)"
+            if render_workers == 0
+            else f"{render_workers} render workers"
+        )
+        print(f"{mode:<22} " + " ".join(f"{r:8.1f}" for r in rates))
+
+        for doc in docs:
+            doc._backend.unload()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+
+import pytest
+import requests
+from PIL import Image
+
+from docling.datamodel.base_models import VlmStopReason
+from docling.utils.api_client import ApiClient, RateLimiter, get_api_client
+from docling.utils.api_image_request import (
+    api_image_request,
+    api_image_request_streaming,
+    encode_image,
+)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:  # type: ignore[attr-defined]
+            server.connections.add(self.client_address)  # type: ignore[attr-defined]
+            server.requests += 1  # type: ignore[attr-defined]
+            fail = server.failures > 0  # type: ignore[attr-defined]
+            if fail:
+                server.failures -= 1  # type: ignore[attr-defined]
+        time.sleep(server.delay)  # type: ignore[attr-defined]
+        if fail:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if body.get("stream"):
+            chunks = [
+                {"choices": [{"delta": {"content": "Hello"}}]},
+                {"choices": [{"delta": {"content": " world"}}]},
+            ]
+            data = "".join(f"data: {json.dumps(c)}\n\n" for c in chunks)
+            data += "data: [DONE]\n\n"
+            content_type = "text/event-stream"
+        else:
+            data = json.dumps(
+                {
+                    "id": "stub",
+                    "created": 0,
+                    "model": "stub",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "A page."},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": 1,
+                        "completion_tokens": 2,
+                        "total_tokens": 3,
+                    },
+                }
+            )
+            content_type = "application/json"
+        encoded = data.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    server.connections = set()  # type: ignore[attr-defined]
+    server.requests = 0  # type: ignore[attr-defined]
+    server.failures = 0  # type: ignore[attr-defined]
+    server.delay = 0.0  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+
+
+def test_api_client_reuses_connections(stub_server):
+    client = ApiClient(max_connections=1)
+    image = Image.new("RGB", (32, 32), "white")
+    for _ in range(5):
+        text, num_tokens, stop_reason = api_image_request(
+            image, "Describe", _url(stub_server), client=client
+        )
+        assert text == "A page."
+        assert num_tokens == 3
+        assert stop_reason == VlmStopReason.END_OF_SEQUENCE
+
+    text, _ = api_image_request_streaming(
+        image, "Describe", _url(stub_server), client=client
+    )
+    assert text == "Hello world"
+
+    assert stub_server.requests == 6
+    assert len(stub_server.connections) == 1
+
+
+def test_api_client_retries(stub_server):
+    stub_server.failures = 2
+    client = ApiClient(max_retries=2, backoff_factor=0.01)
+    r = client.post(_url(stub_server), json={})
+    assert r.ok
+    assert stub_server.requests == 3
+
+    stub_server.failures = 2
+    client = ApiClient(max_retries=1, backoff_factor=0.01)
+    assert client.post(_url(stub_server), json={}).status_code == 503
+
+
+def test_api_client_does_not_retry_read_timeouts(stub_server):
+    # A slow generation is not sent again once the response times out
+    stub_server.delay = 0.5
+    client = ApiClient(max_retries=2, backoff_factor=0.01)
+    with pytest.raises(requests.ReadTimeout):
+        client.post(_url(stub_server), json={}, timeout=0.1)
+    time.sleep(0.5)
+    assert stub_server.requests == 1
+
+
+def test_api_client_is_shared_per_endpoint():
+    a = get_api_client("http://localhost:8000/v1/chat/completions")
+    b = get_api_client("http://localhost:8000/v2/other")
+    c = get_api_client("http://localhost:8001/v1/chat/completions")
+    d = get_api_client("http://localhost:8000/v1/chat/completions", max_retries=3)
+    assert a is b
+    assert a is not c
+    assert a is not d
+
+
+@pytest.mark.parametrize("image_format", ["png", "jpeg", "webp"])
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "CMYK"])
+def test_encode_image(image_format, mode):
+    image = Image.new(mode, (300, 200))
+    url = encode_image(image, image_format, quality=50, max_edge=150)
+    prefix = f"data:image/{image_format};base64,"
+    assert url.startswith(prefix)
+    decoded = Image.open(BytesIO(base64.b64decode(url[len(prefix) :])))
+    assert decoded.format == image_format.upper()
+    assert decoded.size == (150, 100)
+
+    url = encode_image(image, image_format, grayscale=True)
+    decoded = Image.open(BytesIO(base64.b64decode(url[len(prefix) :])))
+    assert decoded.size == (300, 200)
+    if image_format != "webp":  # WebP has no grayscale mode
+        assert decoded.mode == "L"
+
+
+def test_encode_image_leaves_source_untouched():
+    png = BytesIO()
+    Image.new("RGBA", (64, 32), "red").save(png, "PNG")
+    image = Image.open(BytesIO(png.getvalue()))  # Lazily loaded
+    url = encode_image(image, "jpeg", max_edge=16, grayscale=True)
+    assert url.startswith("data:image/jpeg;base64,")
+    assert image.mode == "RGBA"
+    assert image.size == (64, 32)
+    assert image.getpixel((0, 0)) == (255, 0, 0, 255)
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 5 / 50 * 0.9
@@ -1,13 +1,19 @@
+import base64
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 from pathlib import Path, PurePath
 from unittest.mock import Mock, mock_open, patch
 
 import pytest
+import requests
 from bs4 import BeautifulSoup
 from docling_core.types.doc import PictureItem
 from docling_core.types.doc.document import ContentLayer
+from PIL import Image
 from pydantic import AnyUrl, ValidationError
 
+from docling.backend import html_backend
 from docling.backend.html_backend import HTMLDocumentBackend
 from docling.datamodel.backend_options import HTMLBackendOptions
 from docling.datamodel.base_models import InputFormat
@@ -18,6 +24,7 @@ from docling.datamodel.document import (
     SectionHeaderItem,
 )
 from docling.document_converter import DocumentConverter, HTMLFormatOption
+from docling.utils import api_client
 
 from .test_data_gen_flag import GEN_TEST_DATA
 from .verify_utils import verify_document, verify_export
@@ -250,7 +257,7 @@ def test_e2e_html_conversions(html_paths):
         assert verify_document(doc, str(gt_path) + ".json", GENERATE)
 
 
-@patch("docling.backend.html_backend.requests.get")
+@patch("docling.utils.api_client.ApiClient.get")
 @patch("docling.backend.html_backend.open", new_callable=mock_open)
 def test_e2e_html_conversion_with_images(mock_local, mock_remote):
     source = "tests/data/html/example_01.html"
@@ -297,7 +304,7 @@ def test_e2e_html_conversion_with_images(mock_local, mock_remote):
     )
     res_remote = converter.convert(source)
     mock_remote.assert_called_once_with(
-        "https://example.com/example_image_01.png", stream=True
+        "https://example.com/example_image_01.png", stream=True, timeout=20.0
     )
     assert res_remote.document
     num_pic = 0
@@ -363,7 +370,7 @@ def test_fetch_remote_images(monkeypatch):
             InputFormat.HTML: HTMLFormatOption(backend_options=backend_options)
         },
     )
-    with patch("docling.backend.html_backend.requests.get") as mocked_get:
+    with patch("docling.utils.api_client.ApiClient.get") as mocked_get:
         res = converter.convert(source)
         mocked_get.assert_not_called()
     assert res.document
@@ -377,7 +384,7 @@ def test_fetch_remote_images(monkeypatch):
         },
     )
     with (
-        patch("docling.backend.html_backend.requests.get") as mocked_get,
+        patch("docling.utils.api_client.ApiClient.get") as mocked_get,
         pytest.warns(
             match="Fetching local resources is only allowed when set explicitly"
         ),
@@ -397,7 +404,7 @@ def test_fetch_remote_images(monkeypatch):
         },
     )
     with (
-        patch("docling.backend.html_backend.requests.get") as mocked_get,
+        patch("docling.utils.api_client.ApiClient.get") as mocked_get,
         pytest.warns(
             match="Fetching remote resources is only allowed when set explicitly"
         ),
@@ -417,7 +424,7 @@ def test_fetch_remote_images(monkeypatch):
         },
     )
     with (
-        patch("docling.backend.html_backend.requests.get") as mocked_get,
+        patch("docling.utils.api_client.ApiClient.get") as mocked_get,
         pytest.warns(match="a bytes-like object is required"),
     ):
         res = converter.convert(source)
@@ -559,3 +566,142 @@ def test_fix_invalid_paragraph_structure(html, expected):
     soup = BeautifulSoup(html, "html.parser")
     HTMLDocumentBackend._fix_invalid_paragraph_structure(soup)
     assert str(soup) == expected
+
+
+def test_html_parser_engines(html_paths):
+    """Test that the lxml parser engine converts the documents like html.parser."""
+
+    def _convert(path: Path, parser: str) -> dict:
+        options = HTMLBackendOptions(parser=parser)
+        in_doc = InputDocument(
+            path_or_stream=path,
+            format=InputFormat.HTML,
+            backend=HTMLDocumentBackend,
+            backend_options=options,
+        )
+        backend = HTMLDocumentBackend(
+            in_doc=in_doc, path_or_stream=path, options=options
+        )
+        return backend.convert().export_to_dict()
+
+    for path in html_paths:
+        assert _convert(path, "lxml") == _convert(path, "html.parser"), path.name
+
+
+def test_prefetch_images():
+    """Test that images are fetched once per source and shared across documents."""
+
+    png = BytesIO()
+    Image.new("RGB", (8, 8), "red").save(png, "PNG")
+    png_bytes = png.getvalue()
+    requested: list[str] = []
+
+    class _ImageHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            requested.append(self.path)
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(png_bytes)))
+            self.end_headers()
+            self.wfile.write(png_bytes)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ImageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        data_uri = "data:image/png;base64," + base64.b64encode(png_bytes).decode()
+        raw_html = (
+            "<html><body><h1>Images</h1>"
+            + "".join(f"<img src='/img{i % 10}.png'>" for i in range(30))
+            + f"<img src='{data_uri}'><img src='{data_uri}'>"
+            + "</body></html>"
+        ).encode()
+
+        options = HTMLBackendOptions(
+            enable_remote_fetch=True, fetch_images=True, source_uri=f"{base}/doc.html"
+        )
+        html_backend._get_image_store().clear()  # type: ignore[union-attr]
+        for _ in range(2):
+            in_doc = InputDocument(
+                path_or_stream=BytesIO(raw_html),
+                format=InputFormat.HTML,
+                backend=HTMLDocumentBackend,
+                filename="images.html",
+                backend_options=options,
+            )
+            backend = HTMLDocumentBackend(
+                in_doc=in_doc, path_or_stream=BytesIO(raw_html), options=options
+            )
+            doc = backend.convert()
+            assert len(doc.pictures) == 32
+            for picture in doc.pictures:
+                assert picture.image is not None
+                assert picture.image.size.width == 8
+            assert len({id(picture.image) for picture in doc.pictures}) == 32
+
+        # Each distinct URL is only fetched once, for both documents
+        assert sorted(requested) == [f"/img{i}.png" for i in range(10)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_images_from_many_hosts():
+    """Test that one bounded client with a timeout fetches images of all hosts."""
+
+    png = BytesIO()
+    Image.new("RGB", (8, 8), "red").save(png, "PNG")
+    clients: set[int] = set()
+    timeouts: set[float] = set()
+
+    def _get(client, url, **kwargs):
+        clients.add(id(client))
+        timeouts.add(kwargs["timeout"])
+        if "slow" in url:
+            raise requests.Timeout("read timed out")
+        response = Mock()
+        response.content = png.getvalue()
+        return response
+
+    raw_html = (
+        "<html><body>"
+        + "".join(f"<img src='https://host{i}.example.com/a.png'>" for i in range(20))
+        + "<img src='https://slow.example.com/a.png'>"
+        + "</body></html>"
+    ).encode()
+    options = HTMLBackendOptions(
+        enable_remote_fetch=True,
+        fetch_images=True,
+        image_fetch_timeout=3.5,
+        source_uri="https://example.com/doc.html",
+    )
+    shared_clients = dict(api_client._clients)
+    html_backend._get_image_store().clear()  # type: ignore[union-attr]
+    with (
+        patch(
+            "docling.utils.api_client.ApiClient.get", autospec=True, side_effect=_get
+        ),
+        pytest.warns(match="read timed out"),
+    ):
+        in_doc = InputDocument(
+            path_or_stream=BytesIO(raw_html),
+            format=InputFormat.HTML,
+            backend=HTMLDocumentBackend,
+            filename="hosts.html",
+            backend_options=options,
+        )
+        backend = HTMLDocumentBackend(
+            in_doc=in_doc, path_or_stream=BytesIO(raw_html), options=options
+        )
+        doc = backend.convert()
+
+    # The image that timed out is kept as a picture without image
+    assert len(doc.pictures) == 21
+    assert sum(picture.image is not None for picture in doc.pictures) == 20
+    assert clients == {id(html_backend._get_image_client(8))}
+    assert timeouts == {3.5}
+    # No client is left behind per image host
+    assert api_client._clients == shared_clients
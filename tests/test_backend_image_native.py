@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 
@@ -216,3 +217,25 @@ def test_multipage_access():
         size = page_backend.get_size()
         assert size.width == 64
         assert size.height == 64
+
+
+def test_multipage_concurrent_access():
+    """Test decoding the frames of a multi-page image lazily from several threads."""
+    num_pages = 8
+    stream = _make_multipage_tiff_stream(num_pages=num_pages, size=(64, 64))
+    doc_backend = _get_backend_from_stream(stream)
+
+    def load_color(page_no: int):
+        page_backend = doc_backend.load_page(page_no)
+        image = page_backend.get_page_image()
+        page_backend.unload()
+        return image.getpixel((0, 0))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        colors = list(pool.map(load_color, list(range(num_pages)) * 4))
+
+    expected = [(i * 10 % 255, i * 20 % 255, i * 30 % 255) for i in range(num_pages)]
+    assert colors == expected * 4
+
+    doc_backend.unload()
+    assert doc_backend.page_count() == 0
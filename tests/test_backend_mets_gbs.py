@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -75,3 +76,24 @@ def test_num_pages(test_doc_path):
 
     # Explicitly clean up resources to prevent race conditions in CI
     doc_backend.unload()
+
+
+def test_load_pages_out_of_order(test_doc_path):
+    doc_backend: MetsGbsDocumentBackend = _get_backend(test_doc_path)
+
+    def load_text(page_index: int) -> str:
+        page_backend: MetsGbsPageBackend = doc_backend.load_page(page_index)
+        text = " ".join(cell.text for cell in page_backend.get_text_cells())
+        page_backend.unload()
+        return text
+
+    page_indices = list(range(doc_backend.page_count()))
+    texts = [load_text(page_index) for page_index in page_indices]
+    assert all(texts)
+
+    # Pages are loaded backwards and concurrently from the same archive
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        reversed_texts = list(pool.map(load_text, page_indices[::-1] * 3))
+    assert reversed_texts == texts[::-1] * 3
+
+    doc_backend.unload()
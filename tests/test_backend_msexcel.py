@@ -1,9 +1,10 @@
 import logging
+import sys
 from io import BytesIO
 from pathlib import Path
 
 import pytest
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 
 from docling.backend.msexcel_backend import MsExcelDocumentBackend
 from docling.datamodel.backend_options import MsExcelBackendOptions
@@ -312,3 +313,154 @@ def test_bytesio_stream():
     assert doc.pages.get(2).size.as_tuple() == (9.0, 18.0)
     assert doc.pages.get(3).size.as_tuple() == (13.0, 36.0)
     assert doc.pages.get(4).size.as_tuple() == (0.0, 0.0)
+
+
+def test_merged_cells():
+    """Test the table bounds and cell spans of tables with merged cells.
+
+    A merged header spans the columns of the table, a merged row label extends
+    the table down past its last labelled row, and an empty row separates the
+    two tables.
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws["B2"] = "Header"
+    ws.merge_cells("B2:D2")
+    for col, name in zip("BCD", ["Label", "Q1", "Q2"]):
+        ws[f"{col}3"] = name
+    ws["B4"] = "Group"
+    ws.merge_cells("B4:B6")
+    for row in range(4, 7):
+        ws[f"C{row}"] = row
+        ws[f"D{row}"] = row * 10
+    ws["B8"] = "Second"
+    ws["C8"] = 1.5
+    buf = BytesIO()
+    wb.save(buf)
+
+    in_doc = InputDocument(
+        path_or_stream=buf,
+        format=InputFormat.XLSX,
+        filename="merged.xlsx",
+        backend=MsExcelDocumentBackend,
+    )
+    backend = MsExcelDocumentBackend(in_doc=in_doc, path_or_stream=buf)
+    tables = backend._find_data_tables(backend.workbook.active)
+
+    assert [(t.anchor, t.num_rows, t.num_cols) for t in tables] == [
+        ((1, 1), 5, 3),
+        ((1, 7), 1, 2),
+    ]
+    cells = {(c.row, c.col): c for c in tables[0].data}
+    assert len(cells) == 1 + 3 + 1 + 3 * 2
+    assert (cells[(0, 0)].text, cells[(0, 0)].row_span, cells[(0, 0)].col_span) == (
+        "Header",
+        1,
+        3,
+    )
+    assert (cells[(2, 0)].text, cells[(2, 0)].row_span, cells[(2, 0)].col_span) == (
+        "Group",
+        3,
+        1,
+    )
+    assert cells[(4, 2)].text == "60"
+    assert [c.text for c in tables[1].data] == ["Second", "1.5"]
+
+
+def test_read_only() -> None:
+    """Test that streaming the workbooks in read-only mode gives the same documents."""
+    options = MsExcelBackendOptions(read_only=True)
+    read_only_converter = DocumentConverter(
+        allowed_formats=[InputFormat.XLSX],
+        format_options={InputFormat.XLSX: ExcelFormatOption(backend_options=options)},
+    )
+    converter = get_converter()
+    for excel_path in get_excel_paths():
+        doc = converter.convert(excel_path).document
+        read_only_doc = read_only_converter.convert(excel_path).document
+        assert read_only_doc.export_to_dict() == doc.export_to_dict(), (
+            f"Read-only conversion of {excel_path} differs"
+        )
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_sheet_names_and_cell_budget(read_only: bool):
+    """Test the sheet filter and the per-sheet cell budget."""
+    wb = Workbook()
+    first = wb.active
+    first.title = "First"
+    for row in range(1, 11):
+        first.append([f"a{row}", row, row * 2])
+    first.merge_cells("D1:D2")
+    first.merge_cells("D9:D10")
+    wb.create_sheet("Second").append(["other"])
+    buf = BytesIO()
+    wb.save(buf)
+
+    options = MsExcelBackendOptions(
+        read_only=read_only, sheet_names=["First"], max_cells_per_sheet=13
+    )
+    in_doc = InputDocument(
+        path_or_stream=buf,
+        format=InputFormat.XLSX,
+        filename="budget.xlsx",
+        backend=MsExcelDocumentBackend,
+        backend_options=options,
+    )
+    backend = MsExcelDocumentBackend(in_doc, buf, options)
+    assert backend.page_count() == 1
+
+    doc = backend.convert()
+    assert [group.name for group in doc.groups] == ["sheet: First"]
+    assert len(doc.tables) == 1
+    # The first 4 rows fit the budget, the merged range of rows 9-10 is skipped
+    assert doc.tables[0].data.num_rows == 4
+    assert doc.tables[0].data.num_cols == 4
+    backend.unload()
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_sheet_names_page_numbers(read_only: bool):
+    """Test that the selected sheets are numbered as the pages they count for."""
+    wb = Workbook()
+    wb.active.title = "First"
+    wb.active.append(["first", 1])
+    wb.create_sheet("Second").append(["second", 2])
+    wb.create_sheet("Third").append(["third", 3])
+    buf = BytesIO()
+    wb.save(buf)
+
+    options = MsExcelBackendOptions(read_only=read_only, sheet_names=["Third"])
+    in_doc = InputDocument(
+        path_or_stream=buf,
+        format=InputFormat.XLSX,
+        filename="sheets.xlsx",
+        backend=MsExcelDocumentBackend,
+        backend_options=options,
+    )
+    backend = MsExcelDocumentBackend(in_doc, buf, options)
+    assert backend.workbook.read_only == read_only
+    assert backend.page_count() == 1
+
+    doc = backend.convert()
+    assert list(doc.pages) == [1]
+    assert [prov.page_no for table in doc.tables for prov in table.prov] == [1]
+    backend.unload()
+
+
+def test_read_only_fallback(monkeypatch, caplog):
+    """Test that read-only mode falls back to full mode without openpyxl internals."""
+    excel_path = Path("./tests/data/xlsx/xlsx_01.xlsx")
+    expected = get_converter().convert(excel_path).document
+
+    # The worksheet parser used to stream the sheets is private to openpyxl
+    monkeypatch.setitem(sys.modules, "openpyxl.worksheet._reader", None)
+    options = MsExcelBackendOptions(read_only=True)
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.XLSX],
+        format_options={InputFormat.XLSX: ExcelFormatOption(backend_options=options)},
+    )
+    with caplog.at_level(logging.WARNING):
+        doc = converter.convert(excel_path).document
+    assert "loading the workbook in full mode" in caplog.text
+    assert doc.export_to_dict() == expected.export_to_dict()
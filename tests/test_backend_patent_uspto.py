@@ -2,6 +2,7 @@
 
 import logging
 import os
+from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -464,3 +465,48 @@ def test_patent_uspto_grant_aps(patents):
     assert len(doc.tables) == 0
     for item in texts:
         assert "##STR1##" not in item.text
+
+
+def test_patent_uspto_bulk(patents):
+    """Test splitting a bulk file into its patents."""
+    file_names = ["ipg08672134.xml", "pg06442728.xml", "pa20010031492.xml"]
+    content = b"".join(
+        (DATA_PATH / name).read_bytes().rstrip(b"\n") + b"\n" for name in file_names
+    )
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(content),
+        format=InputFormat.XML_USPTO,
+        backend=PatentUsptoDocumentBackend,
+        filename="bulk.xml",
+    )
+    backend = PatentUsptoDocumentBackend(in_doc=in_doc, path_or_stream=BytesIO(content))
+    assert backend.is_valid()
+    with pytest.raises(
+        RuntimeError, match=r"several patents.*PatentUsptoDocumentBackend\("
+    ):
+        backend.convert()
+
+    docs = list(backend.convert_all())
+    assert [doc.name for doc in docs] == ["bulk_0", "bulk_1", "bulk_2"]
+    for name, doc in zip(file_names, docs):
+        expected = next(item[1] for item in patents if item[0].name == name)
+        assert doc.origin.filename == "bulk.xml"
+        assert doc.export_to_dict()["texts"] == expected.export_to_dict()["texts"]
+        assert doc.tables == expected.tables
+    backend.unload()
+
+
+def test_patent_uspto_grant_aps_stream(patents):
+    """Test parsing an APS file with CRLF line endings from a stream."""
+    file_name = "pftaps057006474.txt"
+    content = (DATA_PATH / file_name).read_bytes()
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(content),
+        format=InputFormat.XML_USPTO,
+        backend=PatentUsptoDocumentBackend,
+        filename=file_name,
+    )
+    backend = PatentUsptoDocumentBackend(in_doc=in_doc, path_or_stream=BytesIO(content))
+    doc = backend.convert()
+    expected = next(item[1] for item in patents if item[0].name == file_name)
+    assert doc.export_to_dict() == expected.export_to_dict()
@@ -1,16 +1,23 @@
+from io import BytesIO
 from pathlib import Path
 
 import pytest
-from docling_core.types.doc import BoundingBox
+from docling_core.types.doc import BoundingBox, CoordOrigin
 
 from docling.backend.pypdfium2_backend import (
     PyPdfiumDocumentBackend,
     PyPdfiumPageBackend,
 )
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.backend_options import PdfBackendOptions
+from docling.datamodel.base_models import InputFormat, Page
 from docling.datamodel.document import InputDocument
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.utils import pdfium_render_pool
 
 
 @pytest.fixture
@@ -91,6 +98,129 @@ def test_crop_page_image(test_doc_path):
     # im.show()
 
 
+def test_render_workers_page_image():
+    pdf_doc = Path("./tests/data/pdf/redp5110_sampled.pdf")
+    cropbox = BoundingBox(l=50, t=100, r=400, b=500, coord_origin=CoordOrigin.TOPLEFT)
+
+    images = []
+    for render_workers in [0, 2]:
+        in_doc = InputDocument(
+            path_or_stream=pdf_doc,
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+            backend_options=PdfBackendOptions(render_workers=render_workers),
+        )
+        page_backend = in_doc._backend.load_page(1)
+        images.append(
+            (
+                page_backend.get_page_image(scale=2),
+                page_backend.get_page_image(scale=2, cropbox=cropbox),
+            )
+        )
+        page_backend.unload()
+        in_doc._backend.unload()
+
+    (full_local, crop_local), (full_pool, crop_pool) = images
+    assert full_local.tobytes() == full_pool.tobytes()
+    assert crop_local.tobytes() == crop_pool.tobytes()
+
+
+def _open_render_documents() -> list[tuple[str, str]]:
+    """Documents held open by a render worker process."""
+    return list(pdfium_render_pool._worker_docs)
+
+
+def test_render_workers_release_documents():
+    pdf_doc = Path("./tests/data/pdf/redp5110_sampled.pdf")
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(pdf_doc.read_bytes()),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+        filename=pdf_doc.name,
+        backend_options=PdfBackendOptions(render_workers=2),
+    )
+    renderer = in_doc._backend._page_renderer
+    assert renderer is not None
+    tmp_path = renderer._path
+    for page_no in range(3):
+        page_backend = in_doc._backend.load_page(page_no)
+        page_backend.get_page_image(scale=1)
+        page_backend.unload()
+    pool = renderer._pool
+    assert any(pool._opened)
+
+    # The spilled file is closed by the workers before it is removed
+    in_doc._backend.unload()
+    assert not tmp_path.exists()
+    assert not any(pool._opened)
+    for worker in pool._workers:
+        documents = worker.submit(_open_render_documents).result()
+        assert (str(tmp_path), renderer._doc_key) not in documents
+
+
+def test_page_images_derived_from_largest_render():
+    pdf_doc = Path("./tests/data/pdf/redp5110_sampled.pdf")
+    cropbox = BoundingBox(l=50, t=100, r=400, b=500, coord_origin=CoordOrigin.TOPLEFT)
+    in_doc = InputDocument(
+        path_or_stream=pdf_doc,
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    page = Page(page_no=1)
+    page._backend = in_doc._backend.load_page(1)
+    page.size = page._backend.get_size()
+
+    page.get_image(scale=3.0)
+    full = page.get_image(scale=1.0)
+    crop = page.get_image(scale=2.0, cropbox=cropbox)
+    assert page._image_cache.scales() == [1.0, 3.0]
+
+    # Derived images have the size of native renderings
+    assert full is not None and crop is not None
+    assert full.size == page._backend.get_page_image(scale=1.0).size
+    assert crop.size == page._backend.get_page_image(scale=2.0, cropbox=cropbox).size
+
+    # Derived images are evicted first, the largest rendering is kept
+    page._image_cache.max_bytes = 1
+    page.get_image(scale=2.0)
+    assert page._image_cache.scales() == [3.0]
+
+    page._image_cache.max_bytes = None
+    page.get_image(scale=0.5)
+    page._image_cache.retain([0.5])
+    page._backend.unload()
+    page._backend = None
+    assert page._image_cache.scales() == [0.5]
+    assert page.get_image(scale=0.25) is not None
+    assert page.get_image(scale=1.0) is None
+
+    in_doc._backend.unload()
+
+
+def test_preprocessing_renders_layout_image_natively():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/pdf/redp5110_sampled.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    page = Page(page_no=1)
+    page._backend = in_doc._backend.load_page(1)
+    page.size = page._backend.get_size()
+    model = PagePreprocessingModel(
+        options=PagePreprocessingOptions(
+            images_scale=1.5, render_scale=3.0, skip_cell_extraction=True
+        )
+    )
+
+    page = model._populate_page_images(page)
+    assert page._image_cache.scales() == [1.0, 1.5, 3.0]
+    native = page._backend.get_page_image(scale=1.0)
+    assert page.get_image(scale=1.0).tobytes() == native.tobytes()
+
+    page._backend.unload()
+    in_doc._backend.unload()
+
+
 def test_num_pages(test_doc_path):
     doc_backend = _get_backend(test_doc_path)
     doc_backend.page_count() == 9
@@ -1,8 +1,9 @@
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
-from docling.cli.main import app
+from docling.cli.main import _scan_directory, _write_atomically, app
 
 runner = CliRunner()
 
@@ -27,6 +28,81 @@ def test_cli_convert(tmp_path):
     assert converted.exists()
 
 
+def test_cli_scan_directory(tmp_path):
+    (tmp_path / "b" / "c").mkdir(parents=True)
+    for name in [
+        "a.pdf",
+        "B.PDF",
+        "notes.Md",
+        "~$draft.docx",
+        "skip.txt",
+        "b/report.DocX",
+        "b/c/archive.tar.gz",
+    ]:
+        (tmp_path / name).write_bytes(b"")
+
+    found = list(_scan_directory(tmp_path, (".pdf", ".md", ".docx", ".tar.gz")))
+    assert [p.relative_to(tmp_path).as_posix() for p in found] == [
+        "B.PDF",
+        "a.pdf",
+        "notes.Md",
+        "b/report.DocX",
+        "b/c/archive.tar.gz",
+    ]
+
+
+def test_cli_convert_directory(tmp_path):
+    source = tmp_path / "in"
+    (source / "nested").mkdir(parents=True)
+    (source / "one.md").write_text("# One")
+    (source / "nested" / "two.md").write_text("# Two")
+    output = tmp_path / "out"
+    result = runner.invoke(app, [str(source), "--from", "md", "--output", str(output)])
+    assert result.exit_code == 0
+    assert (output / "one.md").exists()
+    assert (output / "two.md").exists()
+
+
+def test_cli_export_formats(tmp_path):
+    source = tmp_path / "doc.md"
+    source.write_text("# Title\n\nSome text.")
+    output = tmp_path / "out"
+    formats = ["json", "yaml", "html", "md", "text", "doctags"]
+    args = [str(source), "--output", str(output)]
+    for fmt in formats:
+        args += ["--to", fmt]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert sorted(p.name for p in output.iterdir()) == [
+        "doc.doctags",
+        "doc.html",
+        "doc.json",
+        "doc.md",
+        "doc.txt",
+        "doc.yaml",
+    ]
+
+
+def test_write_atomically(tmp_path):
+    fname = tmp_path / "out.md"
+    _write_atomically(fname, lambda path: path.write_text("done"))
+    assert fname.read_text() == "done"
+
+    def fail(path: Path):
+        path.write_text("partial")
+        raise RuntimeError("serialization failed")
+
+    with pytest.raises(RuntimeError):
+        _write_atomically(fname, fail)
+    assert fname.read_text() == "done"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.md"]
+
+
+def test_cli_missing_input(tmp_path):
+    result = runner.invoke(app, [str(tmp_path / "missing.pdf")])
+    assert result.exit_code == 1
+
+
 def test_cli_audio_auto_detection(tmp_path):
     """Test that CLI automatically detects audio files and sets ASR pipeline."""
     from docling.datamodel.base_models import FormatToExtensions, InputFormat
@@ -1,3 +1,4 @@
+import hashlib
 from io import BytesIO
 from pathlib import Path
 
@@ -15,6 +16,7 @@ from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.document import InputDocument, _DocumentConversionInput
 from docling.datamodel.settings import DocumentLimits
 from docling.document_converter import ImageFormatOption, PdfFormatOption
+from docling.utils.utils import create_file_hash
 
 
 def test_in_doc_from_valid_path():
@@ -280,3 +282,34 @@ def test_tiff_two_pages():
     assert page1_rect.l == page2_rect.l == 0
     assert page1_rect.r == page2_rect.r == 612.0
     assert page1_rect.b == page2_rect.b == 792.0
+
+
+def test_file_hash_methods(tmp_path):
+    test_doc_path = Path("./tests/data/pdf/2305.03393v1-pg9.pdf")
+    buf = BytesIO(test_doc_path.read_bytes())
+
+    # Files and streams hash the same, streams keep their position
+    sha256 = create_file_hash(test_doc_path, method="sha256")
+    assert create_file_hash(buf, method="sha256") == sha256
+    assert buf.tell() == 0
+    assert sha256 == hashlib.sha256(test_doc_path.read_bytes()).hexdigest()
+
+    empty_path = tmp_path / "empty.pdf"
+    empty_path.touch()
+    assert create_file_hash(empty_path) == hashlib.sha256(b"").hexdigest()
+
+    # size_mtime only identifies files, streams are still hashed
+    size_mtime = create_file_hash(test_doc_path, method="size_mtime")
+    assert size_mtime != sha256
+    assert create_file_hash(test_doc_path, method="size_mtime") == size_mtime
+    assert create_file_hash(buf, method="size_mtime") == sha256
+
+
+def test_guess_format_mets_gbs_stream():
+    mets_path = Path("./tests/data/mets_gbs/32044009881525_select.tar.gz")
+    dci = _DocumentConversionInput(path_or_stream_iterator=[])
+
+    assert dci._guess_format(mets_path) == InputFormat.METS_GBS
+    stream = DocumentStream(name=mets_path.name, stream=BytesIO(mets_path.read_bytes()))
+    assert dci._guess_format(stream) == InputFormat.METS_GBS
+    assert stream.stream.tell() == 0
@@ -0,0 +1,120 @@
+import random
+import time
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, Size
+from docling_core.types.doc.page import (
+    BoundingRectangle,
+    PdfPageBoundaryType,
+    PdfPageGeometry,
+    SegmentedPdfPage,
+    TextCell,
+)
+
+from docling.datamodel.base_models import Cluster, Page
+from docling.datamodel.pipeline_options import LayoutOptions
+from docling.utils.layout_postprocessor import LayoutPostprocessor
+
+
+def _make_page(num_cells: int, num_clusters: int, seed: int = 42):
+    rnd = random.Random(seed)
+    width, height = 612.0, 792.0
+
+    cells = []
+    for i in range(num_cells):
+        x = rnd.uniform(0, width - 20)
+        t = rnd.uniform(0, height - 8)
+        # Mostly small textline cells, with a few degenerate and empty ones
+        w = 0.0 if i % 97 == 0 else rnd.uniform(2, 60)
+        h = rnd.uniform(3, 8)
+        bbox = BoundingBox(l=x, t=t, r=x + w, b=t + h, coord_origin=CoordOrigin.TOPLEFT)
+        cells.append(
+            TextCell(
+                index=i,
+                rect=BoundingRectangle.from_bounding_box(bbox),
+                text="" if i % 53 == 0 else f"cell {i}",
+                orig=f"cell {i}",
+                from_ocr=False,
+            )
+        )
+
+    clusters = []
+    for i in range(num_clusters):
+        x = rnd.uniform(0, width - 50)
+        t = rnd.uniform(0, height - 20)
+        bbox = BoundingBox(
+            l=x,
+            t=t,
+            r=x + rnd.uniform(20, 300),
+            b=t + rnd.uniform(10, 200),
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        clusters.append(
+            Cluster(id=i, label=DocItemLabel.TEXT, bbox=bbox, confidence=0.9)
+        )
+
+    page_bbox = BoundingBox(
+        l=0.0, t=0.0, r=width, b=height, coord_origin=CoordOrigin.BOTTOMLEFT
+    )
+    dimension = PdfPageGeometry(
+        angle=0.0,
+        rect=BoundingRectangle.from_bounding_box(page_bbox),
+        boundary_type=PdfPageBoundaryType.CROP_BOX,
+        art_bbox=page_bbox,
+        bleed_bbox=page_bbox,
+        crop_bbox=page_bbox,
+        media_bbox=page_bbox,
+        trim_bbox=page_bbox,
+    )
+    parsed_page = SegmentedPdfPage(
+        dimension=dimension,
+        textline_cells=cells,
+        char_cells=[],
+        word_cells=[],
+        has_lines=True,
+    )
+    page = Page(page_no=0, size=Size(width=width, height=height))
+    page.parsed_page = parsed_page
+    return page, clusters
+
+
+def _reference_assignment(cells, clusters, min_overlap=0.2):
+    """Cell-by-cell scan, as the postprocessor did before vectorization."""
+    assignment = {}
+    for cell in cells:
+        if not cell.text.strip():
+            continue
+        best_overlap = min_overlap
+        best_cluster = None
+        for cluster in clusters:
+            if cell.rect.to_bounding_box().area() <= 0:
+                continue
+            overlap_ratio = cell.rect.to_bounding_box().intersection_over_self(
+                cluster.bbox
+            )
+            if overlap_ratio > best_overlap:
+                best_overlap = overlap_ratio
+                best_cluster = cluster
+        if best_cluster is not None:
+            assignment[cell.index] = best_cluster.id
+    return assignment
+
+
+def test_assign_cells_matches_reference():
+    page, clusters = _make_page(num_cells=2000, num_clusters=100)
+    processor = LayoutPostprocessor(page, clusters, LayoutOptions())
+
+    start = time.perf_counter()
+    expected = _reference_assignment(page.cells, clusters)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assigned = processor._assign_cells_to_clusters(clusters)
+    vectorized_time = time.perf_counter() - start
+
+    actual = {cell.index: cluster.id for cluster in assigned for cell in cluster.cells}
+    assert actual == expected
+
+    print(
+        f"cell assignment: reference {reference_time:.3f}s, "
+        f"vectorized {vectorized_time:.3f}s"
+    )
@@ -1,9 +1,11 @@
+import random
 from typing import Tuple
 
 import pytest
-from docling_core.types.doc import BoundingBox, CoordOrigin
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
 from docling_core.types.doc.page import BoundingRectangle
 
+from docling.utils.ocr_utils import _find_ocr_rects_raster, find_ocr_rects
 from docling.utils.orientation import rotate_bounding_box
 
 IM_SIZE = (4, 5)
@@ -78,3 +80,30 @@ def test_rotate_bounding_box(
     assert rotated == expected_rectangle
     expected_angle_360 = angle % 360
     assert rotated.angle_360 == expected_angle_360
+
+
+@pytest.mark.parametrize("num_rects", [0, 1, 2, 5, 20])
+def test_find_ocr_rects_matches_raster(num_rects: int):
+    rng = random.Random(num_rects)
+    size = Size(width=300.3, height=200.6)
+    for _ in range(10):
+        bitmap_rects = []
+        for _ in range(num_rects):
+            x0, y0 = rng.uniform(-20, 310), rng.uniform(-20, 210)
+            bitmap_rects.append(
+                BoundingBox(
+                    l=x0,
+                    t=y0,
+                    r=x0 + rng.uniform(0, 50),
+                    b=y0 + rng.uniform(0, 50),
+                    coord_origin=CoordOrigin.TOPLEFT,
+                )
+            )
+
+        coverage, ocr_rects = find_ocr_rects(size, iter(bitmap_rects))
+        raster_coverage, raster_ocr_rects = _find_ocr_rects_raster(size, bitmap_rects)
+
+        assert coverage == pytest.approx(raster_coverage)
+        assert [r.as_tuple() for r in ocr_rects] == [
+            r.as_tuple() for r in raster_ocr_rects
+        ]
@@ -1,11 +1,15 @@
 import os
+import time
 from pathlib import Path
 
 import pytest
 
+from docling.backend.csv_backend import CsvDocumentBackend
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
 from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.backend.html_backend import HTMLDocumentBackend
+from docling.backend.md_backend import MarkdownDocumentBackend
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
 from docling.datamodel.base_models import ConversionStatus, InputFormat, QualityGrade
@@ -14,8 +18,13 @@ from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     TableFormerMode,
 )
-from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.document_converter import (
+    DocumentConverter,
+    FormatOption,
+    PdfFormatOption,
+)
 from docling.pipeline.legacy_standard_pdf_pipeline import LegacyStandardPdfPipeline
+from docling.pipeline.simple_pipeline import SimplePipeline
 
 
 @pytest.fixture
@@ -198,3 +207,54 @@ def test_confidence(test_doc_path):
 
     assert doc_result.confidence.mean_grade == QualityGrade.EXCELLENT
     assert doc_result.confidence.low_grade == QualityGrade.EXCELLENT
+
+
+def test_pipeline_options_fingerprint():
+    pipeline_options = PdfPipelineOptions()
+    fingerprint = pipeline_options.fingerprint()
+    assert pipeline_options.fingerprint() == fingerprint
+    assert PdfPipelineOptions().fingerprint() == fingerprint
+
+    # In-place changes of nested options are detected
+    pipeline_options.ocr_options.lang = ["de"]
+    changed = pipeline_options.fingerprint()
+    assert changed != fingerprint
+    pipeline_options.accelerator_options.num_threads = 2
+    changed_again = pipeline_options.fingerprint()
+    assert changed_again != changed
+
+    # So are in-place changes of list fields
+    pipeline_options.ocr_options.lang.append("fr")
+    assert pipeline_options.fingerprint() != changed_again
+
+
+class _SlowPipeline(SimplePipeline):
+    instances = 0
+
+    def __init__(self, pipeline_options):
+        time.sleep(0.2)
+        type(self).instances += 1
+        super().__init__(pipeline_options)
+
+
+def test_warmup_builds_shared_pipelines_once():
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.MD, InputFormat.HTML, InputFormat.CSV],
+        format_options={
+            fmt: FormatOption(
+                pipeline_cls=_SlowPipeline, backend=backend, pipeline_options=None
+            )
+            for fmt, backend in [
+                (InputFormat.MD, MarkdownDocumentBackend),
+                (InputFormat.HTML, HTMLDocumentBackend),
+                (InputFormat.CSV, CsvDocumentBackend),
+            ]
+        },
+    )
+    converter.warmup()
+    assert _SlowPipeline.instances == 1
+    assert len(converter.initialized_pipelines) == 1
+
+    # Warm pipelines are reused by conversions
+    converter.convert(Path("tests/data/md/wiki.md"))
+    assert _SlowPipeline.instances == 1
@@ -0,0 +1,199 @@
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel
+from docling_core.types.doc.page import BoundingRectangle, TextCell
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.base_models import (
+    Cluster,
+    InputFormat,
+    LayoutPrediction,
+    Page,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import EasyOcrOptions, LayoutOptions
+from docling.models.base_model import BasePageModel
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.cached_page_model import (
+    CachedPageModel,
+    LayoutCacheAdapter,
+    OcrCacheAdapter,
+    model_fingerprint,
+    ocr_fingerprint,
+)
+from docling.utils.cache import PagePredictionCache
+
+
+class _CountingLayoutModel(BasePageModel):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, conv_res, page_batch):
+        for page in page_batch:
+            self.calls += 1
+            bbox = BoundingBox(l=10, t=10, r=200, b=100)
+            page.predictions.layout = LayoutPrediction(
+                clusters=[
+                    Cluster(
+                        id=0,
+                        label=DocItemLabel.TEXT,
+                        bbox=bbox,
+                        confidence=0.5,
+                        cells=page.cells[:3],
+                    )
+                ]
+            )
+            conv_res.confidence.pages[page.page_no].layout_score = 0.5
+            yield page
+
+
+class _CountingOcrModel(BaseOcrModel):
+    def __init__(self, enabled: bool = True):
+        super().__init__(
+            enabled=enabled,
+            artifacts_path=None,
+            options=EasyOcrOptions(),
+            accelerator_options=AcceleratorOptions(),
+        )
+        self.calls = 0
+
+    def __call__(self, conv_res, page_batch):
+        if not self.enabled:
+            yield from page_batch
+            return
+        for page in page_batch:
+            self.calls += 1
+            bbox = BoundingBox(l=0, t=0, r=5, b=5, coord_origin=CoordOrigin.TOPLEFT)
+            ocr_cell = TextCell(
+                index=0,
+                rect=BoundingRectangle.from_bounding_box(bbox),
+                text="ocr text",
+                orig="ocr text",
+                from_ocr=True,
+                confidence=0.9,
+            )
+            self.post_process_cells([ocr_cell], page)
+            yield page
+
+    @classmethod
+    def get_options_type(cls):
+        return EasyOcrOptions
+
+
+def _load_pages(path: Path):
+    in_doc = InputDocument(
+        path_or_stream=path, format=InputFormat.PDF, backend=PyPdfiumDocumentBackend
+    )
+    conv_res = ConversionResult(input=in_doc)
+    pages = []
+    for page_no in range(in_doc.page_count):
+        page = Page(page_no=page_no)
+        page._backend = in_doc._backend.load_page(page_no)
+        page.size = page._backend.get_size()
+        page.parsed_page = page._backend.get_segmented_page()
+        pages.append(page)
+    return conv_res, pages
+
+
+def test_cached_models_skip_known_pages(tmp_path):
+    cache = PagePredictionCache(cache_dir=tmp_path)
+    ocr_model = _CountingOcrModel()
+    layout_model = _CountingLayoutModel()
+    cached_ocr = CachedPageModel(
+        ocr_model,
+        cache=cache,
+        adapter=OcrCacheAdapter(ocr_model),
+        fingerprint=model_fingerprint(ocr_model, ocr_model.options),
+    )
+    cached_layout = CachedPageModel(
+        layout_model,
+        cache=cache,
+        adapter=LayoutCacheAdapter(),
+        fingerprint=model_fingerprint(layout_model, LayoutOptions()),
+    )
+
+    source = Path("tests/data/pdf/2305.03393v1-pg9.pdf")
+    conv_res, pages = _load_pages(source)
+    pages = list(cached_layout(conv_res, cached_ocr(conv_res, pages)))
+    assert (ocr_model.calls, layout_model.calls) == (1, 1)
+
+    # A second conversion of the same content only reads the cache
+    conv_res_2, pages_2 = _load_pages(source)
+    pages_2 = list(cached_layout(conv_res_2, cached_ocr(conv_res_2, pages_2)))
+    assert (ocr_model.calls, layout_model.calls) == (1, 1)
+    assert cache.stats().hits == 2
+
+    for page, page_2 in zip(pages, pages_2):
+        assert page_2.cells == page.cells
+        assert page_2.predictions.layout == page.predictions.layout
+        assert (
+            conv_res_2.confidence.pages[page.page_no].layout_score
+            == conv_res.confidence.pages[page.page_no].layout_score
+        )
+
+    # Other model options are other cache entries
+    other_layout = CachedPageModel(
+        layout_model,
+        cache=cache,
+        adapter=LayoutCacheAdapter(),
+        fingerprint=model_fingerprint(
+            layout_model, LayoutOptions(keep_empty_clusters=True)
+        ),
+    )
+    conv_res_3, pages_3 = _load_pages(source)
+    list(other_layout(conv_res_3, pages_3))
+    assert layout_model.calls == 2
+
+
+def test_layout_cache_depends_on_ocr(tmp_path):
+    cache = PagePredictionCache(cache_dir=tmp_path)
+    layout_model = _CountingLayoutModel()
+    source = Path("tests/data/pdf/2305.03393v1-pg9.pdf")
+
+    def convert(ocr_model: _CountingOcrModel):
+        ocr_key = ocr_fingerprint(ocr_model, ocr_model.options)
+        cached_layout = CachedPageModel(
+            layout_model,
+            cache=cache,
+            adapter=LayoutCacheAdapter(),
+            fingerprint=model_fingerprint(
+                layout_model, LayoutOptions(), upstream=[ocr_key]
+            ),
+        )
+        conv_res, pages = _load_pages(source)
+        if ocr_model.enabled:
+            ocr_model = CachedPageModel(
+                ocr_model,
+                cache=cache,
+                adapter=OcrCacheAdapter(ocr_model),
+                fingerprint=ocr_key,
+            )
+        return list(cached_layout(conv_res, ocr_model(conv_res, pages)))
+
+    pages = convert(_CountingOcrModel())
+    assert layout_model.calls == 1
+    assert any(cell.from_ocr for page in pages for cell in page.cells)
+
+    # Without OCR the layout runs again, and no OCR cells of the first run
+    # are restored from the cache
+    pages = convert(_CountingOcrModel(enabled=False))
+    assert layout_model.calls == 2
+    assert not any(cell.from_ocr for page in pages for cell in page.cells)
+
+    # Both runs are cached separately
+    pages = convert(_CountingOcrModel())
+    assert layout_model.calls == 2
+    assert any(cell.from_ocr for page in pages for cell in page.cells)
+    pages = convert(_CountingOcrModel(enabled=False))
+    assert layout_model.calls == 2
+    assert not any(cell.from_ocr for page in pages for cell in page.cells)
+
+    # Table entries follow the layout fingerprint in the same way
+    layout_key = model_fingerprint(layout_model, LayoutOptions())
+    other_layout_key = model_fingerprint(
+        layout_model, LayoutOptions(keep_empty_clusters=True)
+    )
+    assert model_fingerprint(
+        object(), None, upstream=[layout_key]
+    ) != model_fingerprint(object(), None, upstream=[other_layout_key])
@@ -0,0 +1,95 @@
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from docling.backend.md_backend import MarkdownDocumentBackend
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter, MarkdownFormatOption
+
+
+@pytest.fixture
+def process_executor():
+    perf = settings.perf.model_copy()
+    settings.perf.doc_batch_executor = "process"
+    settings.perf.doc_batch_concurrency = 2
+    settings.perf.doc_batch_size = 4
+    yield
+    settings.perf = perf
+
+
+def _sources():
+    return [
+        Path("tests/data/md/wiki.md"),
+        Path("tests/data/html/example_01.html"),
+        DocumentStream(name="input.xyz", stream=BytesIO(b"xyz")),
+        DocumentStream(
+            name="stream.md", stream=BytesIO(b"# Title\n\nSome *markdown* text.\n")
+        ),
+        Path("tests/data/html/table_01.html"),
+    ]
+
+
+def test_convert_all_in_processes(process_executor):
+    converter = DocumentConverter()
+    try:
+        results = list(converter.convert_all(_sources(), raises_on_error=False))
+    finally:
+        converter.shutdown()
+
+    assert [r.input_index for r in results] == list(range(5))
+    assert [r.input.file.name for r in results] == [
+        "wiki.md",
+        "example_01.html",
+        "input.xyz",
+        "stream.md",
+        "table_01.html",
+    ]
+    # The unsupported input is contained to its own result
+    assert results[2].status == ConversionStatus.SKIPPED
+    for i in (0, 1, 3, 4):
+        assert results[i].status == ConversionStatus.SUCCESS
+
+    settings.perf.doc_batch_executor = "thread"
+    expected = list(DocumentConverter().convert_all(_sources(), raises_on_error=False))
+    for res, exp in zip(results, expected):
+        assert res.status == exp.status
+        if res.status == ConversionStatus.SUCCESS:
+            assert (
+                res.document.export_to_markdown() == exp.document.export_to_markdown()
+            )
+
+
+class _SlowMarkdownBackend(MarkdownDocumentBackend):
+    def convert(self):
+        if self.file.name == "slow.md":
+            time.sleep(1.0)
+        return super().convert()
+
+
+def test_convert_all_unordered():
+    perf = settings.perf.model_copy()
+    settings.perf.doc_batch_concurrency = 2
+    settings.perf.doc_batch_size = 2
+    try:
+        converter = DocumentConverter(
+            format_options={
+                InputFormat.MD: MarkdownFormatOption(backend=_SlowMarkdownBackend)
+            }
+        )
+        names = ["slow.md"] + [f"fast_{i}.md" for i in range(6)]
+        sources = [
+            DocumentStream(name=name, stream=BytesIO(b"# Title\n\nText.\n"))
+            for name in names
+        ]
+        results = list(converter.convert_all(sources, ordered=False))
+    finally:
+        settings.perf = perf
+
+    # The fast documents stream past the slow one on the other worker
+    assert results[-1].input.file.name == "slow.md"
+    assert sorted(r.input_index for r in results) == list(range(len(names)))
+    for res in results:
+        assert res.input.file.name == names[res.input_index]
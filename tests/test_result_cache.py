@@ -0,0 +1,107 @@
+from io import BytesIO
+from pathlib import Path
+
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
+from docling.document_converter import DocumentConverter, HTMLFormatOption
+from docling.utils.cache import ConversionResultCache, MemoryContentStore
+
+
+def _stream(name: str, content: bytes) -> DocumentStream:
+    return DocumentStream(name=name, stream=BytesIO(content))
+
+
+def test_result_cache_hit(tmp_path: Path):
+    cache = ConversionResultCache(cache_dir=tmp_path)
+    converter = DocumentConverter(result_cache=cache)
+
+    source = Path("tests/data/html/example_01.html")
+    first = converter.convert(source)
+    assert cache.stats().misses == 1
+    assert cache.stats().stores == 1
+
+    second = converter.convert(source)
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.entries == 1
+    assert second.status == ConversionStatus.SUCCESS
+    assert second.document.export_to_dict() == first.document.export_to_dict()
+
+    # Same content under another name
+    renamed = converter.convert(_stream("renamed.html", source.read_bytes()))
+    assert cache.stats().hits == 2
+    assert renamed.document.name == "renamed"
+    assert renamed.document.origin.filename == "renamed.html"
+
+
+def test_result_cache_key_includes_options(tmp_path: Path):
+    cache = ConversionResultCache(cache_dir=tmp_path)
+    source = Path("tests/data/html/example_01.html")
+
+    DocumentConverter(result_cache=cache).convert(source)
+    DocumentConverter(
+        result_cache=cache,
+        format_options={InputFormat.HTML: HTMLFormatOption(backend_options=None)},
+    ).convert(source)
+    assert cache.stats().hits == 1
+
+    converter = DocumentConverter(result_cache=cache)
+    converter.convert(source, page_range=(1, 10))
+    assert cache.stats().misses == 2
+
+
+def test_result_cache_eviction(tmp_path: Path):
+    cache = ConversionResultCache(cache_dir=tmp_path, max_size_bytes=1)
+    converter = DocumentConverter(result_cache=cache)
+
+    for i in range(3):
+        converter.convert(_stream(f"doc_{i}.md", f"# Document {i}\n".encode()))
+
+    stats = cache.stats()
+    assert stats.stores == 3
+    assert stats.evictions == 3
+    assert stats.entries == 0
+
+
+def test_memory_content_store():
+    store = MemoryContentStore(max_size_bytes=10)
+    assert store.lookup("a") is None
+
+    # Identical content from two sources is stored once
+    store.store("a", b"12345")
+    store.store("b", b"12345")
+    assert store.lookup("a") == store.lookup("b") == b"12345"
+    assert store.stats().entries == 1
+    assert store.stats().size_bytes == 5
+
+    # The least recently used content is evicted, with all its sources
+    store.store("c", b"abcde")
+    store.lookup("a")
+    store.store("d", b"vwxyz")
+    assert store.lookup("c") is None
+    assert store.lookup("a") == store.lookup("b") == b"12345"
+    assert store.lookup("d") == b"vwxyz"
+    stats = store.stats()
+    assert stats.evictions == 1
+    assert stats.size_bytes == 10
+
+    # Content larger than the store is not kept
+    store.store("e", b"0123456789a")
+    assert store.lookup("e") is None
+
+    # Replaced content is dropped once no source points to it
+    store.clear()
+    store.store("a", b"1234")
+    store.store("b", b"1234")
+    store.store("a", b"5678")
+    assert store.stats().entries == 2
+    store.store("b", b"5678")
+    assert store.stats().entries == 1
+    assert store.stats().size_bytes == 4
+    store.store("b", b"abcd")
+    assert store.lookup("a") == b"5678"
+    assert store.lookup("b") == b"abcd"
+
+    # A source replaced by content too large to keep is dropped too
+    store.store("a", b"0123456789a")
+    assert store.lookup("a") is None
+    assert store.stats().size_bytes == 4
@@ -0,0 +1,178 @@
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+from docling_core.types.doc import BoundingBox, CoordOrigin
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import TesseractCliOcrOptions
+from docling.models.tesseract_ocr_cli_model import TesseractOcrCliModel
+
+TSV_HEADER = (
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num"
+    "\tleft\ttop\twidth\theight\tconf\ttext\n"
+)
+
+OCR_RECTS = [
+    BoundingBox(l=100, t=200, r=300, b=260, coord_origin=CoordOrigin.TOPLEFT),
+    BoundingBox(l=50, t=400, r=250, b=450, coord_origin=CoordOrigin.TOPLEFT),
+    BoundingBox(l=300, t=500, r=500, b=560, coord_origin=CoordOrigin.TOPLEFT),
+]
+
+
+def _word_box(k: int) -> tuple[int, int, int, int]:
+    """Left, top, width and height of the k-th word of a canned image."""
+    return 30 * k, 60 + k, 30, 15
+
+
+def _tsv_rows(page_num: int, name: str) -> str:
+    """Rows of one image: a page row without text, an empty word, two words."""
+    rows = [f"1\t{page_num}\t0\t0\t0\t0\t0\t0\t600\t180\t-1\t\n"]
+    rows.append(f"5\t{page_num}\t1\t1\t1\t1\t0\t0\t5\t5\t95\t \n")
+    for k in (1, 2):
+        left, top, width, height = _word_box(k)
+        rows.append(
+            f"5\t{page_num}\t1\t1\t1\t{k + 1}\t{left}\t{top}\t{width}\t{height}"
+            f"\t9{k}\t{name}w{k}\n"
+        )
+    return "".join(rows)
+
+
+class _FakeTesseract:
+    """Answers the tesseract commands with canned TSV and OSD outputs."""
+
+    def __init__(self, failing: tuple[str, ...] = (), osd_failing=()):
+        self.failing = failing
+        self.osd_failing = osd_failing
+        self.inputs: list[str] = []
+
+    def __call__(self, cmd, **kwargs):
+        if "osd" in cmd:
+            ifilename = cmd[cmd.index("osd") + 1]
+            if Path(ifilename).stem in self.osd_failing:
+                raise subprocess.CalledProcessError(1, cmd, stderr=b"osd failed")
+            stdout = "Orientation in degrees: 0\nScript: Latin\n"
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout.encode())
+
+        ifilename = cmd[-3]
+        if ifilename.endswith(".txt"):
+            with open(ifilename, encoding="utf-8") as list_file:
+                images = list_file.read().splitlines()
+        else:
+            images = [ifilename]
+        self.inputs.append(ifilename)
+        names = [Path(image).stem for image in images]
+        if any(name in self.failing for name in names):
+            raise subprocess.CalledProcessError(1, cmd, stderr=b"ocr failed")
+        stdout = TSV_HEADER + "".join(
+            _tsv_rows(page_num, f"r{name}")
+            for page_num, name in enumerate(names, start=1)
+        )
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout.encode())
+
+
+def _get_model(**options) -> TesseractOcrCliModel:
+    # Disabled, so the tesseract binary is not queried on init
+    return TesseractOcrCliModel(
+        enabled=False,
+        artifacts_path=None,
+        options=TesseractCliOcrOptions(**options),
+        accelerator_options=AcceleratorOptions(),
+    )
+
+
+@pytest.fixture
+def page_and_result():
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    page = Page(page_no=0)
+    page._backend = in_doc._backend.load_page(0)
+    page.size = page._backend.get_size()
+    yield page, ConversionResult(input=in_doc)
+    page._backend.unload()
+    in_doc._backend.unload()
+
+
+def _check_cells(model, cells, rect_ids):
+    assert [cell.text for cell in cells] == [
+        f"r{i}w{k}" for i in rect_ids for k in (1, 2)
+    ]
+    for cell, (i, k) in zip(cells, [(i, k) for i in rect_ids for k in (1, 2)]):
+        # Rows are indexed per image, after the page row and the empty word
+        assert cell.index == k + 1
+        assert cell.from_ocr
+        assert cell.confidence == pytest.approx((90 + k) / 100)
+        left, top, width, height = _word_box(k)
+        bbox = cell.rect.to_bounding_box()
+        assert bbox.l == pytest.approx(OCR_RECTS[i].l + left / model.scale)
+        assert bbox.t == pytest.approx(OCR_RECTS[i].t + top / model.scale)
+        assert bbox.r == pytest.approx(OCR_RECTS[i].l + (left + width) / model.scale)
+        assert bbox.b == pytest.approx(OCR_RECTS[i].t + (top + height) / model.scale)
+
+
+def test_run_tesseract_splits_pages(tmp_path, monkeypatch):
+    model = _get_model()
+    fake = _FakeTesseract()
+    monkeypatch.setattr(subprocess, "run", fake)
+    list_fname = tmp_path / "images.txt"
+    list_fname.write_text("".join(f"{tmp_path / str(i)}.png\n" for i in range(3)))
+
+    df_result = model._run_tesseract(str(list_fname), "eng")
+
+    # Rows without text are dropped, the index restarts with every image
+    assert df_result["page_num"].tolist() == [1, 1, 2, 2, 3, 3]
+    assert df_result.index.tolist() == [2, 3] * 3
+    assert df_result["text"].tolist() == [f"r{i}w{k}" for i in range(3) for k in (1, 2)]
+
+
+def test_ocr_page_batches_rects(page_and_result, monkeypatch):
+    page, conv_res = page_and_result
+    model = _get_model(max_workers=1, detect_orientation=False)
+    fake = _FakeTesseract()
+    monkeypatch.setattr(subprocess, "run", fake)
+
+    cells = model._ocr_page(conv_res, page, 0, OCR_RECTS)
+
+    # A single tesseract process reads the list of all rectangle images
+    assert len(fake.inputs) == 1
+    assert fake.inputs[0].endswith(".txt")
+    _check_cells(model, cells, [0, 1, 2])
+
+
+def test_ocr_page_falls_back_per_rect(page_and_result, monkeypatch):
+    page, conv_res = page_and_result
+    model = _get_model(max_workers=1, detect_orientation=False)
+    fake = _FakeTesseract(failing=("1",))
+    monkeypatch.setattr(subprocess, "run", fake)
+
+    cells = model._ocr_page(conv_res, page, 0, OCR_RECTS)
+
+    # The failed batch is retried per rectangle, only the failing one is lost
+    assert [os.path.basename(name) for name in fake.inputs] == [
+        "0.png.txt",
+        "0.png",
+        "1.png",
+        "2.png",
+    ]
+    _check_cells(model, cells, [0, 2])
+
+
+def test_ocr_page_osd_failure(page_and_result, monkeypatch):
+    page, conv_res = page_and_result
+    model = _get_model(max_workers=2, detect_orientation=True)
+    fake = _FakeTesseract(osd_failing=("0",))
+    monkeypatch.setattr(subprocess, "run", fake)
+
+    cells = model._ocr_page(conv_res, page, 0, OCR_RECTS)
+
+    # Rectangles are split over two processes, and a failed orientation
+    # detection does not prevent the recognition of its rectangle
+    assert len(fake.inputs) == 2
+    _check_cells(model, cells, [0, 1, 2])
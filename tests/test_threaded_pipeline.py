@@ -1,19 +1,31 @@
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import pytest
 
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, InputFormat
-from docling.datamodel.document import ConversionResult
+from docling.datamodel.base_models import ConversionStatus, InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     ThreadedPdfPipelineOptions,
 )
 from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.models.base_model import BasePageModel
+from docling.models.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.pipeline.standard_pdf_pipeline import (
+    StandardPdfPipeline,
+    ThreadedItem,
+    ThreadedPipelineStage,
+    ThreadedQueue,
+)
 from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
 
 
@@ -193,6 +205,257 @@ def test_pypdfium_threaded_pipeline():
     print("All done!")
 
 
+@pytest.mark.parametrize("cross_document_batching", [False, True])
+def test_persistent_stages_multiple_documents(cross_document_batching: bool):
+    """Concurrent documents multiplexed through one set of long-lived stages"""
+    test_files = [
+        "tests/data/pdf/2203.01017v2.pdf",
+        "tests/data/pdf/2206.01062.pdf",
+        "tests/data/pdf/2305.03393v1.pdf",
+    ]
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=StandardPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(
+                    do_table_structure=False,
+                    do_ocr=False,
+                    persistent_stages=True,
+                    cross_document_batching=cross_document_batching,
+                ),
+            )
+        }
+    )
+    converter.initialize_pipeline(InputFormat.PDF)
+
+    with ThreadPoolExecutor(max_workers=len(test_files)) as pool:
+        results = list(pool.map(converter.convert, test_files))
+
+    for test_file, result in zip(test_files, results):
+        assert result.status == ConversionStatus.SUCCESS
+        assert result.input.file.name == Path(test_file).name
+        assert len(result.pages) == result.input.page_count
+
+    # Stages survive across documents and can be shut down explicitly
+    for pipeline in converter.initialized_pipelines.values():
+        assert isinstance(pipeline, StandardPdfPipeline)
+        pipeline.shutdown()
+
+
+class _SlowLayoutModel:
+    """Layout stand-in which records whether a call is running."""
+
+    def __init__(self):
+        self.running = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, conv_res, page_batch):
+        for page in page_batch:
+            with self._lock:
+                self.running += 1
+                self.calls += 1
+            time.sleep(0.5)
+            # The document backend must still be open
+            assert conv_res.input._backend.is_valid()
+            with self._lock:
+                self.running -= 1
+            yield page
+
+
+class _FakeModelsPipeline(StandardPdfPipeline):
+    def _init_models(self) -> None:
+        self.keep_images = False
+        self.keep_backend = False
+        self.ocr_model = lambda conv_res, pages: pages
+        self.layout_model = _SlowLayoutModel()
+        self.table_model = lambda conv_res, pages: pages
+        self.assemble_model = lambda conv_res, pages: pages
+        self.preprocessing_model = PagePreprocessingModel(
+            options=PagePreprocessingOptions(images_scale=1.0)
+        )
+
+
+class _RecordingPageModel(BasePageModel):
+    """Page model which records its batches and fails on one document."""
+
+    def __init__(self, failing: Optional[ConversionResult] = None):
+        self.failing = failing
+        self.calls: list[tuple[str, list[tuple[ConversionResult, int]]]] = []
+        self.produced: dict[int, ConversionResult] = {}
+
+    def _process(self, conv_res: ConversionResult, page: Page) -> Page:
+        if conv_res is self.failing:
+            raise RuntimeError("broken document")
+        processed = Page(page_no=page.page_no)
+        self.produced[id(processed)] = conv_res
+        return processed
+
+    def __call__(self, conv_res, page_batch):
+        pages = list(page_batch)
+        self.calls.append(("call", [(conv_res, p.page_no) for p in pages]))
+        return [self._process(conv_res, p) for p in pages]
+
+    def process_pages(self, batch):
+        self.calls.append(("process_pages", [(c, p.page_no) for c, p in batch]))
+        return [self._process(conv_res, page) for conv_res, page in batch]
+
+
+@pytest.mark.parametrize("failing_run", [None, 2])
+def test_cross_document_stage(failing_run: Optional[int]):
+    """Pages of several runs share a model call, and a failing run is isolated"""
+    conv_results = {
+        run_id: ConversionResult(
+            input=InputDocument(
+                path_or_stream=Path(f"tests/data/pdf/{name}"),
+                format=InputFormat.PDF,
+                backend=PyPdfiumDocumentBackend,
+            )
+        )
+        for run_id, name in [(1, "multi_page.pdf"), (2, "2305.03393v1-pg9.pdf")]
+    }
+    failing = conv_results[failing_run] if failing_run is not None else None
+    model = _RecordingPageModel(failing=failing)
+    stage = ThreadedPipelineStage(
+        name="layout",
+        model=model,
+        batch_size=8,
+        batch_timeout=0.1,
+        queue_max_size=8,
+        cross_document=True,
+    )
+    output_q = ThreadedQueue(8)
+    stage.add_output_queue(output_q)
+    # Queued before the stage starts, so that they form a single batch
+    for run_id, page_no in [(1, 0), (2, 0), (1, 1), (2, 1)]:
+        stage.input_queue.put(
+            ThreadedItem(
+                payload=Page(page_no=page_no),
+                run_id=run_id,
+                page_no=page_no,
+                conv_res=conv_results[run_id],
+            )
+        )
+    stage.input_queue.close()
+    stage.start()
+    assert stage._thread is not None
+    stage._thread.join(timeout=10)
+    items = output_q.get_batch(8, timeout=0)
+
+    # One call for the pages of both runs
+    kind, batch = model.calls[0]
+    assert kind == "process_pages"
+    assert {id(conv_res) for conv_res, _ in batch} == {
+        id(conv_res) for conv_res in conv_results.values()
+    }
+    assert len(items) == 4
+    if failing is None:
+        assert len(model.calls) == 1
+    else:
+        # Retried run by run, only the failing run loses its pages
+        assert [kind for kind, _ in model.calls[1:]] == ["call", "call"]
+    for item in items:
+        assert item.conv_res is conv_results[item.run_id]
+        if item.run_id == failing_run:
+            assert item.is_failed
+            assert str(item.error) == "broken document"
+        else:
+            assert not item.is_failed
+            # The page processed for this document came back to its run
+            assert item.payload is not None
+            assert model.produced[id(item.payload)] is item.conv_res
+            assert item.payload.page_no == item.page_no
+
+    for conv_res in conv_results.values():
+        conv_res.input._backend.unload()
+
+
+def test_page_render_scale():
+    """Only the image scales needed on every page are rendered up front"""
+    # Table images are only rendered for the pages with tables
+    pipeline = _FakeModelsPipeline(ThreadedPdfPipelineOptions(do_table_structure=True))
+    assert pipeline._page_render_scale() is None
+    pipeline = _FakeModelsPipeline(ThreadedPdfPipelineOptions(images_scale=2.0))
+    assert pipeline._page_render_scale() == 2.0
+    pipeline = _FakeModelsPipeline(
+        ThreadedPdfPipelineOptions(images_scale=2.0, render_page_images_once=False)
+    )
+    assert pipeline._page_render_scale() is None
+
+
+def test_persistent_stages_timeout_waits_for_running_batches():
+    """A timed-out run returns only once its pages left the shared stages"""
+    pipeline = _FakeModelsPipeline(
+        ThreadedPdfPipelineOptions(
+            persistent_stages=True,
+            document_timeout=0.2,
+            layout_batch_size=1,
+        )
+    )
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/multi_page.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    try:
+        pipeline._build_document(conv_res)
+        layout_model = pipeline.layout_model
+        assert layout_model.calls >= 1
+        assert layout_model.running == 0
+        assert conv_res.status == ConversionStatus.PARTIAL_SUCCESS
+        # Timed-out run ids are not kept once the run returned
+        assert pipeline._shared_ctx is not None
+        assert not pipeline._shared_ctx.timed_out_run_ids
+        in_doc._backend.unload()
+    finally:
+        pipeline.shutdown()
+
+
+def test_persistent_stages_convert_after_shutdown(monkeypatch):
+    """Runs on fresh stages are not ended by the dispatcher of shut down stages"""
+    pipeline = _FakeModelsPipeline(
+        ThreadedPdfPipelineOptions(persistent_stages=True, layout_batch_size=1)
+    )
+
+    def _convert() -> ConversionResult:
+        in_doc = InputDocument(
+            path_or_stream=Path("tests/data/pdf/multi_page.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+        conv_res = pipeline._build_document(ConversionResult(input=in_doc))
+        in_doc._backend.unload()
+        return conv_res
+
+    try:
+        assert _convert().status == ConversionStatus.SUCCESS
+        old_ctx = pipeline._shared_ctx
+        assert old_ctx is not None
+
+        # Shut down, but hold back the end of the old dispatcher until a
+        # conversion is running on the fresh stages.
+        close = ThreadedQueue.close
+        monkeypatch.setattr(
+            ThreadedQueue,
+            "close",
+            lambda q: None if q is old_ctx.output_queue else close(q),
+        )
+        pipeline.shutdown()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(_convert)
+            time.sleep(0.3)
+            assert pipeline._shared_ctx not in (None, old_ctx)
+            close(old_ctx.output_queue)
+            conv_res = future.result()
+
+        assert conv_res.status == ConversionStatus.SUCCESS
+        assert len(conv_res.pages) == conv_res.input.page_count
+        assert not conv_res.errors
+    finally:
+        pipeline.shutdown()
+
+
 if __name__ == "__main__":
     # Run basic performance test
     test_pipeline_comparison()